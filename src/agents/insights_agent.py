@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
 from ..analysis.network_analysis import NetworkAnalyzer
-from ..config.settings import Settings
+from ..config.settings import Settings, get_settings
 from ..database.neo4j_manager import Neo4jManager
 
 logger = logging.getLogger(__name__)
@@ -21,14 +21,16 @@ class InsightsAgent:
         Args:
             settings: Optional settings instance
         """
-        self.settings = settings or Settings()
+        self.settings = settings or get_settings()
         self.neo4j_manager = Neo4jManager(self.settings)
         self.network_analyzer = None
 
     async def __aenter__(self):
         """Async context manager entry."""
         await self.neo4j_manager.connect()
-        self.network_analyzer = NetworkAnalyzer(self.neo4j_manager)
+        self.network_analyzer = NetworkAnalyzer(
+            self.neo4j_manager, cache_dir=self.settings.centrality_cache_dir
+        )
         await self.network_analyzer.build_graph_from_neo4j()
         return self
 
@@ -39,7 +41,9 @@ class InsightsAgent:
     async def initialize(self):
         """Initialize the insights agent."""
         await self.neo4j_manager.connect()
-        self.network_analyzer = NetworkAnalyzer(self.neo4j_manager)
+        self.network_analyzer = NetworkAnalyzer(
+            self.neo4j_manager, cache_dir=self.settings.centrality_cache_dir
+        )
         await self.network_analyzer.build_graph_from_neo4j()
         logger.info("Insights agent initialized successfully")
 
@@ -279,11 +283,11 @@ class InsightsAgent:
                         "priority": 3
                     })
 
-            # 2. Similar skills
+            # 2. Similar skills, all looked up in one query
             if person.expertise_areas:
-                for skill in person.expertise_areas:
-                    skill_experts = await self.neo4j_manager.find_experts(skill, limit=3)
-                    for expert in skill_experts:
+                experts_by_skill = await self.neo4j_manager.find_experts_multi(person.expertise_areas)
+                for skill, skill_experts in experts_by_skill.items():
+                    for expert in skill_experts[:3]:
                         if expert.email not in connected_emails and len(recommendations) < limit:
                             recommendations.append({
                                 "person": expert,
@@ -340,7 +344,9 @@ class InsightsAgent:
     async def _ensure_network_loaded(self):
         """Ensure the network analyzer has current data."""
         if not self.network_analyzer:
-            self.network_analyzer = NetworkAnalyzer(self.neo4j_manager)
+            self.network_analyzer = NetworkAnalyzer(
+                self.neo4j_manager, cache_dir=self.settings.centrality_cache_dir
+            )
         await self.network_analyzer.build_graph_from_neo4j()
 
     async def _calculate_network_health(self) -> float:
@@ -2,11 +2,12 @@
 
 import asyncio
 import logging
+import re
 from typing import Any, Dict, Optional
 
 from ..analysis.export_manager import ExportManager
 from ..analysis.network_analysis import NetworkAnalyzer
-from ..config.settings import Settings
+from ..config.settings import Settings, get_settings
 from ..database.neo4j_manager import Neo4jManager
 from .tools import (WorkplaceTools, add_coworker_tool, export_data_tool,
                     find_experts_tool, get_network_insights_tool,
@@ -14,6 +15,49 @@ from .tools import (WorkplaceTools, add_coworker_tool, export_data_tool,
 
 logger = logging.getLogger(__name__)
 
+# Intent matching only looks at the head of a message, bounding the scan
+_MAX_CHAT_INPUT_LENGTH = 1000
+
+# Checked in order; the first intent whose phrases occur in the message wins
+_INTENT_PATTERNS = tuple(
+    (intent, re.compile("|".join(re.escape(phrase) for phrase in phrases), re.IGNORECASE))
+    for intent, phrases in (
+        ("add", ("add", "new coworker", "introduce")),
+        ("expert", ("expert", "who knows", "find someone")),
+        ("org_chart", ("org chart", "organization", "hierarchy")),
+        ("network", ("network", "connections", "influence")),
+        ("export", ("export", "download", "backup")),
+        ("help", ("help", "what can you do", "commands")),
+    )
+)
+
+_INTENT_RESPONSES = {
+    "add": ("👋 To add a new coworker, I need some information. Please use the command:\n"
+            "add_coworker with name, email, department, and role at minimum.\n"
+            "Example: add_coworker name='John Doe' email='john@company.com' department='Engineering' role='Senior Developer'"),
+    "expert": ("🔍 I can help you find experts! Please specify the skill or expertise area you're looking for.\n"
+               "Example: find_experts skill='Python' or who_should_i_ask topic='machine learning'"),
+    "org_chart": ("🏢 I can show you the organizational structure. Use:\n"
+                  "get_org_chart to see the overall structure, or\n"
+                  "get_org_chart department='Engineering' for a specific department"),
+    "network": ("📊 I can analyze network connections and influence. Use:\n"
+                "get_network_insights for overall network analysis, or\n"
+                "get_network_insights person='John Doe' for individual analysis, or\n"
+                "get_network_insights department='Engineering' for department analysis"),
+    "export": ("💾 I can export data in various formats. Use:\n"
+               "export_data format='csv' output_path='./my_export' to export data\n"
+               "Available formats: csv, json"),
+}
+
+_FALLBACK_RESPONSE = ("🤔 I'm not sure what you'd like me to do. Here are the main things I can help with:\n\n"
+                      "• **Add coworkers** - Introduce new team members to the network\n"
+                      "• **Find experts** - Locate people with specific skills or knowledge\n"
+                      "• **Get recommendations** - Find who to ask about topics\n"
+                      "• **Show org chart** - Display organizational structure\n"
+                      "• **Analyze networks** - Understand connections and influence\n"
+                      "• **Export data** - Download information in various formats\n\n"
+                      "Type 'help' for more detailed commands!")
+
 
 class SocialGraphAgent:
     """Main AI agent for workplace social graph management."""
@@ -24,12 +68,31 @@ class SocialGraphAgent:
         Args:
             settings: Optional settings instance
         """
-        self.settings = settings or Settings()
+        self.settings = settings or get_settings()
         self.neo4j_manager = Neo4jManager(self.settings)
         self.workplace_tools = WorkplaceTools(
             neo4j_manager=self.neo4j_manager
         )
 
+    @classmethod
+    def for_testing(cls, settings: Optional[Settings] = None) -> "SocialGraphAgent":
+        """Create an agent without its database manager or tools.
+
+        Callers assign ``neo4j_manager`` and ``workplace_tools`` themselves,
+        typically mocks, so no driver or tool state is built.
+
+        Args:
+            settings: Optional settings instance
+
+        Returns:
+            SocialGraphAgent: Agent with ``neo4j_manager`` and ``workplace_tools`` unset
+        """
+        agent = cls.__new__(cls)
+        agent.settings = settings or get_settings()
+        agent.neo4j_manager = None
+        agent.workplace_tools = None
+        return agent
+
     async def __aenter__(self):
         """Async context manager entry."""
         try:
@@ -44,6 +107,18 @@ class SocialGraphAgent:
         """Async context manager exit."""
         await self.neo4j_manager.close()
 
+    async def prewarm(self) -> None:
+        """Fetch and build the analysis graph ahead of the first query.
+
+        Only the async graph build runs here, so the task can be cancelled
+        promptly; centralities are computed by the commands that need them.
+        Failures are logged and ignored; commands build on demand instead.
+        """
+        try:
+            await self.workplace_tools._get_built_network_analyzer()
+        except Exception as e:
+            logger.warning(f"Graph prewarm skipped: {e}")
+
     async def initialize(self):
         """Initialize the agent and ensure database connectivity."""
         await self.neo4j_manager.connect()
@@ -100,13 +175,15 @@ class SocialGraphAgent:
                 return await self.workplace_tools.export_data(
                     format=kwargs.get("format", "csv"),
                     output_path=kwargs.get("output_path", "./export"),
-                    include_sensitive=kwargs.get("include_sensitive", False)
+                    include_sensitive=kwargs.get("include_sensitive", False),
+                    pretty=kwargs.get("pretty", False)
                 )
 
             elif command == "get_network_insights":
                 return await self.workplace_tools.get_network_insights(
                     person=kwargs.get("person"),
-                    department=kwargs.get("department")
+                    department=kwargs.get("department"),
+                    approximate=kwargs.get("approximate", False)
                 )
 
             else:
@@ -126,46 +203,15 @@ class SocialGraphAgent:
             str: Response from the agent
         """
         try:
-            message_lower = message.lower()
-
-            # Simple intent recognition (could be enhanced with more sophisticated NLP)
-            if any(phrase in message_lower for phrase in ["add", "new coworker", "introduce"]):
-                return ("👋 To add a new coworker, I need some information. Please use the command:\n"
-                       "add_coworker with name, email, department, and role at minimum.\n"
-                       "Example: add_coworker name='John Doe' email='john@company.com' department='Engineering' role='Senior Developer'")
-
-            elif any(phrase in message_lower for phrase in ["expert", "who knows", "find someone"]):
-                return ("🔍 I can help you find experts! Please specify the skill or expertise area you're looking for.\n"
-                       "Example: find_experts skill='Python' or who_should_i_ask topic='machine learning'")
-
-            elif any(phrase in message_lower for phrase in ["org chart", "organization", "hierarchy"]):
-                return ("🏢 I can show you the organizational structure. Use:\n"
-                       "get_org_chart to see the overall structure, or\n"
-                       "get_org_chart department='Engineering' for a specific department")
-
-            elif any(phrase in message_lower for phrase in ["network", "connections", "influence"]):
-                return ("📊 I can analyze network connections and influence. Use:\n"
-                       "get_network_insights for overall network analysis, or\n"
-                       "get_network_insights person='John Doe' for individual analysis, or\n"
-                       "get_network_insights department='Engineering' for department analysis")
-
-            elif any(phrase in message_lower for phrase in ["export", "download", "backup"]):
-                return ("💾 I can export data in various formats. Use:\n"
-                       "export_data format='csv' output_path='./my_export' to export data\n"
-                       "Available formats: csv, json")
-
-            elif any(phrase in message_lower for phrase in ["help", "what can you do", "commands"]):
-                return self._get_help_message()
+            message = message[:_MAX_CHAT_INPUT_LENGTH]
+            intent = next(
+                (name for name, pattern in _INTENT_PATTERNS if pattern.search(message)),
+                None,
+            )
 
-            else:
-                return ("🤔 I'm not sure what you'd like me to do. Here are the main things I can help with:\n\n"
-                       "• **Add coworkers** - Introduce new team members to the network\n"
-                       "• **Find experts** - Locate people with specific skills or knowledge\n"
-                       "• **Get recommendations** - Find who to ask about topics\n"
-                       "• **Show org chart** - Display organizational structure\n"
-                       "• **Analyze networks** - Understand connections and influence\n"
-                       "• **Export data** - Download information in various formats\n\n"
-                       "Type 'help' for more detailed commands!")
+            if intent == "help":
+                return self._get_help_message()
+            return _INTENT_RESPONSES.get(intent, _FALLBACK_RESPONSE)
 
         except Exception as e:
             logger.error(f"Error processing chat message: {e}")
@@ -215,8 +261,7 @@ Just tell me what you'd like to do in natural language, and I'll help guide you!
             relationships_count = await self.neo4j_manager.count_relationships()
 
             # Get network analyzer for more detailed stats
-            network_analyzer = await self.workplace_tools._get_network_analyzer()
-            await network_analyzer.build_graph_from_neo4j()
+            network_analyzer = await self.workplace_tools._get_built_network_analyzer()
 
             # Department distribution
             dept_stats = network_analyzer.analyze_department_connectivity()
@@ -1,10 +1,12 @@
 """Agent tools for workplace social graph operations."""
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from ..analysis import ExportManager, NetworkAnalyzer
+from ..analysis.network_analysis import APPROXIMATE_BETWEENNESS_SAMPLES
 from ..database import (CommunicationPreference, Interaction, InteractionType,
                         Neo4jManager, Person, WorkRelationship,
                         WorkRelationshipType, get_neo4j_manager)
@@ -24,6 +26,8 @@ class WorkplaceTools:
         self.neo4j_manager = neo4j_manager
         self.network_analyzer = None
         self.export_manager = None
+        self._graph_dirty = True
+        self._graph_lock = asyncio.Lock()
 
     async def _get_neo4j_manager(self) -> Neo4jManager:
         """Get Neo4j manager instance."""
@@ -35,9 +39,29 @@ class WorkplaceTools:
         """Get network analyzer instance."""
         if not self.network_analyzer:
             manager = await self._get_neo4j_manager()
-            self.network_analyzer = NetworkAnalyzer(manager)
+            self.network_analyzer = NetworkAnalyzer(
+                manager, cache_dir=manager.settings.centrality_cache_dir
+            )
         return self.network_analyzer
 
+    async def _get_built_network_analyzer(self) -> NetworkAnalyzer:
+        """Get a network analyzer whose graph reflects the latest writes.
+
+        The graph is rebuilt only when it has never been built or a write
+        since the last build marked it dirty, so long-lived sessions such as
+        interactive chat reuse it across commands.
+        """
+        analyzer = await self._get_network_analyzer()
+        async with self._graph_lock:
+            if self._graph_dirty or analyzer.graph is None:
+                await analyzer.build_graph_from_neo4j()
+                self._graph_dirty = False
+        return analyzer
+
+    def mark_graph_dirty(self) -> None:
+        """Force the next analysis to rebuild the graph from Neo4j."""
+        self._graph_dirty = True
+
     async def _get_export_manager(self) -> ExportManager:
         """Get export manager instance."""
         if not self.export_manager:
@@ -57,7 +81,7 @@ class WorkplaceTools:
                 phone=kwargs.get("phone"),
                 manager=kwargs.get("manager"),
                 expertise_areas=kwargs.get("expertise", []),
-                communication_preference=CommunicationPreference(kwargs.get("communication_preference")) if kwargs.get("communication_preference") else None,
+                communication_preference=CommunicationPreference.from_value(kwargs.get("communication_preference")) if kwargs.get("communication_preference") else None,
                 timezone=kwargs.get("timezone"),
                 notes=kwargs.get("notes")
             )
@@ -65,6 +89,7 @@ class WorkplaceTools:
             # Add to database
             manager_instance = await self._get_neo4j_manager()
             person_id = await manager_instance.add_coworker(person)
+            self.mark_graph_dirty()
 
             return f"✅ Added {name} successfully to the workplace graph"
 
@@ -136,7 +161,13 @@ class WorkplaceTools:
             logger.error(f"Failed to get org chart: {e}")
             return f"❌ Failed to generate org chart: {str(e)}"
 
-    async def export_data(self, format: str = "csv", output_path: str = "./export", include_sensitive: bool = False) -> str:
+    async def export_data(
+        self,
+        format: str = "csv",
+        output_path: str = "./export",
+        include_sensitive: bool = False,
+        pretty: bool = False
+    ) -> str:
         """Export workplace data."""
         try:
             exporter = await self._get_export_manager()
@@ -147,6 +178,14 @@ class WorkplaceTools:
                     return f"💾 Data exported successfully to {output_path}/contacts.csv"
                 else:
                     return "❌ Failed to export data"
+            elif format.lower() == "json":
+                success = await exporter.export_team_structure_json(
+                    f"{output_path}/team_structure.json", pretty=pretty
+                )
+                if success:
+                    return f"💾 Data exported successfully to {output_path}/team_structure.json"
+                else:
+                    return "❌ Failed to export data"
             else:
                 return f"❌ Unsupported format: {format}"
 
@@ -154,16 +193,19 @@ class WorkplaceTools:
             logger.error(f"Failed to export data: {e}")
             return f"❌ Failed to export data: {str(e)}"
 
-    async def get_network_insights(self, person: str = None, department: str = None) -> str:
+    async def get_network_insights(
+        self,
+        person: str = None,
+        department: str = None,
+        approximate: bool = False
+    ) -> str:
         """Get network insights and analysis."""
         try:
-            analyzer = await self._get_network_analyzer()
-
-            # Build the graph
-            await analyzer.build_graph_from_neo4j()
+            analyzer = await self._get_built_network_analyzer()
 
             if person:
-                metrics = analyzer.calculate_centrality_metrics(person)
+                k_samples = APPROXIMATE_BETWEENNESS_SAMPLES if approximate else None
+                metrics = analyzer.calculate_centrality_metrics(person, k_samples=k_samples)
                 if person in metrics:
                     metric = metrics[person]
                     return f"🔍 Network insights for {person}: Betweenness centrality: {metric.betweenness_centrality:.3f}"
@@ -222,7 +264,7 @@ async def add_coworker_tool(
             phone=phone,
             manager=manager,
             expertise_areas=expertise or [],
-            communication_preference=CommunicationPreference(communication_preference) if communication_preference else None,
+            communication_preference=CommunicationPreference.from_value(communication_preference) if communication_preference else None,
             timezone=timezone,
             notes=notes
         )
@@ -241,6 +283,7 @@ async def add_coworker_tool(
                 context="Reporting Structure"
             )
             await manager_instance.add_relationship(relationship)
+        workplace_tools.mark_graph_dirty()
 
         result = f"✅ Successfully added coworker '{name}'"
         if role:
@@ -285,7 +328,7 @@ async def add_relationship_tool(
     try:
         # Validate relationship type
         try:
-            rel_type = WorkRelationshipType(relationship_type.lower())
+            rel_type = WorkRelationshipType.from_value(relationship_type.lower())
         except ValueError:
             return f"❌ Invalid relationship type '{relationship_type}'. Valid types: {', '.join([t.value for t in WorkRelationshipType])}"
 
@@ -303,6 +346,7 @@ async def add_relationship_tool(
         # Add to database
         manager = await workplace_tools._get_neo4j_manager()
         success = await manager.add_relationship(relationship)
+        workplace_tools.mark_graph_dirty()
 
         if success:
             direction = "bidirectional" if bidirectional else "directional"
@@ -351,7 +395,7 @@ async def log_interaction_tool(
     try:
         # Validate interaction type
         try:
-            int_type = InteractionType(interaction_type.lower())
+            int_type = InteractionType.from_value(interaction_type.lower())
         except ValueError:
             return f"❌ Invalid interaction type '{interaction_type}'. Valid types: {', '.join([t.value for t in InteractionType])}"
 
@@ -381,6 +425,7 @@ async def log_interaction_tool(
         # Add to database
         manager = await workplace_tools._get_neo4j_manager()
         success = await manager.add_interaction(interaction)
+        workplace_tools.mark_graph_dirty()
 
         if success:
             result = f"✅ Successfully logged {interaction_type} interaction with '{with_person}'"
@@ -480,21 +525,17 @@ async def who_should_i_ask_tool(
         experts = await manager.find_experts(question_topic, department)
 
         if not experts:
-            # Try broader search by splitting the topic
-            topic_words = question_topic.split()
-            for word in topic_words:
-                if len(word) > 3:  # Skip short words
-                    experts = await manager.find_experts(word, department)
-                    if experts:
-                        break
+            # Try broader search by splitting the topic, one query for all words
+            topic_words = [word for word in question_topic.split() if len(word) > 3]  # Skip short words
+            experts_by_word = await manager.find_experts_multi(topic_words, department)
+            experts = next((found for found in experts_by_word.values() if found), [])
 
         if not experts:
             dept_filter = f" in {department}" if department else ""
             return f"🤔 I couldn't find specific experts for '{question_topic}'{dept_filter}. You might want to ask in your team or search by related keywords."
 
         # Get network analysis for additional context
-        network_analyzer = await workplace_tools._get_network_analyzer()
-        await network_analyzer.build_graph_from_neo4j()
+        network_analyzer = await workplace_tools._get_built_network_analyzer()
 
         result = f"💡 For questions about '{question_topic}', I recommend contacting:\n\n"
 
@@ -663,8 +704,7 @@ async def get_network_insights_tool(
         str: Network analysis insights
     """
     try:
-        network_analyzer = await workplace_tools._get_network_analyzer()
-        await network_analyzer.build_graph_from_neo4j()
+        network_analyzer = await workplace_tools._get_built_network_analyzer()
 
         if person:
             # Individual analysis
@@ -748,15 +788,19 @@ async def export_data_tool(
     workplace_tools: WorkplaceTools,
     format: str = "csv",
     output_path: str = "./export",
-    include_sensitive: bool = False
+    include_sensitive: bool = False,
+    pretty: bool = False
 ) -> str:
     """Export workplace social graph data.
 
+    JSON exports are compact unless ``pretty`` is set.
+
     Args:
         workplace_tools: Instance of WorkplaceTools
         format: Export format (csv, json, excel)
         output_path: Output directory path
         include_sensitive: Whether to include sensitive data
+        pretty: Whether to indent JSON output for human readers
 
     Returns:
         str: Success message with file paths
@@ -789,7 +833,7 @@ async def export_data_tool(
         elif format.lower() == "json":
             # Export network structure
             network_file = output_dir / f"network_{timestamp}.json"
-            await export_manager.export_network_json(network_file, include_sensitive_data=include_sensitive)
+            await export_manager.export_team_structure_json(network_file, pretty=pretty)
             exported_files.append(str(network_file))
 
         elif format.lower() == "excel":
@@ -1,19 +1,102 @@
 """Export manager for workplace social graph data."""
 
-import csv
+import asyncio
 import json
 import logging
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
+from neo4j.exceptions import ClientError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from ..database import Interaction, Neo4jManager, Person
 from .network_analysis import NetworkAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Records pulled per network round-trip for bulk exports
+EXPORT_FETCH_SIZE = 10000
+
+# CSV column order for positional export rows
+_CONTACT_FIELDNAMES = (
+    'Name', 'Email', 'Phone', 'Role', 'Department', 'Manager', 'Expertise Areas',
+    'Communication Preference', 'Timezone', 'Last Interaction', 'Interaction Frequency',
+)
+_CONTACT_NOTES_FIELDNAMES = _CONTACT_FIELDNAMES + ('Notes',)
+_INTERACTION_FIELDNAMES = (
+    'Date', 'With Person', 'Type', 'Topic', 'Outcome', 'Duration (minutes)', 'Project',
+    'Location', 'Participants', 'Follow-up Required', 'Follow-up Date', 'Notes',
+)
+
+# Static Cypher queries so Neo4j can reuse cached execution plans
+_CONTACTS_ALL = "MATCH (p:Person) RETURN p ORDER BY p.name"
+_CONTACTS_BY_DEPT = "MATCH (p:Person) WHERE p.department = $department RETURN p ORDER BY p.name"
+
+# Server-side contacts export via APOC; the inner query is passed as a parameter
+_CONTACTS_APOC_QUERY = """
+MATCH (p:Person)
+RETURN p.name AS Name,
+       p.email AS Email,
+       p.phone AS Phone,
+       p.role AS Role,
+       p.department AS Department,
+       p.manager AS Manager,
+       apoc.text.join(coalesce(p.expertise_areas, []), ', ') AS `Expertise Areas`,
+       p.communication_preference AS `Communication Preference`,
+       p.timezone AS Timezone,
+       p.last_interaction AS `Last Interaction`,
+       p.interaction_frequency AS `Interaction Frequency`
+ORDER BY p.name
+"""
+_CONTACTS_APOC_EXPORT = """
+CALL apoc.export.csv.query($query, $path, {stream: false})
+YIELD rows
+RETURN rows
+"""
+
+_TEAM_PEOPLE_ALL = "MATCH (p:Person) RETURN p ORDER BY p.department, p.name"
+_TEAM_PEOPLE_BY_DEPT = (
+    "MATCH (p:Person) WHERE p.department = $department "
+    "RETURN p ORDER BY p.department, p.name"
+)
+
+_TEAM_RELATIONSHIPS_ALL = """
+MATCH (from:Person)-[r:WORKS_WITH]->(to:Person)
+RETURN from.name as from_person,
+       to.name as to_person,
+       r.type as relationship_type,
+       r.context as context,
+       r.strength as strength
+"""
+_TEAM_RELATIONSHIPS_BY_DEPT = """
+MATCH (from:Person)-[r:WORKS_WITH]->(to:Person)
+WHERE from.department = $department OR to.department = $department
+RETURN from.name as from_person,
+       to.name as to_person,
+       r.type as relationship_type,
+       r.context as context,
+       r.strength as strength
+"""
+
+_INTERACTIONS_ALL = """
+MATCH (i:Interaction)
+WHERE i.date >= datetime() - duration({days: $days})
+RETURN i ORDER BY i.date DESC
+"""
+_INTERACTIONS_BY_PERSON = """
+MATCH (i:Interaction)
+WHERE i.date >= datetime() - duration({days: $days})
+  AND i.with_person = $person_name
+RETURN i ORDER BY i.date DESC
+"""
+
 
 class ExportManager:
     """Manager for exporting workplace social graph data in various formats."""
@@ -45,50 +128,40 @@ class ExportManager:
         """
         try:
             contacts = []
+            fieldnames = _CONTACT_NOTES_FIELDNAMES if include_personal_notes else _CONTACT_FIELDNAMES
 
-            async with self.neo4j_manager.session() as session:
-                query = "MATCH (p:Person)"
-                params = {}
-
-                if department:
-                    query += " WHERE p.department = $department"
-                    params["department"] = department
-
-                query += " RETURN p ORDER BY p.name"
+            async with self.neo4j_manager.session(fetch_size=EXPORT_FETCH_SIZE) as session:
+                query = _CONTACTS_BY_DEPT if department else _CONTACTS_ALL
+                params = {"department": department} if department else {}
 
                 result = await session.run(query, **params)
                 async for record in result:
                     person_data = record["p"]
 
-                    contact = {
-                        'Name': person_data.get('name', ''),
-                        'Email': person_data.get('email', ''),
-                        'Phone': person_data.get('phone', ''),
-                        'Role': person_data.get('role', ''),
-                        'Department': person_data.get('department', ''),
-                        'Manager': person_data.get('manager', ''),
-                        'Expertise Areas': ', '.join(person_data.get('expertise_areas', [])),
-                        'Communication Preference': person_data.get('communication_preference', ''),
-                        'Timezone': person_data.get('timezone', ''),
-                        'Last Interaction': person_data.get('last_interaction', ''),
-                        'Interaction Frequency': person_data.get('interaction_frequency', ''),
-                    }
+                    contact = (
+                        person_data.get('name', ''),
+                        person_data.get('email', ''),
+                        person_data.get('phone', ''),
+                        person_data.get('role', ''),
+                        person_data.get('department', ''),
+                        person_data.get('manager', ''),
+                        person_data.get('expertise_areas') or [],
+                        person_data.get('communication_preference', ''),
+                        person_data.get('timezone', ''),
+                        person_data.get('last_interaction', ''),
+                        person_data.get('interaction_frequency', ''),
+                    )
 
                     if include_personal_notes:
-                        contact['Notes'] = person_data.get('notes', '')
+                        contact += (person_data.get('notes', ''),)
 
                     contacts.append(contact)
 
-            # Write to CSV
+            # Write to CSV off the event loop
             output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                if contacts:
-                    fieldnames = contacts[0].keys()
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(contacts)
+            await asyncio.to_thread(
+                self._write_csv, output_path, contacts, fieldnames, ['Expertise Areas']
+            )
 
             logger.info(f"✅ Exported {len(contacts)} contacts to {output_path}")
             return True
@@ -97,16 +170,63 @@ class ExportManager:
             logger.error(f"❌ Failed to export contacts CSV: {e}")
             return False
 
+    async def export_contacts_csv_apoc(
+        self,
+        server_path: Union[str, Path],
+        client_fallback_path: Optional[Union[str, Path]] = None
+    ) -> bool:
+        """Export contact list to CSV on the Neo4j server using APOC.
+
+        The server streams rows straight to the file, skipping Python-side
+        serialization. ``server_path`` is resolved on the Neo4j server host,
+        which must allow APOC file export. When APOC is unavailable the
+        contacts are written on this host instead, but only to an explicitly
+        given ``client_fallback_path``, so a path never silently changes hosts.
+
+        Args:
+            server_path: Path for the output CSV file on the Neo4j server
+            client_fallback_path: Optional local path for the driver-side
+                export used when APOC is unavailable
+
+        Returns:
+            bool: True if export successful
+        """
+        try:
+            async with self.neo4j_manager.session() as session:
+                result = await session.run(
+                    _CONTACTS_APOC_EXPORT,
+                    query=_CONTACTS_APOC_QUERY,
+                    path=str(server_path)
+                )
+                record = await result.single()
+
+            rows = record["rows"] if record else 0
+            logger.info(f"✅ Exported {rows} contacts to {server_path} on the Neo4j server via APOC")
+            return True
+
+        except ClientError as e:
+            if client_fallback_path is None:
+                logger.error(f"❌ APOC export unavailable and no local fallback path given: {e}")
+                return False
+            logger.warning(f"⚠ APOC export unavailable, exporting locally to {client_fallback_path}: {e}")
+            return await self.export_contacts_csv(client_fallback_path)
+
+        except Exception as e:
+            logger.error(f"❌ Failed to export contacts CSV via APOC: {e}")
+            return False
+
     async def export_org_chart_json(
         self,
         output_path: Union[str, Path],
-        department: str = None
+        department: str = None,
+        pretty: bool = False
     ) -> bool:
         """Export organizational chart to JSON format.
 
         Args:
             output_path: Path for the output JSON file
             department: Optional department filter
+            pretty: Whether to indent the JSON output for human readers
 
         Returns:
             bool: True if export successful
@@ -133,12 +253,9 @@ class ExportManager:
                 'organizational_chart': org_chart
             }
 
-            # Write to JSON
+            # Write to JSON off the event loop
             output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output_path, 'w', encoding='utf-8') as jsonfile:
-                json.dump(export_data, jsonfile, indent=2, default=str)
+            await asyncio.to_thread(self._write_json, output_path, export_data, pretty)
 
             logger.info(f"✅ Exported organizational chart to {output_path}")
             return True
@@ -150,13 +267,15 @@ class ExportManager:
     async def export_team_structure_json(
         self,
         output_path: Union[str, Path],
-        department: str = None
+        department: str = None,
+        pretty: bool = False
     ) -> bool:
         """Export team structure with relationships to JSON format.
 
         Args:
             output_path: Path for the output JSON file
             department: Optional department filter
+            pretty: Whether to indent the JSON output for human readers
 
         Returns:
             bool: True if export successful
@@ -165,19 +284,13 @@ class ExportManager:
             team_structure = {
                 'teams': {},
                 'relationships': [],
-                'expertise_map': {}
+                'expertise_map': defaultdict(list)
             }
 
             async with self.neo4j_manager.session() as session:
                 # Get all people grouped by department
-                people_query = "MATCH (p:Person)"
-                params = {}
-
-                if department:
-                    people_query += " WHERE p.department = $department"
-                    params["department"] = department
-
-                people_query += " RETURN p ORDER BY p.department, p.name"
+                people_query = _TEAM_PEOPLE_BY_DEPT if department else _TEAM_PEOPLE_ALL
+                params = {"department": department} if department else {}
 
                 result = await session.run(people_query, **params)
 
@@ -188,7 +301,7 @@ class ExportManager:
                     if dept not in team_structure['teams']:
                         team_structure['teams'][dept] = {
                             'members': [],
-                            'managers': [],
+                            'managers': set(),
                             'total_count': 0
                         }
 
@@ -205,30 +318,16 @@ class ExportManager:
 
                     # Track managers
                     if person_data.get('manager'):
-                        if person_data['manager'] not in team_structure['teams'][dept]['managers']:
-                            team_structure['teams'][dept]['managers'].append(person_data['manager'])
+                        team_structure['teams'][dept]['managers'].add(person_data['manager'])
 
                     # Build expertise map
                     for skill in person_data.get('expertise_areas', []):
-                        if skill not in team_structure['expertise_map']:
-                            team_structure['expertise_map'][skill] = []
                         team_structure['expertise_map'][skill].append(person_data.get('name', ''))
 
                 # Get relationships
-                relationships_query = """
-                MATCH (from:Person)-[r:WORKS_WITH]->(to:Person)
-                """
-
-                if department:
-                    relationships_query += " WHERE from.department = $department OR to.department = $department"
-
-                relationships_query += """
-                RETURN from.name as from_person,
-                       to.name as to_person,
-                       r.type as relationship_type,
-                       r.context as context,
-                       r.strength as strength
-                """
+                relationships_query = (
+                    _TEAM_RELATIONSHIPS_BY_DEPT if department else _TEAM_RELATIONSHIPS_ALL
+                )
 
                 result = await session.run(relationships_query, **params)
 
@@ -242,6 +341,11 @@ class ExportManager:
                     }
                     team_structure['relationships'].append(relationship)
 
+            # Convert manager sets to lists for JSON serialization
+            for dept_data in team_structure['teams'].values():
+                dept_data['managers'] = sorted(dept_data['managers'])
+            team_structure['expertise_map'] = dict(team_structure['expertise_map'])
+
             # Add metadata
             export_data = {
                 'metadata': {
@@ -255,12 +359,9 @@ class ExportManager:
                 'team_structure': team_structure
             }
 
-            # Write to JSON
+            # Write to JSON off the event loop
             output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output_path, 'w', encoding='utf-8') as jsonfile:
-                json.dump(export_data, jsonfile, indent=2, default=str)
+            await asyncio.to_thread(self._write_json, output_path, export_data, pretty)
 
             logger.info(f"✅ Exported team structure to {output_path}")
             return True
@@ -312,23 +413,19 @@ class ExportManager:
                     'Betweenness Centrality': round(metrics.betweenness_centrality, 4),
                     'Closeness Centrality': round(metrics.closeness_centrality, 4),
                     'Eigenvector Centrality': round(metrics.eigenvector_centrality, 4),
-                    'Expertise Areas': ', '.join(person_data.get('expertise_areas', []))
+                    'Expertise Areas': person_data.get('expertise_areas') or []
                 }
                 metrics_data.append(row)
 
             # Sort by degree centrality (most connected first)
             metrics_data.sort(key=lambda x: x['Degree Centrality'], reverse=True)
 
-            # Write to CSV
+            # Write to CSV off the event loop
             output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                if metrics_data:
-                    fieldnames = metrics_data[0].keys()
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(metrics_data)
+            fieldnames = tuple(metrics_data[0]) if metrics_data else ()
+            await asyncio.to_thread(
+                self._write_csv, output_path, metrics_data, fieldnames, ['Expertise Areas']
+            )
 
             logger.info(f"✅ Exported network metrics for {len(metrics_data)} people to {output_path}")
             return True
@@ -356,52 +453,40 @@ class ExportManager:
         try:
             interactions = []
 
-            async with self.neo4j_manager.session() as session:
-                query = """
-                MATCH (i:Interaction)
-                WHERE i.date >= datetime() - duration({days: $days})
-                """
-
+            async with self.neo4j_manager.session(fetch_size=EXPORT_FETCH_SIZE) as session:
+                query = _INTERACTIONS_BY_PERSON if person_name else _INTERACTIONS_ALL
                 params = {"days": days}
 
                 if person_name:
-                    query += " AND i.with_person = $person_name"
                     params["person_name"] = person_name
 
-                query += " RETURN i ORDER BY i.date DESC"
-
                 result = await session.run(query, **params)
 
                 async for record in result:
                     interaction_data = record["i"]
 
-                    interaction = {
-                        'Date': interaction_data.get('date', ''),
-                        'With Person': interaction_data.get('with_person', ''),
-                        'Type': interaction_data.get('interaction_type', ''),
-                        'Topic': interaction_data.get('topic', ''),
-                        'Outcome': interaction_data.get('outcome', ''),
-                        'Duration (minutes)': interaction_data.get('duration_minutes', ''),
-                        'Project': interaction_data.get('project', ''),
-                        'Location': interaction_data.get('location', ''),
-                        'Participants': ', '.join(interaction_data.get('participants', [])),
-                        'Follow-up Required': interaction_data.get('follow_up_required', False),
-                        'Follow-up Date': interaction_data.get('follow_up_date', ''),
-                        'Notes': interaction_data.get('notes', '')
-                    }
+                    interaction = (
+                        interaction_data.get('date', ''),
+                        interaction_data.get('with_person', ''),
+                        interaction_data.get('interaction_type', ''),
+                        interaction_data.get('topic', ''),
+                        interaction_data.get('outcome', ''),
+                        interaction_data.get('duration_minutes', ''),
+                        interaction_data.get('project', ''),
+                        interaction_data.get('location', ''),
+                        interaction_data.get('participants') or [],
+                        interaction_data.get('follow_up_required', False),
+                        interaction_data.get('follow_up_date', ''),
+                        interaction_data.get('notes', ''),
+                    )
 
                     interactions.append(interaction)
 
-            # Write to CSV
+            # Write to CSV off the event loop
             output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                if interactions:
-                    fieldnames = interactions[0].keys()
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(interactions)
+            await asyncio.to_thread(
+                self._write_csv, output_path, interactions, _INTERACTION_FIELDNAMES, ['Participants']
+            )
 
             logger.info(f"✅ Exported {len(interactions)} interactions to {output_path}")
             return True
@@ -410,6 +495,85 @@ class ExportManager:
             logger.error(f"❌ Failed to export interactions CSV: {e}")
             return False
 
+    def _write_csv(
+        self,
+        output_path: Path,
+        rows: List[Union[tuple, Dict[str, Any]]],
+        fieldnames: tuple,
+        list_columns: List[str]
+    ) -> None:
+        """Serialize export rows and write them to a CSV file.
+
+        Runs synchronously; callers offload it with ``asyncio.to_thread``.
+
+        Args:
+            output_path: Path for the output CSV file
+            rows: Export rows, positional in ``fieldnames`` order or keyed by column
+            fieldnames: CSV column names in output order
+            list_columns: Columns holding lists to render as comma-separated text
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+            if rows:
+                frame = self._rows_to_frame(rows, fieldnames, list_columns=list_columns)
+                frame.to_csv(csvfile, index=False)
+
+    def _write_json(
+        self,
+        output_path: Path,
+        export_data: Dict[str, Any],
+        pretty: bool = False
+    ) -> None:
+        """Serialize export data and write it to a JSON file.
+
+        Output is compact UTF-8 unless ``pretty`` is set. Uses orjson when it
+        is installed and falls back to the standard library otherwise.
+        Runs synchronously; callers offload it with ``asyncio.to_thread``.
+
+        Args:
+            output_path: Path for the output JSON file
+            export_data: Data to serialize
+            pretty: Whether to indent the output
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            with open(output_path, 'wb') as jsonfile:
+                jsonfile.write(orjson.dumps(export_data, default=str, option=option))
+            return
+
+        with open(output_path, 'w', encoding='utf-8') as jsonfile:
+            json.dump(
+                export_data, jsonfile, indent=2 if pretty else None, default=str, ensure_ascii=False
+            )
+
+    @staticmethod
+    def _rows_to_frame(
+        rows: List[Union[tuple, Dict[str, Any]]],
+        fieldnames: tuple,
+        list_columns: List[str]
+    ) -> pd.DataFrame:
+        """Build a DataFrame from export rows, joining list columns in one pass.
+
+        Positional rows skip the per-row key lookups a dict-based writer does.
+
+        Args:
+            rows: Export rows, positional in ``fieldnames`` order or keyed by column
+            fieldnames: CSV column names in output order
+            list_columns: Columns holding lists to render as comma-separated text
+
+        Returns:
+            pd.DataFrame: Frame ready to be written as CSV
+        """
+        frame = pd.DataFrame.from_records(rows, columns=list(fieldnames))
+        for column in list_columns:
+            frame[column] = frame[column].str.join(', ')
+        return frame
+
     def _filter_org_chart_by_department(self, org_chart: Dict[str, Any], department: str) -> Dict[str, Any]:
         """Filter organizational chart by department.
 
@@ -480,13 +644,15 @@ class ExportManager:
     async def export_expertise_directory_json(
         self,
         output_path: Union[str, Path],
-        expertise_area: str = None
+        expertise_area: str = None,
+        pretty: bool = False
     ) -> bool:
         """Export expertise directory to JSON format.
 
         Args:
             output_path: Path for the output JSON file
             expertise_area: Optional expertise area filter
+            pretty: Whether to indent the JSON output for human readers
 
         Returns:
             bool: True if export successful
@@ -498,6 +664,9 @@ class ExportManager:
             # Get expertise clusters
             expertise_clusters = self.network_analyzer.find_expertise_clusters(expertise_area)
 
+            # Find knowledge brokers for every skill in one graph pass
+            all_brokers = self.network_analyzer.find_all_knowledge_brokers(expertise_clusters.keys())
+
             # Enhanced expertise directory with additional context
             expertise_directory = {}
 
@@ -529,9 +698,7 @@ class ExportManager:
                 # Convert set to list for JSON serialization
                 expertise_directory[skill]['departments'] = list(expertise_directory[skill]['departments'])
 
-                # Find knowledge brokers for this skill
-                brokers = self.network_analyzer.find_knowledge_brokers(skill)
-                expertise_directory[skill]['knowledge_brokers'] = brokers
+                expertise_directory[skill]['knowledge_brokers'] = all_brokers.get(skill, [])
 
             # Add metadata
             export_data = {
@@ -545,12 +712,9 @@ class ExportManager:
                 'expertise_directory': expertise_directory
             }
 
-            # Write to JSON
+            # Write to JSON off the event loop
             output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output_path, 'w', encoding='utf-8') as jsonfile:
-                json.dump(export_data, jsonfile, indent=2, default=str)
+            await asyncio.to_thread(self._write_json, output_path, export_data, pretty)
 
             logger.info(f"✅ Exported expertise directory to {output_path}")
             return True
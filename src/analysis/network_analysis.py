@@ -1,85 +1,264 @@
 """Network analysis engine for workplace social graph insights."""
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
+import os
+import random
+import tempfile
 from collections import Counter, defaultdict
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import networkx as nx
+import numpy as np
 import pandas as pd
+from neo4j import READ_ACCESS
+
+try:
+    import networkit as nk
+except ImportError:  # pragma: no cover - optional dependency
+    nk = None
 
 from ..database import Neo4jManager, NetworkMetrics, Person
+from ._centrality_numba import NUMBA_AVAILABLE, betweenness_csr
 
 logger = logging.getLogger(__name__)
 
+# Source nodes sampled for approximate betweenness centrality
+APPROXIMATE_BETWEENNESS_SAMPLES = 100
+
+# Records pulled per network round-trip, and added to the graph per batch,
+# while streaming graph data from Neo4j
+GRAPH_FETCH_SIZE = 10000
+GRAPH_BUILD_BATCH_SIZE = 1000
+
+# Largest graph for which broker searches compute exact betweenness
+BROKER_EXACT_MAX_NODES = 2000
+
+# Smallest graph worth the Numba JIT warm-up for betweenness
+NUMBA_MIN_NODES = 500
+
+# Bump when the on-disk centrality cache layout or computation changes
+CENTRALITY_CACHE_VERSION = 2
+
+
+def requires_graph(method):
+    """Ensure the analysis graph is built before running an analysis method.
+
+    Raises:
+        ValueError: If the graph has not been built yet
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.graph is None:
+            raise ValueError("Graph not built. Call build_graph_from_neo4j() first.")
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _fast_betweenness(graph: nx.Graph, k: Optional[int] = None, seed: int = 0) -> Dict[Any, float]:
+    """Compute normalized betweenness centrality for an unweighted graph.
+
+    Brandes' algorithm over integer-indexed adjacency lists, with the BFS
+    buffers allocated once and reset only for the nodes each source reaches.
+    The exact result equals ``nx.betweenness_centrality(graph)``; sampled
+    runs are delegated to NetworkX, whose rescaling of sampled and
+    unsampled nodes differs between releases.
+
+    Args:
+        graph: Undirected, unweighted graph
+        k: Optional number of sampled source nodes for an approximate result
+        seed: Random seed for source sampling
+
+    Returns:
+        Dict[Any, float]: Betweenness centrality by node
+    """
+    nodes = list(graph)
+    n = len(nodes)
+    if k is not None and k < n:
+        return nx.betweenness_centrality(graph, k=k, seed=seed)
+
+    node_to_idx = {node: i for i, node in enumerate(nodes)}
+    adjacency = [[node_to_idx[v] for v in graph.neighbors(u)] for u in nodes]
+
+    betweenness = [0.0] * n
+    sigma = [0.0] * n
+    distance = [-1] * n
+    delta = [0.0] * n
+    predecessors = [[] for _ in range(n)]
+
+    for source in range(n):
+        # BFS visit order doubles as the stack for dependency accumulation
+        order = [source]
+        distance[source] = 0
+        sigma[source] = 1.0
+        head = 0
+        while head < len(order):
+            v = order[head]
+            head += 1
+            next_distance = distance[v] + 1
+            sigma_v = sigma[v]
+            for w in adjacency[v]:
+                if distance[w] < 0:
+                    distance[w] = next_distance
+                    order.append(w)
+                if distance[w] == next_distance:
+                    sigma[w] += sigma_v
+                    predecessors[w].append(v)
+
+        for w in reversed(order):
+            coefficient = (1.0 + delta[w]) / sigma[w]
+            for v in predecessors[w]:
+                delta[v] += sigma[v] * coefficient
+            if w != source:
+                betweenness[w] += delta[w]
+
+        for v in order:
+            distance[v] = -1
+            sigma[v] = 0.0
+            delta[v] = 0.0
+            predecessors[v].clear()
+
+    scale = 1.0 / ((n - 1) * (n - 2)) if n > 2 else 1.0
+    return {node: value * scale for node, value in zip(nodes, betweenness)}
+
+
+# People, relationships and interaction counts in one round trip; each
+# subquery aggregates to a single row so the result is always one record
+_GRAPH_SNAPSHOT_QUERY = """
+CALL {
+    MATCH (p:Person)
+    RETURN collect([p.name, p.role, p.department, p.expertise_areas, p.manager]) AS people
+}
+CALL {
+    MATCH (from:Person)-[r:WORKS_WITH]->(to:Person)
+    RETURN collect([from.name, to.name, r.type, r.strength, r.context]) AS relationships
+}
+CALL {
+    MATCH (i:Interaction)
+    WHERE $include_interactions
+    WITH i.with_person AS person, COUNT(i) AS interaction_count
+    RETURN collect([person, interaction_count]) AS interaction_counts
+}
+RETURN people, relationships, interaction_counts
+"""
+
+# Writes interaction weights for a batch of edges in a single statement
+_PERSIST_EDGE_WEIGHTS_QUERY = """
+UNWIND $rows AS row
+MATCH (a:Person {name: row.a})-[r:WORKS_WITH]-(b:Person {name: row.b})
+SET r.interaction_weight = row.w
+"""
+
 
 class NetworkAnalyzer:
     """Workplace network analysis engine using NetworkX."""
 
-    def __init__(self, neo4j_manager: Neo4jManager):
+    def __init__(
+        self,
+        neo4j_manager: Neo4jManager,
+        cache_dir: Optional[Union[str, Path]] = None
+    ):
         """Initialize network analyzer.
 
         Args:
             neo4j_manager: Neo4j database manager for data access
+            cache_dir: Optional directory for persisting centrality results
+                across runs (disabled when None)
         """
         self.neo4j_manager = neo4j_manager
-        self.graph: Optional[nx.Graph] = None
+        self.cache_dir = cache_dir
+        self._graph: Optional[nx.Graph] = None
+        self._graph_version = 0
+        self._analysis_cache: Dict[Any, Any] = {}
+        self._nk_graph = None
         self.directed_graph: Optional[nx.DiGraph] = None
 
-    async def build_graph_from_neo4j(self, include_interactions: bool = True) -> nx.Graph:
+    @property
+    def graph(self) -> Optional[nx.Graph]:
+        """Undirected workplace graph used for analysis."""
+        return self._graph
+
+    @graph.setter
+    def graph(self, graph: Optional[nx.Graph]) -> None:
+        """Replace the analysis graph and invalidate cached results."""
+        self._graph = graph
+        self._graph_version += 1
+        self._analysis_cache.clear()
+        self._nk_graph = None
+
+    async def build_graph_from_neo4j(
+        self,
+        include_interactions: bool = True,
+        persist_weights: bool = False
+    ) -> nx.Graph:
         """Build NetworkX graph from Neo4j workplace data.
 
+        People, relationships and interaction counts are fetched in a single
+        round trip.
+
         Args:
             include_interactions: Whether to include interaction weights
+            persist_weights: Whether to write the computed interaction weights
+                back onto the WORKS_WITH relationships in Neo4j
 
         Returns:
             nx.Graph: NetworkX graph representation
         """
         graph = nx.Graph()
 
-        async with self.neo4j_manager.session() as session:
-            # Get all people and their attributes
-            people_query = """
-            MATCH (p:Person)
-            RETURN p.name as name,
-                   p.role as role,
-                   p.department as department,
-                   p.expertise_areas as expertise_areas,
-                   p.manager as manager
-            """
-
-            result = await session.run(people_query)
-            async for record in result:
-                graph.add_node(
-                    record["name"],
-                    role=record["role"],
-                    department=record["department"],
-                    expertise_areas=record["expertise_areas"] or [],
-                    manager=record["manager"]
-                )
+        async with self.neo4j_manager.session(default_access_mode=READ_ACCESS) as session:
+            result = await session.run(
+                _GRAPH_SNAPSHOT_QUERY,
+                include_interactions=include_interactions
+            )
+            record = await result.single()
+
+        graph.add_nodes_from(
+            (
+                name,
+                {
+                    'role': role,
+                    'department': department,
+                    'expertise_areas': expertise_areas or [],
+                    'manager': manager
+                }
+            )
+            for name, role, department, expertise_areas, manager in record["people"]
+        )
 
-            # Get all relationships
-            relationships_query = """
-            MATCH (from:Person)-[r:WORKS_WITH]->(to:Person)
-            RETURN from.name as from_person,
-                   to.name as to_person,
-                   r.type as relationship_type,
-                   r.strength as strength,
-                   r.context as context
-            """
-
-            result = await session.run(relationships_query)
-            async for record in result:
-                graph.add_edge(
-                    record["from_person"],
-                    record["to_person"],
-                    relationship_type=record["relationship_type"],
-                    strength=record["strength"] or 1.0,
-                    context=record["context"]
-                )
+        graph.add_edges_from(
+            (
+                from_person,
+                to_person,
+                {
+                    'relationship_type': relationship_type,
+                    'strength': strength or 1.0,
+                    'context': context
+                }
+            )
+            for from_person, to_person, relationship_type, strength, context in record["relationships"]
+        )
 
-            # Optionally include interaction weights
-            if include_interactions:
-                await self._add_interaction_weights(session, graph)
+        # Optionally include interaction weights
+        if include_interactions:
+            self._add_interaction_weights(graph, dict(record["interaction_counts"]))
+
+            if persist_weights:
+                async with self.neo4j_manager.session() as session:
+                    weight_rows = [
+                        {"a": person1, "b": person2, "w": weight}
+                        for person1, person2, weight in graph.edges(data='interaction_weight')
+                    ]
+                    for start in range(0, len(weight_rows), GRAPH_BUILD_BATCH_SIZE):
+                        await self._persist_edge_weights(
+                            session, weight_rows[start:start + GRAPH_BUILD_BATCH_SIZE]
+                        )
 
         self.graph = graph
         return graph
@@ -87,68 +266,87 @@ class NetworkAnalyzer:
     async def build_directed_graph_from_neo4j(self) -> nx.DiGraph:
         """Build directed NetworkX graph for hierarchical analysis.
 
+        People and reporting lines are streamed concurrently on separate
+        read sessions.
+
         Returns:
             nx.DiGraph: Directed graph showing reporting relationships
         """
         directed_graph = nx.DiGraph()
 
-        async with self.neo4j_manager.session() as session:
-            # Get all people
-            people_query = """
-            MATCH (p:Person)
-            RETURN p.name as name,
-                   p.role as role,
-                   p.department as department,
-                   p.expertise_areas as expertise_areas,
-                   p.manager as manager
-            """
-
-            result = await session.run(people_query)
-            async for record in result:
-                directed_graph.add_node(
-                    record["name"],
-                    role=record["role"],
-                    department=record["department"],
-                    expertise_areas=record["expertise_areas"] or [],
-                    manager=record["manager"]
-                )
+        # Get all people
+        people_query = """
+        MATCH (p:Person)
+        RETURN p.name as name,
+               p.role as role,
+               p.department as department,
+               p.expertise_areas as expertise_areas,
+               p.manager as manager
+        """
 
-            # Get hierarchical relationships (directed)
-            hierarchy_query = """
-            MATCH (report:Person)-[r:WORKS_WITH {type: 'manager'}]->(manager:Person)
-            RETURN report.name as report,
-                   manager.name as manager,
-                   r.strength as strength
-            """
-
-            result = await session.run(hierarchy_query)
-            async for record in result:
-                directed_graph.add_edge(
-                    record["report"],
-                    record["manager"],
-                    relationship_type="reports_to",
-                    strength=record["strength"] or 1.0
-                )
+        # Get hierarchical relationships (directed)
+        hierarchy_query = """
+        MATCH (report:Person)-[r:WORKS_WITH {type: 'manager'}]->(manager:Person)
+        RETURN report.name as report,
+               manager.name as manager,
+               r.strength as strength
+        """
+
+        def person_node(record) -> Tuple[str, Dict[str, Any]]:
+            return (
+                record["name"],
+                {
+                    'role': record["role"],
+                    'department': record["department"],
+                    'expertise_areas': record["expertise_areas"] or [],
+                    'manager': record["manager"]
+                }
+            )
+
+        def reporting_edge(record) -> Tuple[str, str, Dict[str, Any]]:
+            return (
+                record["report"],
+                record["manager"],
+                {'relationship_type': "reports_to", 'strength': record["strength"] or 1.0}
+            )
+
+        await asyncio.gather(
+            self._stream_rows(people_query, person_node, directed_graph.add_nodes_from),
+            self._stream_rows(hierarchy_query, reporting_edge, directed_graph.add_edges_from)
+        )
 
         self.directed_graph = directed_graph
         return directed_graph
 
-    async def _add_interaction_weights(self, session, graph: nx.Graph) -> None:
-        """Add interaction frequency weights to graph edges."""
-        interactions_query = """
-        MATCH (i:Interaction)
-        RETURN i.with_person as person,
-               COUNT(i) as interaction_count
+    async def _stream_rows(self, query: str, to_item, add_batch, **params) -> None:
+        """Stream a read query on its own session into the graph in batches.
+
+        Records are pulled ``GRAPH_BUILD_BATCH_SIZE`` at a time with one await
+        per chunk and flushed with a bulk add, so graph construction overlaps
+        with the driver fetching the next page.
+
+        Args:
+            query: Cypher query to run
+            to_item: Converts a record into a node or edge tuple
+            add_batch: Bulk-add callable such as ``graph.add_nodes_from``
+            **params: Query parameters
         """
+        async with self.neo4j_manager.session(
+            fetch_size=GRAPH_FETCH_SIZE,
+            default_access_mode=READ_ACCESS
+        ) as session:
+            result = await session.run(query, **params)
 
-        result = await session.run(interactions_query)
-        interaction_weights = {}
+            while records := await result.fetch(GRAPH_BUILD_BATCH_SIZE):
+                add_batch([to_item(record) for record in records])
 
-        async for record in result:
-            person = record["person"]
-            count = record["interaction_count"]
-            interaction_weights[person] = count
+    def _add_interaction_weights(self, graph: nx.Graph, interaction_weights: Dict[str, int]) -> None:
+        """Add interaction frequency weights to graph edges.
 
+        Args:
+            graph: Graph whose edges receive an ``interaction_weight``
+            interaction_weights: Interaction count by person
+        """
         # Update edge weights based on interaction frequency
         for edge in graph.edges():
             person1, person2 = edge
@@ -158,27 +356,322 @@ class NetworkAnalyzer:
             avg_weight = (weight1 + weight2) / 2 if weight1 or weight2 else 1.0
             graph[person1][person2]['interaction_weight'] = avg_weight
 
-    def calculate_centrality_metrics(self, person_name: str = None) -> Dict[str, NetworkMetrics]:
+    async def _persist_edge_weights(self, session, batch_rows: List[Dict[str, Any]]) -> None:
+        """Write a batch of edge weights to Neo4j in one round trip.
+
+        Args:
+            session: Open Neo4j session
+            batch_rows: Rows of ``{"a": name, "b": name, "w": weight}``
+        """
+        result = await session.run(_PERSIST_EDGE_WEIGHTS_QUERY, rows=batch_rows)
+        await result.consume()
+
+    def _get_nk_graph(self):
+        """Return the NetworKit copy of the analysis graph, converting it once.
+
+        Returns:
+            Tuple of the NetworKit graph and the node names indexed by NetworKit id
+        """
+        if self._nk_graph is None:
+            # nx2nk numbers nodes in iteration order
+            self._nk_graph = (nk.nxadapter.nx2nk(self.graph), list(self.graph.nodes()))
+        return self._nk_graph
+
+    def _cached_centrality(self, measure: str, compute) -> Dict[str, float]:
+        """Return a centrality measure, computing it at most once per graph.
+
+        Args:
+            measure: Name of the centrality measure used as cache key
+            compute: Callable producing the measure when it is not cached
+
+        Returns:
+            Dict[str, float]: Centrality values by person
+        """
+        cache_key = ('centrality', measure)
+        if cache_key not in self._analysis_cache:
+            self._load_centrality_cache()
+        if cache_key not in self._analysis_cache:
+            self._analysis_cache[cache_key] = compute()
+            self._save_centrality_cache()
+        return self._analysis_cache[cache_key]
+
+    def _get_degree(self) -> Dict[str, float]:
+        """Return memoized degree centrality for the current graph."""
+        return self._cached_centrality('degree', self._compute_degree)
+
+    def _get_betweenness(self, k_samples: Optional[int] = None) -> Dict[str, float]:
+        """Return memoized betweenness centrality for the current graph.
+
+        Args:
+            k_samples: Optional number of sampled sources for an approximate result
+        """
+        if k_samples is not None and k_samples < len(self.graph):
+            return self._cached_centrality(
+                f'betweenness_k{k_samples}',
+                lambda: self._compute_betweenness(k_samples=k_samples)
+            )
+        return self._cached_centrality('betweenness', self._compute_betweenness)
+
+    def _get_closeness(self) -> Dict[str, float]:
+        """Return memoized closeness centrality for the current graph."""
+        return self._cached_centrality('closeness', self._compute_closeness)
+
+    def _get_eigenvector(self) -> Dict[str, float]:
+        """Return memoized eigenvector centrality for the current graph."""
+        return self._cached_centrality('eigenvector', self._compute_eigenvector)
+
+    def _get_broker_betweenness(self) -> Dict[str, float]:
+        """Return betweenness for broker ranking, sampled on large graphs.
+
+        Exact values are used when already computed or when the graph is
+        small; otherwise sampling keeps broker searches at O(k * E).
+        """
+        if (
+            len(self.graph) > BROKER_EXACT_MAX_NODES
+            and ('centrality', 'betweenness') not in self._analysis_cache
+        ):
+            return self._get_betweenness(k_samples=APPROXIMATE_BETWEENNESS_SAMPLES)
+        return self._get_betweenness()
+
+    def _graph_fingerprint(self) -> str:
+        """Hash the graph structure so cached centralities can be matched to it.
+
+        Returns:
+            str: Hex digest of the sorted node and edge sets
+        """
+        cache_key = ('fingerprint',)
+        if cache_key not in self._analysis_cache:
+            nodes = sorted(str(node) for node in self.graph.nodes())
+            edges = sorted(tuple(sorted((str(u), str(v)))) for u, v in self.graph.edges())
+            digest = hashlib.blake2b(repr((nodes, edges)).encode('utf-8'), digest_size=16)
+            self._analysis_cache[cache_key] = digest.hexdigest()
+        return self._analysis_cache[cache_key]
+
+    def _centrality_cache_path(self) -> Path:
+        """Return the on-disk cache file for the current graph."""
+        cache_dir = Path(self.cache_dir).expanduser()
+        return cache_dir / f"centrality-{self._graph_fingerprint()}.json"
+
+    def _load_centrality_cache(self) -> None:
+        """Load persisted centralities for the current graph, at most once per graph."""
+        loaded_key = ('centrality_cache_loaded',)
+        if not self.cache_dir or loaded_key in self._analysis_cache:
+            return
+        self._analysis_cache[loaded_key] = True
+
+        try:
+            cache_path = self._centrality_cache_path()
+            if not cache_path.exists():
+                return
+
+            # Plain JSON, never pickle: the cache directory must not be able
+            # to run code, and anything that is not name -> float is ignored
+            with open(cache_path, 'r', encoding='utf-8') as cache_file:
+                cached = json.load(cache_file)
+
+            if not isinstance(cached, dict) or cached.get('version') != CENTRALITY_CACHE_VERSION:
+                return
+
+            for measure, values in cached['centrality'].items():
+                self._analysis_cache.setdefault(
+                    ('centrality', measure),
+                    {str(node): float(value) for node, value in values.items()}
+                )
+
+        except Exception as e:
+            logger.warning(f"⚠ Could not read centrality cache: {e}")
+
+    def _save_centrality_cache(self) -> None:
+        """Persist the centralities computed so far for the current graph.
+
+        The file is replaced atomically, and files left by earlier graphs are
+        removed, so the cache directory holds only the latest graph's results.
+        """
+        if not self.cache_dir:
+            return
+
+        centrality = {
+            key[1]: values
+            for key, values in self._analysis_cache.items()
+            if key[0] == 'centrality'
+        }
+
+        try:
+            cache_path = self._centrality_cache_path()
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=cache_path.parent,
+                prefix='.centrality-', suffix='.tmp', delete=False
+            ) as cache_file:
+                try:
+                    json.dump(
+                        {'version': CENTRALITY_CACHE_VERSION, 'centrality': centrality},
+                        cache_file,
+                        default=float
+                    )
+                except Exception:
+                    cache_file.close()
+                    os.unlink(cache_file.name)
+                    raise
+            os.replace(cache_file.name, cache_path)
+
+            for stale_path in cache_path.parent.glob('centrality-*.json'):
+                if stale_path != cache_path:
+                    stale_path.unlink(missing_ok=True)
+
+        except Exception as e:
+            logger.warning(f"⚠ Could not write centrality cache: {e}")
+
+    def _compute_degree(self) -> Dict[str, float]:
+        """Compute normalized degree centrality straight from node degrees.
+
+        Returns:
+            Dict[str, float]: Degree centrality by person
+        """
+        if len(self.graph) <= 1:
+            return {node: 1.0 for node in self.graph}
+
+        scale = 1.0 / (len(self.graph) - 1)
+        return {node: degree * scale for node, degree in self.graph.degree()}
+
+    def _compute_betweenness(self, k_samples: Optional[int] = None) -> Dict[str, float]:
+        """Compute normalized betweenness centrality for the analysis graph.
+
+        Uses NetworKit's parallel C++ implementation when it is installed and
+        falls back to an array-based pure-Python Brandes pass otherwise.
+
+        Args:
+            k_samples: Optional number of sampled source nodes; approximates
+                betweenness in O(k_samples * E) instead of O(V * E)
+
+        Returns:
+            Dict[str, float]: Betweenness centrality by person
+        """
+        n = self.graph.number_of_nodes()
+        if nk is None or n < 3:
+            if NUMBA_AVAILABLE and n >= NUMBA_MIN_NODES:
+                return self._numba_betweenness(k_samples=k_samples)
+            return _fast_betweenness(self.graph, k=k_samples)
+
+        nk_graph, node_names = self._get_nk_graph()
+        if k_samples is not None and k_samples < len(node_names):
+            betweenness = nk.centrality.EstimateBetweenness(nk_graph, k_samples, normalized=True)
+        else:
+            betweenness = nk.centrality.Betweenness(nk_graph, normalized=True)
+        return dict(zip(node_names, betweenness.run().scores()))
+
+    def _to_csr(self) -> Tuple[List[Any], np.ndarray, np.ndarray]:
+        """Convert the analysis graph to CSR adjacency arrays, once per graph.
+
+        Returns:
+            Tuple of node names by index, row offsets and neighbour indices
+        """
+        cache_key = ('csr',)
+        if cache_key not in self._analysis_cache:
+            nodes = list(self.graph)
+            node_to_idx = {node: i for i, node in enumerate(nodes)}
+            adjacency = [[node_to_idx[v] for v in self.graph.neighbors(u)] for u in nodes]
+
+            degrees = [len(neighbors) for neighbors in adjacency]
+            # int32 offsets and ids halve memory traffic in the kernels
+            if sum(degrees) > np.iinfo(np.int32).max:
+                raise ValueError("Graph too large for int32 CSR arrays")
+
+            indptr = np.zeros(len(nodes) + 1, dtype=np.int32)
+            np.cumsum(degrees, out=indptr[1:])
+            indices = np.fromiter(
+                (v for neighbors in adjacency for v in neighbors),
+                dtype=np.int32,
+                count=int(indptr[-1])
+            )
+            self._analysis_cache[cache_key] = (nodes, indptr, indices)
+        return self._analysis_cache[cache_key]
+
+    def _numba_betweenness(self, k_samples: Optional[int] = None, seed: int = 0) -> Dict[str, float]:
+        """Compute normalized betweenness with the Numba-compiled Brandes kernel.
+
+        Args:
+            k_samples: Optional number of sampled source nodes
+            seed: Random seed for source sampling
+
+        Returns:
+            Dict[str, float]: Betweenness centrality by person
+        """
+        nodes, indptr, indices = self._to_csr()
+        n = len(nodes)
+
+        if k_samples is not None and k_samples < n:
+            sampled = random.Random(seed).sample(range(n), k_samples)
+            sources = np.array(sampled, dtype=np.int32)
+            scale = n / k_samples
+        else:
+            sources = np.arange(n, dtype=np.int32)
+            scale = 1.0
+
+        raw = betweenness_csr(indptr, indices, sources)
+        scale /= (n - 1) * (n - 2)
+        return dict(zip(nodes, (raw * scale).tolist()))
+
+    def _compute_closeness(self) -> Dict[str, float]:
+        """Compute closeness centrality for the analysis graph.
+
+        Returns:
+            Dict[str, float]: Closeness centrality by person
+        """
+        if nk is None or self.graph.number_of_nodes() < 3:
+            return nx.closeness_centrality(self.graph)
+
+        nk_graph, node_names = self._get_nk_graph()
+        # Generalized variant matches NetworkX's Wasserman-Faust scaling
+        closeness = nk.centrality.Closeness(
+            nk_graph, True, nk.centrality.ClosenessVariant.GENERALIZED
+        )
+        return dict(zip(node_names, closeness.run().scores()))
+
+    def _compute_eigenvector(self) -> Dict[str, float]:
+        """Compute eigenvector centrality for the analysis graph.
+
+        Returns:
+            Dict[str, float]: Eigenvector centrality by person
+        """
+        if len(self.graph) == 0:
+            return {}
+
+        if nk is None or self.graph.number_of_nodes() < 3:
+            return nx.eigenvector_centrality(self.graph, max_iter=1000)
+
+        nk_graph, node_names = self._get_nk_graph()
+        scores = nk.centrality.EigenvectorCentrality(nk_graph).run().scores()
+        # Rescale to unit Euclidean norm like NetworkX
+        norm = sum(score * score for score in scores) ** 0.5 or 1.0
+        return {name: score / norm for name, score in zip(node_names, scores)}
+
+    @requires_graph
+    def calculate_centrality_metrics(
+        self,
+        person_name: str = None,
+        k_samples: Optional[int] = None
+    ) -> Dict[str, NetworkMetrics]:
         """Calculate centrality metrics for the network.
 
         Args:
             person_name: Optional specific person to analyze
+            k_samples: Optional number of sampled sources for approximate
+                betweenness centrality on large graphs
 
         Returns:
             Dict[str, NetworkMetrics]: Centrality metrics by person
         """
-        if self.graph is None:
-            raise ValueError("Graph not built. Call build_graph_from_neo4j() first.")
-
         # Handle empty graphs
         if len(self.graph.nodes()) == 0:
             return {}
 
         # Calculate various centrality measures
-        degree_centrality = nx.degree_centrality(self.graph)
-        betweenness_centrality = nx.betweenness_centrality(self.graph)
-        closeness_centrality = nx.closeness_centrality(self.graph)
-        eigenvector_centrality = nx.eigenvector_centrality(self.graph, max_iter=1000)
+        degree_centrality = self._get_degree()
+        betweenness_centrality = self._get_betweenness(k_samples=k_samples)
+        closeness_centrality = self._get_closeness()
+        eigenvector_centrality = self._get_eigenvector()
+        n_nodes = len(self.graph)
 
         # If specific person requested, return only their metrics
         if person_name:
@@ -193,25 +686,26 @@ class NetworkAnalyzer:
                     closeness_centrality=closeness_centrality.get(person_name, 0.0),
                     eigenvector_centrality=eigenvector_centrality.get(person_name, 0.0),
                     total_connections=self.graph.degree(person_name),
-                    graph_size=len(self.graph.nodes())
+                    graph_size=n_nodes
                 )
             }
 
         # Return metrics for all people
         metrics = {}
-        for person in self.graph.nodes():
+        for person, degree in self.graph.degree():
             metrics[person] = NetworkMetrics(
                 person_name=person,
                 degree_centrality=degree_centrality.get(person, 0.0),
                 betweenness_centrality=betweenness_centrality.get(person, 0.0),
                 closeness_centrality=closeness_centrality.get(person, 0.0),
                 eigenvector_centrality=eigenvector_centrality.get(person, 0.0),
-                total_connections=self.graph.degree(person),
-                graph_size=len(self.graph.nodes())
+                total_connections=degree,
+                graph_size=n_nodes
             )
 
         return metrics
 
+    @requires_graph
     def find_expertise_clusters(self, expertise_area: str = None) -> Dict[str, List[str]]:
         """Find clusters of people by expertise area.
 
@@ -221,27 +715,64 @@ class NetworkAnalyzer:
         Returns:
             Dict[str, List[str]]: Clusters of people by expertise
         """
-        if not self.graph:
-            raise ValueError("Graph not built. Call build_graph_from_neo4j() first.")
+        if expertise_area:
+            # Filter by specific expertise using the per-graph skill index
+            specialists = self._find_specialists(expertise_area)
+            if not specialists:
+                return {}
+            node_positions = self._get_node_positions()
+            return {expertise_area: sorted(specialists, key=node_positions.__getitem__)}
 
         expertise_clusters = defaultdict(list)
 
-        for node in self.graph.nodes(data=True):
-            person_name = node[0]
-            person_data = node[1]
-            expertise_areas = person_data.get('expertise_areas', [])
-
-            if expertise_area:
-                # Filter by specific expertise
-                if any(expertise_area.lower() in skill.lower() for skill in expertise_areas):
-                    expertise_clusters[expertise_area].append(person_name)
-            else:
-                # Group by all expertise areas
-                for skill in expertise_areas:
-                    expertise_clusters[skill].append(person_name)
+        # Group by all expertise areas
+        for person_name, expertise_areas in self.graph.nodes(data='expertise_areas', default=[]):
+            for skill in expertise_areas or []:
+                expertise_clusters[skill].append(person_name)
 
         return dict(expertise_clusters)
 
+    def _get_expertise_index(self) -> Dict[str, Set[str]]:
+        """Return people indexed by lowercased skill, built once per graph.
+
+        Returns:
+            Dict[str, Set[str]]: Names of the people holding each skill
+        """
+        cache_key = ('expertise_index',)
+        if cache_key not in self._analysis_cache:
+            expertise_index = defaultdict(set)
+            for person, skills in self.graph.nodes(data='expertise_areas', default=[]):
+                for skill in skills or []:
+                    expertise_index[skill.lower()].add(person)
+            self._analysis_cache[cache_key] = dict(expertise_index)
+        return self._analysis_cache[cache_key]
+
+    def _get_node_positions(self) -> Dict[str, int]:
+        """Return each person's position in graph iteration order, built once per graph."""
+        cache_key = ('node_positions',)
+        if cache_key not in self._analysis_cache:
+            self._analysis_cache[cache_key] = {node: i for i, node in enumerate(self.graph)}
+        return self._analysis_cache[cache_key]
+
+    def _find_specialists(self, expertise_area: str) -> Set[str]:
+        """Find people with a skill containing ``expertise_area`` (case-insensitive).
+
+        Scans distinct skills rather than people.
+
+        Args:
+            expertise_area: Expertise area to match
+
+        Returns:
+            Set[str]: Names of matching people
+        """
+        area_lower = expertise_area.lower()
+        specialists = set()
+        for skill, holders in self._get_expertise_index().items():
+            if area_lower in skill:
+                specialists |= holders
+        return specialists
+
+    @requires_graph
     def find_collaboration_paths(self, from_person: str, to_person: str) -> List[List[str]]:
         """Find possible collaboration paths between two people.
 
@@ -252,83 +783,83 @@ class NetworkAnalyzer:
         Returns:
             List[List[str]]: List of possible paths (each path is a list of names)
         """
-        if not self.graph:
-            raise ValueError("Graph not built. Call build_graph_from_neo4j() first.")
-
         if from_person not in self.graph or to_person not in self.graph:
             return []
 
         try:
-            # Find shortest path
-            shortest_path = nx.shortest_path(self.graph, from_person, to_person)
-            paths = [shortest_path]
-
-            # Find alternative paths (up to 3 total)
-            try:
-                all_simple_paths = list(nx.all_simple_paths(
-                    self.graph, from_person, to_person, cutoff=4
-                ))
-                # Sort by length and take top 3
-                all_simple_paths.sort(key=len)
-                paths = all_simple_paths[:3]
-            except nx.NetworkXNoPath:
-                pass
-
-            return paths
+            # Yen's algorithm yields simple paths shortest-first, so only the
+            # paths we return are ever generated
+            shortest_paths = nx.shortest_simple_paths(self.graph, from_person, to_person)
+            return [
+                path for path in islice(shortest_paths, 3)
+                if len(path) - 1 <= 4
+            ]
 
         except nx.NetworkXNoPath:
             return []
 
+    @requires_graph
     def analyze_department_connectivity(self) -> Dict[str, Dict[str, Any]]:
         """Analyze connectivity within and between departments.
 
         Returns:
             Dict[str, Dict[str, Any]]: Department connectivity metrics
         """
-        if not self.graph:
-            raise ValueError("Graph not built. Call build_graph_from_neo4j() first.")
-
         department_metrics = {}
         departments = defaultdict(list)
 
         # Group people by department
-        for node in self.graph.nodes(data=True):
-            person_name = node[0]
-            person_data = node[1]
-            department = person_data.get('department', 'Unknown')
+        for person_name, department in self.graph.nodes(data='department', default='Unknown'):
             departments[department].append(person_name)
 
-        for dept_name, dept_members in departments.items():
-            if len(dept_members) < 2:
-                continue
-
-            # Create subgraph for department
-            dept_subgraph = self.graph.subgraph(dept_members)
-
-            # Calculate internal connectivity
-            internal_edges = dept_subgraph.number_of_edges()
-            possible_internal_edges = len(dept_members) * (len(dept_members) - 1) / 2
-            internal_density = internal_edges / possible_internal_edges if possible_internal_edges > 0 else 0
+        # Count internal and external edges per department with vectorized
+        # ops; departments are integer-coded so missing values compare exactly
+        dept_codes = {department: code for code, department in enumerate(departments)}
+        person_codes = pd.Series({
+            person: dept_codes[department]
+            for department, members in departments.items()
+            for person in members
+        }, dtype='int64')
+
+        edges_df = pd.DataFrame(list(self.graph.edges()), columns=['u', 'v'])
+        edges_df['du'] = edges_df['u'].map(person_codes)
+        edges_df['dv'] = edges_df['v'].map(person_codes)
+
+        same_dept = edges_df['du'] == edges_df['dv']
+        internal_counts = edges_df.loc[same_dept, 'du'].value_counts()
+        cross_edges = edges_df.loc[~same_dept]
+        # Each cross-department edge is external to both endpoint departments
+        external_counts = cross_edges['du'].value_counts().add(
+            cross_edges['dv'].value_counts(), fill_value=0
+        )
 
-            # Calculate external connections
-            external_connections = 0
-            for member in dept_members:
-                for neighbor in self.graph.neighbors(member):
-                    neighbor_dept = self.graph.nodes[neighbor].get('department', 'Unknown')
-                    if neighbor_dept != dept_name:
-                        external_connections += 1
+        # Derive per-department metrics for all departments at once
+        stats = pd.DataFrame(
+            {'member_count': [len(members) for members in departments.values()]},
+            index=pd.RangeIndex(len(departments))
+        )
+        stats['internal'] = internal_counts.reindex(stats.index, fill_value=0).astype('int64')
+        stats['external'] = external_counts.reindex(stats.index, fill_value=0).astype('int64')
+        possible_internal_edges = stats['member_count'] * (stats['member_count'] - 1) / 2
+        stats['density'] = (stats['internal'] / possible_internal_edges).where(possible_internal_edges > 0, 0.0)
+        stats['avg_external'] = stats['external'] / stats['member_count']
+
+        for (dept_name, dept_members), row in zip(departments.items(), stats.itertuples(index=False)):
+            if row.member_count < 2:
+                continue
 
             department_metrics[dept_name] = {
-                'member_count': len(dept_members),
-                'internal_connections': internal_edges,
-                'external_connections': external_connections,
-                'internal_density': internal_density,
-                'avg_external_connections_per_person': external_connections / len(dept_members),
+                'member_count': int(row.member_count),
+                'internal_connections': int(row.internal),
+                'external_connections': int(row.external),
+                'internal_density': float(row.density),
+                'avg_external_connections_per_person': float(row.avg_external),
                 'members': dept_members
             }
 
         return department_metrics
 
+    @requires_graph
     def find_influential_people(self, top_n: int = 5) -> List[Tuple[str, float]]:
         """Find the most influential people in the workplace network.
 
@@ -338,13 +869,11 @@ class NetworkAnalyzer:
         Returns:
             List[Tuple[str, float]]: List of (person_name, influence_score) tuples
         """
-        if not self.graph:
-            raise ValueError("Graph not built. Call build_graph_from_neo4j() first.")
-
-        # Calculate combined influence score using multiple centrality measures
-        degree_centrality = nx.degree_centrality(self.graph)
-        betweenness_centrality = nx.betweenness_centrality(self.graph)
-        eigenvector_centrality = nx.eigenvector_centrality(self.graph, max_iter=1000)
+        # Calculate combined influence score using multiple centrality measures,
+        # sharing results with calculate_centrality_metrics for the same graph
+        degree_centrality = self._get_degree()
+        betweenness_centrality = self._get_betweenness()
+        eigenvector_centrality = self._get_eigenvector()
 
         influence_scores = {}
         for person in self.graph.nodes():
@@ -365,6 +894,7 @@ class NetworkAnalyzer:
 
         return sorted_influential[:top_n]
 
+    @requires_graph
     def find_knowledge_brokers(self, expertise_area: str) -> List[str]:
         """Find people who bridge different expertise areas.
 
@@ -374,44 +904,106 @@ class NetworkAnalyzer:
         Returns:
             List[str]: List of knowledge broker names
         """
-        if not self.graph:
-            raise ValueError("Graph not built. Call build_graph_from_neo4j() first.")
-
-        expertise_specialists = []
-        for node in self.graph.nodes(data=True):
-            person_name = node[0]
-            person_data = node[1]
-            expertise_areas = person_data.get('expertise_areas', [])
-
-            if any(expertise_area.lower() in skill.lower() for skill in expertise_areas):
-                expertise_specialists.append(person_name)
+        expertise_specialists = self._find_specialists(expertise_area)
 
         if not expertise_specialists:
             return []
 
-        # Find people who connect expertise specialists to others
-        brokers = []
-        betweenness_centrality = nx.betweenness_centrality(self.graph)
+        # Find people who connect multiple expertise specialists; this is
+        # cheap, so do it before paying for betweenness
+        candidates = [
+            person for person in self.graph.nodes()
+            if person not in expertise_specialists
+            and sum(1 for neighbor in self.graph.neighbors(person)
+                    if neighbor in expertise_specialists) >= 2
+        ]
 
-        for person in self.graph.nodes():
-            if person in expertise_specialists:
-                continue
-
-            # Check if this person bridges to expertise specialists
-            specialist_connections = 0
-            for neighbor in self.graph.neighbors(person):
-                if neighbor in expertise_specialists:
-                    specialist_connections += 1
+        if not candidates:
+            return []
 
-            # If connected to multiple specialists and has high betweenness, they're a broker
-            if specialist_connections >= 2 and betweenness_centrality.get(person, 0) > 0.1:
-                brokers.append(person)
+        # Candidates with high betweenness are brokers
+        betweenness_centrality = self._get_broker_betweenness()
+        brokers = [person for person in candidates if betweenness_centrality.get(person, 0) > 0.1]
 
         # Sort by betweenness centrality
         brokers.sort(key=lambda x: betweenness_centrality.get(x, 0), reverse=True)
 
         return brokers[:5]  # Return top 5 brokers
 
+    @requires_graph
+    def find_all_knowledge_brokers(
+        self,
+        expertise_areas: Optional[Iterable[str]] = None
+    ) -> Dict[str, List[str]]:
+        """Find knowledge brokers for many expertise areas in a single pass.
+
+        Applies the same criteria as find_knowledge_brokers, but computes
+        betweenness once and walks each adjacency list once for all areas.
+        Results are cached until the graph is replaced.
+
+        Args:
+            expertise_areas: Expertise areas to analyze (defaults to every
+                skill present in the graph)
+
+        Returns:
+            Dict[str, List[str]]: Top knowledge broker names by expertise area
+        """
+        if expertise_areas is None:
+            expertise_areas = {
+                skill
+                for _, skills in self.graph.nodes(data='expertise_areas', default=[])
+                for skill in skills or []
+            }
+
+        areas = tuple(sorted(set(expertise_areas)))
+        cache_key = ('knowledge_brokers', areas)
+        if cache_key in self._analysis_cache:
+            return self._analysis_cache[cache_key]
+
+        # Map each person to the requested areas they specialise in
+        skill_holders = self._get_expertise_index()
+        specialist_areas = defaultdict(set)
+        for area in areas:
+            area_lower = area.lower()
+            for skill, holders in skill_holders.items():
+                if area_lower in skill:
+                    for person in holders:
+                        specialist_areas[person].add(area)
+
+        brokers: Dict[str, List[str]] = {area: [] for area in areas}
+
+        # Areas each person bridges, found before paying for betweenness
+        candidates: Dict[str, List[str]] = {}
+        if specialist_areas:
+            for person in self.graph.nodes():
+                own_areas = specialist_areas.get(person, set())
+                specialist_connections = Counter()
+                for neighbor in self.graph.neighbors(person):
+                    specialist_connections.update(specialist_areas.get(neighbor, ()))
+
+                bridged_areas = [
+                    area for area, count in specialist_connections.items()
+                    if count >= 2 and area not in own_areas
+                ]
+                if bridged_areas:
+                    candidates[person] = bridged_areas
+
+        if candidates:
+            betweenness_centrality = self._get_broker_betweenness()
+
+            for person, bridged_areas in candidates.items():
+                if betweenness_centrality.get(person, 0) <= 0.1:
+                    continue
+                for area in bridged_areas:
+                    brokers[area].append(person)
+
+            for area, people in brokers.items():
+                people.sort(key=lambda x: betweenness_centrality.get(x, 0), reverse=True)
+                brokers[area] = people[:5]
+
+        self._analysis_cache[cache_key] = brokers
+        return brokers
+
     async def get_org_chart_data(self) -> Dict[str, Any]:
         """Generate organizational chart data structure.
 
@@ -421,15 +1013,17 @@ class NetworkAnalyzer:
         if not self.directed_graph:
             await self.build_directed_graph_from_neo4j()
 
-        # Find all managers (nodes with incoming "reports_to" edges)
-        managers = set()
+        # Index direct reports by manager in a single pass over the edges
+        reports_by_manager = defaultdict(list)
         reports = set()
 
-        for edge in self.directed_graph.edges():
-            report, manager = edge
-            managers.add(manager)
+        for report, manager in self.directed_graph.edges():
+            reports_by_manager[manager].append(report)
             reports.add(report)
 
+        # Managers are nodes with incoming "reports_to" edges
+        managers = set(reports_by_manager)
+
         # Find top-level managers (managers who don't report to anyone)
         top_level_managers = managers - reports
 
@@ -440,11 +1034,7 @@ class NetworkAnalyzer:
 
         def build_hierarchy(manager: str) -> Dict[str, Any]:
             """Recursively build hierarchy for a manager."""
-            direct_reports = []
-            for edge in self.directed_graph.edges():
-                report, mgr = edge
-                if mgr == manager:
-                    direct_reports.append(report)
+            direct_reports = reports_by_manager.get(manager, [])
 
             manager_data = {
                 'name': manager,
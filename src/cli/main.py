@@ -1,14 +1,23 @@
 """Command-line interface for the workplace social graph AI agent."""
 
 import asyncio
+import contextlib
 import json
+import os
+import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
 import click
 
+try:
+    from prompt_toolkit import PromptSession
+except ImportError:  # pragma: no cover - optional dependency
+    PromptSession = None
+
 from ..agents import InsightsAgent, SocialGraphAgent
-from ..config.settings import Settings
+from ..config.settings import Settings, get_settings
 from ..database.migrations import initialize_database
 
 
@@ -20,17 +29,25 @@ def cli(ctx, config):
 
     Manage and explore your workplace social network using AI-powered insights.
     """
-    # Initialize context
+    # Initialize context; settings are loaded by the first command that needs them
     ctx.ensure_object(dict)
+    ctx.obj['config'] = config
 
-    # Load settings
-    if config:
-        # Load from file if provided
-        settings = Settings(_env_file=config)
-    else:
-        settings = Settings()
 
-    ctx.obj['settings'] = settings
+def _settings(ctx: click.Context) -> Settings:
+    """Load settings on first use so help output never reads the environment.
+
+    Args:
+        ctx: Click context whose shared ``obj`` holds the loaded settings
+
+    Returns:
+        Settings: Application settings for this invocation
+    """
+    if 'settings' not in ctx.obj:
+        config = ctx.obj.get('config')
+        # Load from file if provided
+        ctx.obj['settings'] = Settings(_env_file=config) if config else get_settings()
+    return ctx.obj['settings']
 
 
 @cli.group()
@@ -52,7 +69,7 @@ def person(ctx):
 def add_person(ctx, name, email, department, role, skills, location, manager):
     """Add a new person to the social graph."""
     async def _add_person():
-        async with SocialGraphAgent(ctx.obj['settings']) as agent:
+        async with SocialGraphAgent(_settings(ctx)) as agent:
             result = await agent.process_command(
                 'add_coworker',
                 name=name,
@@ -76,7 +93,7 @@ def add_person(ctx, name, email, department, role, skills, location, manager):
 def find_experts(ctx, skill, department, limit):
     """Find experts with specific skills."""
     async def _find_experts():
-        async with SocialGraphAgent(ctx.obj['settings']) as agent:
+        async with SocialGraphAgent(_settings(ctx)) as agent:
             result = await agent.process_command(
                 'find_experts',
                 skill=skill,
@@ -95,7 +112,7 @@ def find_experts(ctx, skill, department, limit):
 def who_to_ask(ctx, topic, expertise):
     """Get recommendations for who to ask about a topic."""
     async def _who_to_ask():
-        async with SocialGraphAgent(ctx.obj['settings']) as agent:
+        async with SocialGraphAgent(_settings(ctx)) as agent:
             result = await agent.process_command(
                 'who_should_i_ask',
                 topic=topic,
@@ -119,7 +136,7 @@ def org(ctx):
 def org_chart(ctx, department):
     """Display organizational chart."""
     async def _org_chart():
-        async with SocialGraphAgent(ctx.obj['settings']) as agent:
+        async with SocialGraphAgent(_settings(ctx)) as agent:
             result = await agent.process_command(
                 'get_org_chart',
                 department=department
@@ -130,24 +147,30 @@ def org_chart(ctx, department):
 
 
 @cli.group()
+@click.option('--no-cache', is_flag=True, help='Recompute network metrics instead of reusing cached results')
 @click.pass_context
-def network(ctx):
+def network(ctx, no_cache):
     """Network analysis and insights."""
-    pass
+    if no_cache:
+        ctx.obj['settings'] = _settings(ctx).model_copy(
+            update={'centrality_cache_dir': None}
+        )
 
 
 @network.command('insights')
 @click.option('--person', help='Analyze specific person')
 @click.option('--department', help='Analyze specific department')
+@click.option('--approximate', is_flag=True, help='Sample betweenness centrality for faster results on large networks')
 @click.pass_context
-def network_insights(ctx, person, department):
+def network_insights(ctx, person, department, approximate):
     """Get network analysis insights."""
     async def _network_insights():
-        async with SocialGraphAgent(ctx.obj['settings']) as agent:
+        async with SocialGraphAgent(_settings(ctx)) as agent:
             result = await agent.process_command(
                 'get_network_insights',
                 person=person,
-                department=department
+                department=department,
+                approximate=approximate
             )
             click.echo(result)
 
@@ -159,7 +182,7 @@ def network_insights(ctx, person, department):
 def daily_report(ctx):
     """Generate daily network insights report."""
     async def _daily_report():
-        async with InsightsAgent(ctx.obj['settings']) as agent:
+        async with InsightsAgent(_settings(ctx)) as agent:
             result = await agent.generate_daily_insights()
             click.echo(result)
 
@@ -172,7 +195,7 @@ def daily_report(ctx):
 def collaboration_analysis(ctx, days):
     """Analyze collaboration patterns."""
     async def _collaboration():
-        async with InsightsAgent(ctx.obj['settings']) as agent:
+        async with InsightsAgent(_settings(ctx)) as agent:
             result = await agent.analyze_collaboration_patterns(days_back=days)
             click.echo(result)
 
@@ -184,7 +207,7 @@ def collaboration_analysis(ctx, days):
 def identify_silos(ctx):
     """Identify organizational silos."""
     async def _silos():
-        async with InsightsAgent(ctx.obj['settings']) as agent:
+        async with InsightsAgent(_settings(ctx)) as agent:
             result = await agent.identify_silos()
             click.echo(result)
 
@@ -198,7 +221,7 @@ def identify_silos(ctx):
 def recommend_connections(ctx, email, limit):
     """Recommend new connections for a person."""
     async def _recommend():
-        async with InsightsAgent(ctx.obj['settings']) as agent:
+        async with InsightsAgent(_settings(ctx)) as agent:
             result = await agent.recommend_connections(email, limit)
             click.echo(result)
 
@@ -216,16 +239,18 @@ def data(ctx):
 @click.option('--format', type=click.Choice(['csv', 'json']), default='csv', help='Export format')
 @click.option('--output', default='./export', help='Output directory')
 @click.option('--include-sensitive', is_flag=True, help='Include sensitive data')
+@click.option('--pretty', is_flag=True, help='Indent JSON output for human readers')
 @click.pass_context
-def export_data(ctx, format, output, include_sensitive):
+def export_data(ctx, format, output, include_sensitive, pretty):
     """Export network data."""
     async def _export():
-        async with SocialGraphAgent(ctx.obj['settings']) as agent:
+        async with SocialGraphAgent(_settings(ctx)) as agent:
             result = await agent.process_command(
                 'export_data',
                 format=format,
                 output_path=output,
-                include_sensitive=include_sensitive
+                include_sensitive=include_sensitive,
+                pretty=pretty
             )
             click.echo(result)
 
@@ -237,7 +262,7 @@ def export_data(ctx, format, output, include_sensitive):
 def show_stats(ctx):
     """Show network statistics."""
     async def _stats():
-        async with SocialGraphAgent(ctx.obj['settings']) as agent:
+        async with SocialGraphAgent(_settings(ctx)) as agent:
             stats = await agent.get_stats()
 
             click.echo("📊 **Network Statistics:**")
@@ -271,7 +296,7 @@ def setup(ctx):
 def init_database(ctx):
     """Initialize the database schema."""
     async def _init_db():
-        settings = ctx.obj['settings']
+        settings = _settings(ctx)
         try:
             await initialize_database()
             click.echo("✅ Database initialized successfully!")
@@ -286,7 +311,7 @@ def init_database(ctx):
 @click.pass_context
 def check_config(ctx):
     """Check configuration settings."""
-    settings = ctx.obj['settings']
+    settings = _settings(ctx)
 
     click.echo("🔧 **Configuration Check:**")
     click.echo(f"• Neo4j URI: {settings.neo4j_uri}")
@@ -308,6 +333,73 @@ def check_config(ctx):
     asyncio.run(_test_connection())
 
 
+def _read_line(text: str) -> str:
+    """Prompt for one non-empty line, reading the stdin descriptor directly.
+
+    Reading the descriptor instead of the buffered ``sys.stdin`` means a
+    thread left blocked here holds no interpreter locks at exit.
+
+    Args:
+        text: Prompt text shown to the user
+
+    Returns:
+        str: The line the user entered, without its line ending
+    """
+    try:
+        fd = sys.stdin.fileno()
+    except (AttributeError, OSError, ValueError):
+        # In-memory stdin, e.g. under click's CliRunner
+        return click.prompt(text, type=str)
+
+    encoding = sys.stdin.encoding or 'utf-8'
+    while True:
+        click.echo(f"{text}: ", nl=False)
+        line = bytearray()
+        while not line.endswith(b"\n"):
+            byte = os.read(fd, 1)
+            if not byte:
+                if not line:
+                    raise EOFError
+                break
+            line += byte
+        value = line.decode(encoding, errors='replace').rstrip("\r\n")
+        if value:
+            return value
+
+
+async def _prompt_in_daemon_thread(text: str) -> str:
+    """Read one line of input on a daemon thread without blocking the event loop.
+
+    Unlike ``asyncio.to_thread``, an abandoned read does not hold up event
+    loop shutdown, so Ctrl+C exits without waiting for Enter.
+
+    Args:
+        text: Prompt text shown to the user
+
+    Returns:
+        str: The line the user entered
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _deliver(setter, value):
+        if not future.done():
+            setter(value)
+
+    def _read():
+        try:
+            outcome = (future.set_result, _read_line(text))
+        except BaseException as e:
+            outcome = (future.set_exception, e)
+        try:
+            loop.call_soon_threadsafe(_deliver, *outcome)
+        except RuntimeError:
+            pass  # The loop closed while the user was still typing
+
+    threading.Thread(target=_read, name="chat-input", daemon=True).start()
+    return await future
+
+
 @cli.command('chat')
 @click.pass_context
 def interactive_chat(ctx):
@@ -317,16 +409,28 @@ def interactive_chat(ctx):
     async def _chat():
         try:
             click.echo("🔄 Initializing AI agent...")
-            click.echo(f"🔄 Settings: {ctx.obj['settings']}")
+            click.echo(f"🔄 Settings: {_settings(ctx)}")
 
-            async with SocialGraphAgent(ctx.obj['settings']) as agent:
+            async with SocialGraphAgent(_settings(ctx)) as agent:
                 click.echo("🤖 Welcome to the Workplace Social Graph AI Agent!")
                 click.echo("Type 'help' for available commands, or 'quit' to exit.")
                 click.echo("")
 
+                # Build the graph while the user types the first message
+                prewarm_task = asyncio.create_task(agent.prewarm())
+
+                # Read input without blocking the event loop
+                if PromptSession is not None and sys.stdin.isatty():
+                    prompt_session = PromptSession()
+                else:
+                    prompt_session = None
+
                 while True:
                     try:
-                        user_input = click.prompt("You", type=str)
+                        if prompt_session is not None:
+                            user_input = await prompt_session.prompt_async("You: ")
+                        else:
+                            user_input = await _prompt_in_daemon_thread("You")
 
                         if user_input.lower() in ['quit', 'exit', 'bye']:
                             click.echo("👋 Goodbye!")
@@ -335,13 +439,18 @@ def interactive_chat(ctx):
                         response = await agent.chat(user_input)
                         click.echo(f"\n🤖 {response}\n")
 
-                    except (KeyboardInterrupt, EOFError):
+                    except (KeyboardInterrupt, EOFError, click.Abort, asyncio.CancelledError):
+                        # asyncio.run turns Ctrl+C into cancellation of this task
                         click.echo("\n👋 Goodbye!")
                         break
                     except Exception as e:
                         click.echo(f"❌ Error: {e}")
                         import traceback
                         click.echo(f"Traceback: {traceback.format_exc()}")
+
+                prewarm_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await prewarm_task
         except Exception as e:
             click.echo(f"❌ Failed to initialize agent: {e}")
             import traceback
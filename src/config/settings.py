@@ -1,6 +1,7 @@
 """Configuration management for the social graph AI agent system."""
 
-from typing import Optional
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -33,6 +34,26 @@ class Settings(BaseSettings):
         default="neo4j",
         description="Neo4j database name"
     )
+    neo4j_max_connection_pool_size: int = Field(
+        default=50,
+        description="Maximum number of pooled Neo4j connections"
+    )
+    neo4j_connection_acquisition_timeout: float = Field(
+        default=60.0,
+        description="Seconds to wait for a free pooled Neo4j connection"
+    )
+    neo4j_max_connection_lifetime: float = Field(
+        default=3600.0,
+        description="Seconds before a pooled Neo4j connection is retired"
+    )
+    person_cache_size: int = Field(
+        default=1024,
+        description="Maximum people kept in the by-name lookup cache (0 disables it)"
+    )
+    person_cache_ttl: float = Field(
+        default=30.0,
+        description="Seconds a cached by-name person lookup stays valid"
+    )
 
     # Application Configuration
     app_name: str = Field(
@@ -81,31 +102,57 @@ class Settings(BaseSettings):
         default=1000,
         description="Batch size for data export operations"
     )
+    centrality_cache_dir: Optional[str] = Field(
+        default="~/.cache/robo-peoples-person",
+        description="Directory caching centrality results for the latest graph (None disables caching)"
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping the cached database URL if credentials change."""
+        super().__setattr__(name, value)
+        if name in ("neo4j_uri", "neo4j_user", "neo4j_password"):
+            self.__dict__.pop("database_url", None)
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "Settings":
+        """Copy the settings without carrying over a cached database URL.
 
-    @property
+        Args:
+            update: Field values to change in the copy
+            deep: Whether to deep-copy field values
+
+        Returns:
+            Settings: The copied settings instance.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("database_url", None)
+        return copied
+
+    @cached_property
     def database_url(self) -> str:
         """Construct the full database URL with credentials.
 
+        Computed once per instance and cached until a connection field changes.
+
         Returns:
             str: Complete Neo4j connection URL with credentials.
         """
         # Extract the host part from the URI
-        if "://" in self.neo4j_uri:
-            protocol, host = self.neo4j_uri.split("://", 1)
-        else:
+        protocol, separator, host = self.neo4j_uri.partition("://")
+        if not separator:
             protocol, host = "bolt", self.neo4j_uri
 
         return f"{protocol}://{self.neo4j_user}:{self.neo4j_password}@{host}"
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get application settings singleton.
 
+    The instance is built on first call and reused afterwards; call
+    ``get_settings.cache_clear()`` to reload it from the environment.
+
     Returns:
         Settings: Application settings instance.
     """
     return Settings()
-
-
-# Global settings instance
-# settings = get_settings()
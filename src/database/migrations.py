@@ -1,12 +1,123 @@
 """Database migrations for the workplace social graph system."""
 
+import asyncio
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set
 
-from .neo4j_manager import Neo4jManager
+from .neo4j_manager import Neo4jManager, get_neo4j_manager
 
 logger = logging.getLogger(__name__)
 
+# Name of the throwaway node used to check that the schema accepts writes
+_SCHEMA_TEST_PERSON = "Schema Test Person"
+
+
+# Lookup indexes by graph pattern, as {index name: property}. Names are kept
+# stable so down() also drops indexes created by earlier releases.
+_LOOKUP_INDEXES: Dict[str, Dict[str, str]] = {
+    "(n:Person)": {
+        "person_name_lookup": "name",
+        "person_department_lookup": "department",
+        "person_role_lookup": "role",
+        "person_email_lookup": "email",
+        "person_expertise_lookup": "expertise_areas",
+    },
+    "(n:Interaction)": {
+        "interaction_date_lookup": "date",
+        "interaction_type_lookup": "interaction_type",
+        "interaction_person_lookup": "with_person",
+    },
+    "()-[n:WORKS_WITH]-()": {
+        "relationship_type_lookup": "type",
+    },
+}
+
+
+def _create_index_statements() -> List[str]:
+    """Build the CREATE INDEX statements for every lookup index.
+
+    Returns:
+        List[str]: One idempotent statement per index
+    """
+    return [
+        f"CREATE INDEX {name} IF NOT EXISTS FOR {pattern} ON (n.{prop})"
+        for pattern, indexes in _LOOKUP_INDEXES.items()
+        for name, prop in indexes.items()
+    ]
+
+
+def _drop_index_statements() -> List[str]:
+    """Build the DROP INDEX statements for every lookup index.
+
+    Returns:
+        List[str]: One idempotent statement per index
+    """
+    return [
+        f"DROP INDEX {name} IF EXISTS"
+        for indexes in _LOOKUP_INDEXES.values()
+        for name in indexes
+    ]
+
+
+async def _run_statements(tx, statements: List[str]) -> None:
+    """Transaction function that runs each statement in order."""
+    for statement in statements:
+        await tx.run(statement)
+
+
+async def _run_write(tx, query: str, **params: Any) -> None:
+    """Transaction function that runs one write query and consumes its result."""
+    result = await tx.run(query, **params)
+    await result.consume()
+
+
+async def _apply_schema_statement(manager: Neo4jManager, statement: str, action: str, kind: str) -> None:
+    """Apply one schema statement in its own session, logging instead of raising.
+
+    Args:
+        manager: Neo4j database manager
+        statement: Cypher schema statement to run
+        action: Past-tense verb for log messages, e.g. "Applied"
+        kind: Statement kind for log messages, e.g. "index"
+    """
+    try:
+        async with manager.session() as session:
+            await session.run(statement)
+        logger.info("✓ %s %s: %s", action, kind, statement)
+    except Exception as e:
+        logger.warning("⚠ %s statement failed: %s", kind.capitalize(), e)
+
+
+async def _apply_schema_statements(
+    manager: Neo4jManager, session, statements: List[str], action: str, kind: str
+) -> None:
+    """Apply schema statements in a single managed write transaction.
+
+    The driver retries the transaction on transient errors. If the batch
+    still fails (e.g. an equivalent index exists under another name),
+    the statements are retried individually and concurrently, each on its own
+    pooled session, so one conflict does not block the rest.
+
+    Args:
+        manager: Neo4j database manager, used for the concurrent retry
+        session: Open Neo4j session for the batched transaction
+        statements: Cypher schema statements to run
+        action: Past-tense verb for log messages, e.g. "Applied"
+        kind: Statement kind for log messages, e.g. "index"
+    """
+    try:
+        await session.execute_write(_run_statements, statements)
+    except Exception as e:
+        logger.warning("⚠ Batched %s statements failed, retrying individually: %s", kind, e)
+        await asyncio.gather(*(
+            _apply_schema_statement(manager, statement, action, kind)
+            for statement in statements
+        ))
+        return
+
+    for statement in statements:
+        logger.info("✓ %s %s: %s", action, kind, statement)
+
 
 class Migration:
     """Base migration class."""
@@ -49,83 +160,51 @@ class InitialWorkplaceGraphMigration(Migration):
             ]
 
             # Create indexes for performance
-            indexes = [
-                # Person lookups
-                "CREATE INDEX person_name_lookup IF NOT EXISTS FOR (p:Person) ON (p.name)",
-                "CREATE INDEX person_department_lookup IF NOT EXISTS FOR (p:Person) ON (p.department)",
-                "CREATE INDEX person_role_lookup IF NOT EXISTS FOR (p:Person) ON (p.role)",
-                "CREATE INDEX person_email_lookup IF NOT EXISTS FOR (p:Person) ON (p.email)",
-
-                # Expertise searches
-                "CREATE INDEX person_expertise_lookup IF NOT EXISTS FOR (p:Person) ON (p.expertise_areas)",
-
-                # Interaction lookups
-                "CREATE INDEX interaction_date_lookup IF NOT EXISTS FOR (i:Interaction) ON (i.date)",
-                "CREATE INDEX interaction_type_lookup IF NOT EXISTS FOR (i:Interaction) ON (i.interaction_type)",
-                "CREATE INDEX interaction_person_lookup IF NOT EXISTS FOR (i:Interaction) ON (i.with_person)",
-
-                # Relationship lookups
-                "CREATE INDEX relationship_type_lookup IF NOT EXISTS FOR ()-[r:WORKS_WITH]-() ON (r.type)"
-            ]
+            indexes = _create_index_statements()
+
+            # Apply constraints, then indexes, one transaction each
+            await _apply_schema_statements(manager, session, constraints, "Applied", "constraint")
+            await _apply_schema_statements(manager, session, indexes, "Applied", "index")
 
-            # Apply constraints
-            for constraint in constraints:
-                try:
-                    await session.run(constraint)
-                    logger.info(f"✓ Applied constraint: {constraint}")
-                except Exception as e:
-                    logger.warning(f"⚠ Constraint already exists or failed: {e}")
-
-            # Apply indexes
-            for index in indexes:
-                try:
-                    await session.run(index)
-                    logger.info(f"✓ Applied index: {index}")
-                except Exception as e:
-                    logger.warning(f"⚠ Index already exists or failed: {e}")
-
-            # Create sample data structure validation
-            await self._create_validation_queries(session)
+            # Round-trip a throwaway node only when debugging schema problems
+            if manager.settings.debug:
+                await self._create_validation_queries(session)
 
     async def _create_validation_queries(self, session) -> None:
         """Create validation queries to ensure schema works correctly."""
         # Test person creation
         test_query = """
-        MERGE (p:Person {name: 'Schema Test Person'})
-        SET p.role = 'Test Role',
-            p.department = 'Test Department',
-            p.expertise_areas = ['Testing', 'Schema Validation'],
+        MERGE (p:Person {name: $name})
+        SET p.role = $role,
+            p.department = $department,
+            p.expertise_areas = $expertise_areas,
             p.created_at = datetime(),
             p.updated_at = datetime()
         RETURN p.name as name
         """
 
-        result = await session.run(test_query)
+        result = await session.run(
+            test_query,
+            name=_SCHEMA_TEST_PERSON,
+            role="Test Role",
+            department="Test Department",
+            expertise_areas=["Testing", "Schema Validation"],
+        )
         record = await result.single()
 
         if record:
-            logger.info(f"✓ Schema validation: Successfully created test person")
+            logger.info("✓ Schema validation: Successfully created test person")
 
             # Clean up test data
-            cleanup_query = "MATCH (p:Person {name: 'Schema Test Person'}) DELETE p"
-            await session.run(cleanup_query)
+            cleanup_query = "MATCH (p:Person {name: $name}) DELETE p"
+            await session.run(cleanup_query, name=_SCHEMA_TEST_PERSON)
             logger.info("✓ Schema validation: Cleaned up test data")
 
     async def down(self, manager: Neo4jManager) -> None:
         """Remove the workplace graph schema."""
         async with manager.session() as session:
             # Drop indexes
-            drop_indexes = [
-                "DROP INDEX person_name_lookup IF EXISTS",
-                "DROP INDEX person_department_lookup IF EXISTS",
-                "DROP INDEX person_role_lookup IF EXISTS",
-                "DROP INDEX person_email_lookup IF EXISTS",
-                "DROP INDEX person_expertise_lookup IF EXISTS",
-                "DROP INDEX interaction_date_lookup IF EXISTS",
-                "DROP INDEX interaction_type_lookup IF EXISTS",
-                "DROP INDEX interaction_person_lookup IF EXISTS",
-                "DROP INDEX relationship_type_lookup IF EXISTS"
-            ]
+            drop_indexes = _drop_index_statements()
 
             # Drop constraints
             drop_constraints = [
@@ -133,19 +212,8 @@ class InitialWorkplaceGraphMigration(Migration):
                 "DROP CONSTRAINT interaction_id_unique IF EXISTS"
             ]
 
-            for drop_index in drop_indexes:
-                try:
-                    await session.run(drop_index)
-                    logger.info(f"✓ Dropped index: {drop_index}")
-                except Exception as e:
-                    logger.warning(f"⚠ Index drop failed: {e}")
-
-            for drop_constraint in drop_constraints:
-                try:
-                    await session.run(drop_constraint)
-                    logger.info(f"✓ Dropped constraint: {drop_constraint}")
-                except Exception as e:
-                    logger.warning(f"⚠ Constraint drop failed: {e}")
+            await _apply_schema_statements(manager, session, drop_indexes, "Dropped", "index")
+            await _apply_schema_statements(manager, session, drop_constraints, "Dropped", "constraint")
 
 
 class WorkplaceHierarchyMigration(Migration):
@@ -156,27 +224,60 @@ class WorkplaceHierarchyMigration(Migration):
 
     async def up(self, manager: Neo4jManager) -> None:
         """Add workplace hierarchy constraints."""
+        async with manager.session():
+            # Self-management checks stay in application logic (no APOC triggers)
+            logger.info("✓ Workplace hierarchy validation will be handled in application logic")
+
+    async def down(self, manager: Neo4jManager) -> None:
+        """Remove workplace hierarchy constraints."""
+        async with manager.session():
+            # Nothing was created by up(), so there is nothing to drop
+            logger.info("✓ Workplace hierarchy constraints removed")
+
+
+class RelationshipTypeMigration(Migration):
+    """Migration to require a type on every WORKS_WITH relationship."""
+
+    def __init__(self):
+        super().__init__("relationship_type", "0.4.0")
+
+    async def up(self, manager: Neo4jManager) -> None:
+        """Add the WORKS_WITH type existence constraint."""
         async with manager.session() as session:
-            # Add validation for hierarchical relationships
-            hierarchy_procedures = [
-                """
-                // Procedure to validate manager-report relationships
-                CALL apoc.trigger.add('validate_hierarchy',
-                "MATCH (manager:Person)<-[:WORKS_WITH {type: 'manager'}]-(report:Person)
-                 WHERE manager.name = report.name
-                 DELETE r", {phase:'before'})
-                """,
+            # Property existence constraints need Neo4j Enterprise, so failures are logged
+            constraints = [
+                "CREATE CONSTRAINT works_with_type_exists IF NOT EXISTS "
+                "FOR ()-[r:WORKS_WITH]-() REQUIRE r.type IS NOT NULL"
             ]
+            await _apply_schema_statements(manager, session, constraints, "Applied", "constraint")
 
-            # Note: This requires APOC plugin - for now we'll skip and handle in application logic
-            logger.info("✓ Workplace hierarchy validation will be handled in application logic")
+    async def down(self, manager: Neo4jManager) -> None:
+        """Remove the WORKS_WITH type existence constraint."""
+        async with manager.session() as session:
+            drop_constraints = ["DROP CONSTRAINT works_with_type_exists IF EXISTS"]
+            await _apply_schema_statements(manager, session, drop_constraints, "Dropped", "constraint")
+
+
+class MigrationTrackingMigration(Migration):
+    """Migration to enforce one tracking node per applied migration version."""
+
+    def __init__(self):
+        super().__init__("migration_tracking", "0.3.0")
+
+    async def up(self, manager: Neo4jManager) -> None:
+        """Add the applied-migration uniqueness constraint."""
+        async with manager.session() as session:
+            constraints = [
+                "CREATE CONSTRAINT applied_migration_unique IF NOT EXISTS "
+                "FOR (m:AppliedMigration) REQUIRE m.version IS UNIQUE"
+            ]
+            await _apply_schema_statements(manager, session, constraints, "Applied", "constraint")
 
     async def down(self, manager: Neo4jManager) -> None:
-        """Remove workplace hierarchy constraints."""
-        # Remove triggers if they were created
+        """Remove the applied-migration uniqueness constraint."""
         async with manager.session() as session:
-            # For now, this is just a placeholder since no actual triggers were created
-            logger.info("✓ Workplace hierarchy constraints removed")
+            drop_constraints = ["DROP CONSTRAINT applied_migration_unique IF EXISTS"]
+            await _apply_schema_statements(manager, session, drop_constraints, "Dropped", "constraint")
 
 
 class MigrationManager:
@@ -192,6 +293,8 @@ class MigrationManager:
         self.migrations: List[Migration] = [
             InitialWorkplaceGraphMigration(),
             WorkplaceHierarchyMigration(),
+            MigrationTrackingMigration(),
+            RelationshipTypeMigration(),
         ]
 
     async def get_applied_migrations(self) -> List[str]:
@@ -201,10 +304,13 @@ class MigrationManager:
             List[str]: List of applied migration versions
         """
         async with self.manager.session() as session:
-            # Check if migration tracking node exists
+            # Each applied version has its own node; older databases may still
+            # list versions on a single MigrationTracker node
             check_query = """
-            MATCH (m:MigrationTracker)
-            RETURN m.applied_migrations as applied
+            OPTIONAL MATCH (m:AppliedMigration)
+            WITH collect(m.version) AS applied
+            OPTIONAL MATCH (t:MigrationTracker)
+            RETURN applied + coalesce(t.applied_migrations, []) AS applied
             """
 
             result = await session.run(check_query)
@@ -214,19 +320,21 @@ class MigrationManager:
                 return record["applied"]
             return []
 
-    async def apply_migration(self, migration: Migration) -> None:
+    async def apply_migration(self, migration: Migration, applied: Optional[Set[str]] = None) -> None:
         """Apply a single migration.
 
         Args:
             migration: Migration to apply
+            applied: Versions already applied, as fetched by the caller; updated
+                in place on success. Fetched from the database when omitted.
         """
-        applied_migrations = await self.get_applied_migrations()
+        applied_migrations = applied if applied is not None else set(await self.get_applied_migrations())
 
         if migration.version in applied_migrations:
-            logger.info(f"⏭ Migration {migration.version} already applied")
+            logger.info("⏭ Migration %s already applied", migration.version)
             return
 
-        logger.info(f"🔄 Applying migration: {migration.name} (v{migration.version})")
+        logger.info("🔄 Applying migration: %s (v%s)", migration.name, migration.version)
 
         try:
             await migration.up(self.manager)
@@ -234,29 +342,26 @@ class MigrationManager:
             # Track migration as applied
             async with self.manager.session() as session:
                 track_query = """
-                MERGE (m:MigrationTracker)
-                ON CREATE SET m.applied_migrations = [$version]
-                ON MATCH SET m.applied_migrations =
-                    CASE
-                        WHEN $version IN m.applied_migrations
-                        THEN m.applied_migrations
-                        ELSE m.applied_migrations + $version
-                    END,
-                    m.last_applied = datetime()
+                MERGE (m:AppliedMigration {version: $version})
+                SET m.applied_at = datetime()
                 """
-                await session.run(track_query, version=migration.version)
+                await session.execute_write(_run_write, track_query, version=migration.version)
+
+            if applied is not None:
+                applied.add(migration.version)
 
-            logger.info(f"✅ Successfully applied migration: {migration.name}")
+            logger.info("✅ Successfully applied migration: %s", migration.name)
 
         except Exception as e:
-            logger.error(f"❌ Failed to apply migration {migration.name}: {e}")
+            logger.error("❌ Failed to apply migration %s: %s", migration.name, e)
             raise
 
     async def migrate(self) -> None:
         """Apply all pending migrations."""
         logger.info("🚀 Starting database migration")
 
-        applied_migrations = await self.get_applied_migrations()
+        # Fetch once; apply_migration keeps the set current as it goes
+        applied_migrations = set(await self.get_applied_migrations())
         pending_migrations = [
             m for m in self.migrations
             if m.version not in applied_migrations
@@ -266,10 +371,10 @@ class MigrationManager:
             logger.info("✅ All migrations are up to date")
             return
 
-        logger.info(f"📋 Found {len(pending_migrations)} pending migrations")
+        logger.info("📋 Found %d pending migrations", len(pending_migrations))
 
         for migration in pending_migrations:
-            await self.apply_migration(migration)
+            await self.apply_migration(migration, applied_migrations)
 
         logger.info("🎉 All migrations completed successfully")
 
@@ -279,9 +384,9 @@ class MigrationManager:
         Args:
             target_version: Version to rollback to (optional)
         """
-        logger.info(f"🔄 Rolling back migrations to version: {target_version or 'initial'}")
+        logger.info("🔄 Rolling back migrations to version: %s", target_version or 'initial')
 
-        applied_migrations = await self.get_applied_migrations()
+        applied_migrations = set(await self.get_applied_migrations())
 
         # Find migrations to rollback (in reverse order)
         rollback_migrations = []
@@ -292,7 +397,7 @@ class MigrationManager:
                     break
 
         for migration in rollback_migrations:
-            logger.info(f"🔄 Rolling back migration: {migration.name} (v{migration.version})")
+            logger.info("🔄 Rolling back migration: %s (v%s)", migration.name, migration.version)
 
             try:
                 await migration.down(self.manager)
@@ -300,16 +405,18 @@ class MigrationManager:
                 # Remove from applied migrations
                 async with self.manager.session() as session:
                     update_query = """
-                    MATCH (m:MigrationTracker)
-                    SET m.applied_migrations = [x IN m.applied_migrations WHERE x <> $version],
-                        m.last_rollback = datetime()
+                    OPTIONAL MATCH (m:AppliedMigration {version: $version})
+                    DELETE m
+                    WITH 1 AS done
+                    OPTIONAL MATCH (t:MigrationTracker)
+                    SET t.applied_migrations = [x IN t.applied_migrations WHERE x <> $version]
                     """
-                    await session.run(update_query, version=migration.version)
+                    await session.execute_write(_run_write, update_query, version=migration.version)
 
-                logger.info(f"✅ Successfully rolled back migration: {migration.name}")
+                logger.info("✅ Successfully rolled back migration: %s", migration.name)
 
             except Exception as e:
-                logger.error(f"❌ Failed to rollback migration {migration.name}: {e}")
+                logger.error("❌ Failed to rollback migration %s: %s", migration.name, e)
                 raise
 
         logger.info("🎉 Rollback completed successfully")
@@ -317,8 +424,6 @@ class MigrationManager:
 
 async def initialize_database() -> None:
     """Initialize the database with all necessary migrations."""
-    from .neo4j_manager import get_neo4j_manager
-
     logger.info("🔧 Initializing workplace social graph database")
 
     try:
@@ -331,23 +436,31 @@ async def initialize_database() -> None:
         logger.info("✅ Database initialization completed successfully")
 
     except Exception as e:
-        logger.error(f"❌ Database initialization failed: {e}")
+        logger.error("❌ Database initialization failed: %s", e)
         raise
 
 
 async def reset_database() -> None:
     """Reset the database (WARNING: Deletes all data)."""
-    from .neo4j_manager import get_neo4j_manager
-
     logger.warning("⚠️  RESETTING DATABASE - ALL DATA WILL BE DELETED")
 
     try:
         manager = await get_neo4j_manager()
 
         async with manager.session() as session:
-            # Delete all nodes and relationships
-            delete_query = "MATCH (n) DETACH DELETE n"
-            await session.run(delete_query)
+            # Delete all nodes and relationships in bounded batches
+            batch_delete_query = """
+            MATCH (n)
+            CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF $batch ROWS
+            """
+            try:
+                result = await session.run(batch_delete_query, batch=manager.settings.export_batch_size)
+                await result.consume()
+            except Exception as e:
+                # CALL ... IN TRANSACTIONS needs Neo4j 4.4+
+                logger.warning("⚠ Batched delete failed, deleting in one transaction: %s", e)
+                result = await session.run("MATCH (n) DETACH DELETE n")
+                await result.consume()
 
             logger.info("🗑️  All data deleted")
 
@@ -357,5 +470,5 @@ async def reset_database() -> None:
         logger.info("🎉 Database reset completed successfully")
 
     except Exception as e:
-        logger.error(f"❌ Database reset failed: {e}")
+        logger.error("❌ Database reset failed: %s", e)
         raise
@@ -1,13 +1,55 @@
 """Core data models for workplace relationship management."""
 
+import json
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
-class WorkRelationshipType(str, Enum):
+
+def _dump_json(value: Any) -> str:
+    """Encode a value as JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, default=str).decode()
+    return json.dumps(value, default=str)
+
+
+def _load_json(text: Any) -> Any:
+    """Decode JSON text written by ``_dump_json``."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+class _ValueEnum(str, Enum):
+    """String enum with a direct value-to-member lookup."""
+
+    @classmethod
+    def from_value(cls, value: str) -> "_ValueEnum":
+        """Look up a member by its value without going through ``Enum.__call__``.
+
+        Args:
+            value: Raw string value, e.g. from Neo4j or user input
+
+        Returns:
+            The matching enum member
+
+        Raises:
+            ValueError: If no member has this value
+        """
+        try:
+            return cls._value2member_map_[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+class WorkRelationshipType(_ValueEnum):
     """Types of workplace relationships."""
     MANAGER = "manager"
     DIRECT_REPORT = "direct_report"
@@ -19,7 +61,13 @@ class WorkRelationshipType(str, Enum):
     MENTEE = "mentee"
 
 
-class CommunicationPreference(str, Enum):
+_HIERARCHICAL_RELATIONSHIP_TYPES = frozenset({
+    WorkRelationshipType.MANAGER,
+    WorkRelationshipType.DIRECT_REPORT,
+})
+
+
+class CommunicationPreference(_ValueEnum):
     """Communication preferences for workplace interactions."""
     EMAIL = "email"
     VIDEO_CALL = "video_call"
@@ -29,7 +77,7 @@ class CommunicationPreference(str, Enum):
     ASYNC_MESSAGE = "async_message"
 
 
-class InteractionType(str, Enum):
+class InteractionType(_ValueEnum):
     """Types of workplace interactions."""
     MEETING = "meeting"
     EMAIL = "email"
@@ -43,7 +91,45 @@ class InteractionType(str, Enum):
     TEAM_MEETING = "team_meeting"
 
 
-class Person(BaseModel):
+class _RecordModel(BaseModel):
+    """Base for models built per row when reading from Neo4j."""
+
+    # Pin the cheap paths explicitly: unknown node properties are dropped,
+    # assignments and nested instances are not re-validated
+    model_config = ConfigDict(
+        extra="ignore",
+        revalidate_instances="never",
+        validate_assignment=False,
+    )
+
+    @classmethod
+    def from_neo4j(cls, record: Mapping[str, Any]) -> "_RecordModel":
+        """Build a model from a node or map written by this application.
+
+        Skips validation, so use it only for trusted database reads; user
+        and CLI input should go through the normal constructor.
+
+        Args:
+            record: Node or map of stored properties
+
+        Returns:
+            The model instance, with defaults filled for missing fields
+        """
+        return cls.model_construct(**record)
+
+    def to_neo4j(self) -> Dict[str, Any]:
+        """Dump the model to the property map written to Neo4j.
+
+        Calls the compiled serializer directly, skipping the keyword
+        handling ``model_dump`` repeats on every call.
+
+        Returns:
+            Dict[str, Any]: Field values keyed by field name
+        """
+        return self.__pydantic_serializer__.to_python(self)
+
+
+class Person(_RecordModel):
     """Coworker entity in the workplace social graph."""
 
     name: str = Field(..., description="Full name of the person")
@@ -91,13 +177,58 @@ class Person(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
+    @classmethod
+    def bulk_create(cls, rows: List[Dict[str, Any]]) -> List["Person"]:
+        """Build many people sharing one creation timestamp.
+
+        Args:
+            rows: Field values for each person; explicit timestamps win
+
+        Returns:
+            List[Person]: Validated person models
+        """
+        now = datetime.now()
+        return [
+            cls.model_validate({"created_at": now, "updated_at": now, **row})
+            for row in rows
+        ]
+
     def update_last_interaction(self) -> None:
         """Update the last interaction timestamp."""
-        self.last_interaction = datetime.now()
-        self.updated_at = datetime.now()
+        now = datetime.now()
+        self.last_interaction = now
+        self.updated_at = now
+
+    @classmethod
+    def from_neo4j(cls, record: Mapping[str, Any]) -> "Person":
+        """Build a person from a stored node, decoding its JSON attributes.
+
+        Args:
+            record: Node or map of stored properties
+
+        Returns:
+            Person: The person, with defaults filled for missing fields
+        """
+        attributes = record.get("attributes")
+        if isinstance(attributes, (str, bytes)):
+            record = {**record, "attributes": _load_json(attributes)}
+        return super().from_neo4j(record)
 
+    def to_neo4j(self) -> Dict[str, Any]:
+        """Dump the person to the property map written to Neo4j.
 
-class WorkRelationship(BaseModel):
+        Node properties cannot hold maps, so ``attributes`` is stored as
+        JSON text; temporal fields stay native so Cypher can compare them.
+
+        Returns:
+            Dict[str, Any]: Field values keyed by field name
+        """
+        row = super().to_neo4j()
+        row["attributes"] = _dump_json(row["attributes"])
+        return row
+
+
+class WorkRelationship(_RecordModel):
     """Professional relationship between two people."""
 
     from_person: str = Field(..., description="Name of the first person")
@@ -126,13 +257,10 @@ class WorkRelationship(BaseModel):
 
     def is_hierarchical(self) -> bool:
         """Check if the relationship is hierarchical (manager/direct_report)."""
-        return self.relationship_type in [
-            WorkRelationshipType.MANAGER,
-            WorkRelationshipType.DIRECT_REPORT
-        ]
+        return self.relationship_type in _HIERARCHICAL_RELATIONSHIP_TYPES
 
 
-class Interaction(BaseModel):
+class Interaction(_RecordModel):
     """Record of a specific interaction with a coworker."""
 
     with_person: str = Field(..., description="Name of the person interacted with")
@@ -194,7 +322,7 @@ class ExpertiseQuery(BaseModel):
     )
 
 
-class NetworkMetrics(BaseModel):
+class NetworkMetrics(_RecordModel):
     """Network analysis metrics for a person or group."""
 
     person_name: Optional[str] = Field(None, description="Person name if individual metrics")
@@ -2,17 +2,263 @@
 
 import asyncio
 import logging
+import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
-from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncSession
+from neo4j import READ_ACCESS, AsyncDriver, AsyncGraphDatabase, AsyncSession
 from neo4j.exceptions import AuthError, ServiceUnavailable
 
-from ..config.settings import Settings
+from ..config.settings import Settings, get_settings
 from .models import Interaction, Person, WorkRelationship, WorkRelationshipType
 
 logger = logging.getLogger(__name__)
 
+# Records pulled per await when a result is consumed in chunks
+_FETCH_CHUNK_SIZE = 1000
+
+_ADD_COWORKERS_QUERY = """
+UNWIND $rows AS row
+MERGE (p:Person {name: row.name})
+SET p.email = row.email,
+    p.phone = row.phone,
+    p.role = row.role,
+    p.department = row.department,
+    p.manager = row.manager,
+    p.expertise_areas = row.expertise_areas,
+    p.communication_preference = row.communication_preference,
+    p.availability = row.availability,
+    p.timezone = row.timezone,
+    p.last_interaction = row.last_interaction,
+    p.interaction_frequency = row.interaction_frequency,
+    p.notes = row.notes,
+    p.attributes = row.attributes,
+    p.created_at = row.created_at,
+    p.updated_at = row.updated_at
+"""
+
+# Creates missing endpoints, the edge and, for bidirectional rows, the
+# reverse edge in one statement
+_ADD_RELATIONSHIPS_QUERY = """
+UNWIND $rows AS row
+MERGE (from:Person {name: row.from_person})
+ON CREATE SET from.created_at = datetime(),
+              from.updated_at = datetime()
+MERGE (to:Person {name: row.to_person})
+ON CREATE SET to.created_at = datetime(),
+              to.updated_at = datetime()
+MERGE (from)-[r:WORKS_WITH {type: row.relationship_type}]->(to)
+SET r += row.properties
+FOREACH (_ IN CASE WHEN row.properties.bidirectional THEN [1] ELSE [] END |
+    MERGE (to)-[reverse:WORKS_WITH {type: row.relationship_type}]->(from)
+    SET reverse += row.properties
+)
+"""
+
+# Rows are sorted by date so each person ends with their latest interaction
+_ADD_INTERACTIONS_QUERY = """
+UNWIND $rows AS row
+MERGE (p:Person {name: row.with_person})
+ON CREATE SET p.created_at = datetime()
+CREATE (i:Interaction {
+    with_person: row.with_person,
+    interaction_type: row.interaction_type,
+    topic: row.topic,
+    outcome: row.outcome,
+    duration_minutes: row.duration_minutes,
+    project: row.project,
+    location: row.location,
+    participants: row.participants,
+    date: row.date,
+    notes: row.notes,
+    follow_up_required: row.follow_up_required,
+    follow_up_date: row.follow_up_date
+})
+CREATE (p)-[:HAD_INTERACTION]->(i)
+SET p.last_interaction = row.date,
+    p.updated_at = row.date
+"""
+
+
+_ADD_COWORKER_QUERY = """
+MERGE (p:Person {name: $name})
+SET p.email = $email,
+    p.phone = $phone,
+    p.role = $role,
+    p.department = $department,
+    p.manager = $manager,
+    p.expertise_areas = $expertise_areas,
+    p.communication_preference = $communication_preference,
+    p.availability = $availability,
+    p.timezone = $timezone,
+    p.last_interaction = $last_interaction,
+    p.interaction_frequency = $interaction_frequency,
+    p.notes = $notes,
+    p.attributes = $attributes,
+    p.created_at = $created_at,
+    p.updated_at = $updated_at
+"""
+
+_ENSURE_PERSON_QUERY = """
+MERGE (p:Person {name: $name})
+ON CREATE SET p.created_at = datetime(),
+             p.updated_at = datetime()
+"""
+
+# Name and department lookups carry no index hints: a hint on a missing
+# index is an error, so the planner picks the migration-created indexes
+# when they exist and falls back to a label scan otherwise
+_GET_PERSON_BY_NAME_QUERY = "MATCH (p:Person {name: $name}) RETURN p"
+
+_FIND_PERSON_BY_EMAIL_QUERY = "MATCH (p:Person {email: $email}) RETURN p"
+
+_COUNT_PEOPLE_QUERY = "MATCH (p:Person) RETURN count(p) as count"
+
+_COUNT_RELATIONSHIPS_QUERY = "MATCH ()-[r:WORKS_WITH|REPORTS_TO|INTERACTS_WITH]->() RETURN count(r) as count"
+
+# Optional filters are pre-built variants keyed by whether the filter is set,
+# so every call sends one of a few fixed strings and hits the plan cache
+_FIND_EXPERTS_QUERIES = {
+    False: """
+MATCH (p:Person)
+WHERE any(skill IN p.expertise_areas WHERE skill CONTAINS $expertise)
+RETURN p ORDER BY p.name
+""",
+    True: """
+MATCH (p:Person)
+WHERE p.department = $department
+  AND any(skill IN p.expertise_areas WHERE skill CONTAINS $expertise)
+RETURN p ORDER BY p.name
+""",
+}
+
+# OPTIONAL MATCH keeps skills with no experts as empty groups
+_FIND_EXPERTS_MULTI_QUERIES = {
+    False: """
+UNWIND $skills AS skill
+OPTIONAL MATCH (p:Person)
+WHERE any(area IN p.expertise_areas WHERE area CONTAINS skill)
+WITH skill, p ORDER BY p.name
+RETURN skill, collect(p) AS people
+""",
+    True: """
+UNWIND $skills AS skill
+OPTIONAL MATCH (p:Person)
+WHERE p.department = $department
+  AND any(area IN p.expertise_areas WHERE area CONTAINS skill)
+WITH skill, p ORDER BY p.name
+RETURN skill, collect(p) AS people
+""",
+}
+
+# The reporting chain is walked one manager at a time rather than expanded
+# as a variable-length path, which enumerates every route on diamond-shaped
+# hierarchies; the depth cap bounds the walk on very deep data
+_REPORTING_CHAIN_MAX_DEPTH = 20
+
+# Several managers are possible in messy data; the first by name is followed
+_MANAGER_OF_QUERY = """
+MATCH (:Person {name: $name})-[:WORKS_WITH {type: 'manager'}]->(m:Person)
+RETURN m ORDER BY m.name LIMIT 1
+"""
+
+_DIRECT_REPORTS_QUERY = """
+MATCH (manager:Person {name: $name})<-[:WORKS_WITH {type: 'manager'}]-(report:Person)
+RETURN report
+ORDER BY report.name
+"""
+
+_COLLABORATION_PATH_QUERY = """
+MATCH path = shortestPath((from:Person {name: $from_person})-[:WORKS_WITH*]-(to:Person {name: $to_person}))
+RETURN [node in nodes(path) | node.name] as path
+"""
+
+_TEAM_MEMBERS_QUERIES = {
+    None: "MATCH (p:Person) RETURN p ORDER BY p.name",
+    "department": """
+MATCH (p:Person)
+WHERE p.department = $department
+RETURN p ORDER BY p.name
+""",
+    "manager": "MATCH (p:Person) WHERE p.manager = $manager RETURN p ORDER BY p.name",
+}
+
+_RECENT_INTERACTIONS_QUERIES = {
+    False: """
+MATCH (i:Interaction)
+WHERE i.date >= datetime() - duration({days: $days})
+RETURN i ORDER BY i.date DESC
+""",
+    True: """
+MATCH (i:Interaction)
+WHERE i.date >= datetime() - duration({days: $days})
+  AND i.with_person = $person_name
+RETURN i ORDER BY i.date DESC
+""",
+}
+
+_PEOPLE_BY_DEPARTMENT_QUERY = _TEAM_MEMBERS_QUERIES["department"]
+
+_PERSON_RELATIONSHIPS_QUERY = """
+MATCH (p1:Person {email: $email})-[r:WORKS_WITH]->(p2:Person)
+RETURN r, p2.email as person2_email
+"""
+
+_CROSS_DEPARTMENT_CONNECTORS_QUERY = """
+MATCH (p1:Person)-[:WORKS_WITH]-(p2:Person)
+WHERE p1.department <> p2.department
+WITH p1, COUNT(DISTINCT p2.department) as dept_connections
+WHERE dept_connections > 1
+RETURN p1 ORDER BY dept_connections DESC LIMIT $limit
+"""
+
+
+async def _run_statements(tx, statements: List[str]) -> None:
+    """Transaction function that runs each parameterless statement in order."""
+    for statement in statements:
+        await tx.run(statement)
+
+
+async def _single_record(tx, query: str, params: Dict[str, Any]):
+    """Transaction function that returns the query's only record, or None."""
+    result = await tx.run(query, params)
+    return await result.single()
+
+
+async def _walk_manager_chain(tx, name: str, max_depth: int) -> List[Any]:
+    """Transaction function that follows manager edges upward from ``name``.
+
+    Stops at the top of the hierarchy, at ``max_depth``, or on reaching
+    someone already in the chain, so cycles yield the partial chain.
+    """
+    chain = []
+    seen = {name}
+    current = name
+    for _ in range(max_depth):
+        result = await tx.run(_MANAGER_OF_QUERY, name=current)
+        record = await result.single()
+        if record is None:
+            break
+        manager = record["m"]
+        current = manager["name"]
+        if current in seen:
+            break
+        seen.add(current)
+        chain.append(manager)
+    return chain
+
+
+async def _run_unwind_queries(tx, statements: List[Tuple[str, List[Dict[str, Any]]]]) -> None:
+    """Transaction function that runs each UNWIND query over its rows.
+
+    Every query is submitted before any summary is awaited, so the driver
+    pipelines them on the connection instead of waiting out each one.
+    """
+    results = [await tx.run(query, rows=rows) for query, rows in statements if rows]
+    for result in results:
+        await result.consume()
+
 
 class Neo4jManager:
     """Async Neo4j database manager for workplace graph operations."""
@@ -26,19 +272,32 @@ class Neo4jManager:
             user: Neo4j username (overrides settings)
             password: Neo4j password (overrides settings)
         """
-        self.settings = settings or Settings()
+        self.settings = settings or get_settings()
         self.uri = uri or self.settings.neo4j_uri
         self.user = user or self.settings.neo4j_user
         self.password = password or self.settings.neo4j_password
         self.database = self.settings.neo4j_database
         self._driver: Optional[AsyncDriver] = None
+        # Writes queued between begin_batch() and end_batch()
+        self._pending: Optional[Dict[str, list]] = None
+        # Session reused by the ingest write paths, one writer at a time
+        self._hot_session: Optional[AsyncSession] = None
+        self._hot_session_lock = asyncio.Lock()
+        # Recent by-name lookups as (expires_at, person), least recently used first,
+        # and the lookups currently in flight so concurrent misses share one query
+        self._person_cache: "OrderedDict[str, Tuple[float, Person]]" = OrderedDict()
+        self._person_fetches: Dict[str, asyncio.Future] = {}
 
     async def connect(self) -> None:
         """Establish connection to Neo4j database."""
         try:
             self._driver = AsyncGraphDatabase.driver(
                 self.uri,
-                auth=(self.user, self.password)
+                auth=(self.user, self.password),
+                max_connection_pool_size=self.settings.neo4j_max_connection_pool_size,
+                connection_acquisition_timeout=self.settings.neo4j_connection_acquisition_timeout,
+                max_connection_lifetime=self.settings.neo4j_max_connection_lifetime,
+                keep_alive=True
             )
             # Test the connection with timeout
             await asyncio.wait_for(self._driver.verify_connectivity(), timeout=5.0)
@@ -52,26 +311,180 @@ class Neo4jManager:
 
     async def close(self) -> None:
         """Close the database connection."""
+        if self._hot_session is not None:
+            await self._hot_session.close()
+            self._hot_session = None
         if self._driver:
             await self._driver.close()
             logger.info("Neo4j connection closed")
 
     @asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncSession]:
+    async def session(
+        self,
+        fetch_size: Optional[int] = None,
+        default_access_mode: Optional[str] = None
+    ) -> AsyncIterator[AsyncSession]:
         """Get an async Neo4j session context manager.
 
+        Args:
+            fetch_size: Optional number of records pulled per batch
+                (-1 streams all records in a single batch)
+            default_access_mode: Optional access mode (e.g. ``neo4j.READ_ACCESS``)
+                so clusters can route reads to followers
+
         Yields:
             AsyncSession: Neo4j session for database operations
         """
         if not self._driver:
             await self.connect()
 
-        session = self._driver.session(database=self.database)
+        session_kwargs: Dict[str, Any] = {"database": self.database}
+        if fetch_size is not None:
+            session_kwargs["fetch_size"] = fetch_size
+        if default_access_mode is not None:
+            session_kwargs["default_access_mode"] = default_access_mode
+
+        session = self._driver.session(**session_kwargs)
         try:
             yield session
         finally:
             await session.close()
 
+    @asynccontextmanager
+    async def hot_session(self) -> AsyncIterator[AsyncSession]:
+        """Borrow the manager's long-lived write session.
+
+        Ingest writes reuse one session instead of opening and closing one
+        per call. Callers are serialized because a session is not safe for
+        concurrent use; use ``session()`` for isolated or parallel work.
+
+        Yields:
+            AsyncSession: The pinned Neo4j session
+        """
+        async with self._hot_session_lock:
+            if self._hot_session is None:
+                if not self._driver:
+                    await self.connect()
+                self._hot_session = self._driver.session(database=self.database)
+            try:
+                yield self._hot_session
+            except Exception:
+                # Drop a session that may have lost its connection
+                session, self._hot_session = self._hot_session, None
+                await session.close()
+                raise
+
+    def begin_batch(self) -> None:
+        """Start queueing writes instead of sending each one.
+
+        Until ``end_batch()`` is awaited, ``add_coworker``, ``add_relationship``
+        and ``add_interaction`` only record their argument.
+        """
+        if self._pending is None:
+            self._pending = {"people": [], "relationships": [], "interactions": []}
+
+    async def end_batch(self) -> None:
+        """Flush queued writes in one transaction and stop batching."""
+        pending, self._pending = self._pending, None
+        if not pending:
+            return
+
+        await self._write_unwind_batches([
+            (_ADD_COWORKERS_QUERY, self._coworker_rows(pending["people"])),
+            (_ADD_RELATIONSHIPS_QUERY, self._relationship_rows(pending["relationships"])),
+            (_ADD_INTERACTIONS_QUERY, self._interaction_rows(pending["interactions"])),
+        ])
+
+    async def add_coworkers(self, people: List[Person]) -> List[str]:
+        """Add many coworkers in a single round trip.
+
+        Args:
+            people: Person model instances
+
+        Returns:
+            List[str]: The people's names (used as IDs)
+        """
+        await self._write_unwind_batches([(_ADD_COWORKERS_QUERY, self._coworker_rows(people))])
+        return [person.name for person in people]
+
+    async def add_relationships(self, relationships: List[WorkRelationship]) -> bool:
+        """Add many workplace relationships in a single round trip.
+
+        Args:
+            relationships: WorkRelationship model instances
+
+        Returns:
+            bool: True if successful
+        """
+        await self._write_unwind_batches(
+            [(_ADD_RELATIONSHIPS_QUERY, self._relationship_rows(relationships))]
+        )
+        return True
+
+    async def add_interactions(self, interactions: List[Interaction]) -> bool:
+        """Add many interaction records in a single round trip.
+
+        Args:
+            interactions: Interaction model instances
+
+        Returns:
+            bool: True if successful
+        """
+        await self._write_unwind_batches(
+            [(_ADD_INTERACTIONS_QUERY, self._interaction_rows(interactions))]
+        )
+        return True
+
+    @staticmethod
+    def _coworker_rows(people: List[Person]) -> List[Dict[str, Any]]:
+        """Build the UNWIND rows that write ``people``."""
+        return [person.to_neo4j() for person in people]
+
+    @staticmethod
+    def _relationship_rows(relationships: List[WorkRelationship]) -> List[Dict[str, Any]]:
+        """Build the UNWIND rows that write ``relationships``.
+
+        Edge properties are nested under ``properties`` so the query can set
+        them on both directions with ``+=``.
+        """
+        rows = []
+        for relationship in relationships:
+            properties = relationship.to_neo4j()
+            rows.append({
+                "from_person": properties.pop("from_person"),
+                "to_person": properties.pop("to_person"),
+                "relationship_type": properties.pop("relationship_type"),
+                "properties": properties,
+            })
+        return rows
+
+    @staticmethod
+    def _interaction_rows(interactions: List[Interaction]) -> List[Dict[str, Any]]:
+        """Build the UNWIND rows that write ``interactions``, oldest first."""
+        return sorted(
+            (interaction.to_neo4j() for interaction in interactions),
+            key=lambda row: row["date"],
+        )
+
+    async def _write_unwind_batches(self, statements: List[Tuple[str, List[Dict[str, Any]]]]) -> None:
+        """Run UNWIND statements in one managed write transaction.
+
+        The driver retries the transaction on transient errors.
+
+        Args:
+            statements: ``(query, rows)`` pairs; pairs without rows are skipped
+        """
+        if not any(rows for _, rows in statements):
+            return
+
+        async with self.hot_session() as session:
+            await session.execute_write(_run_unwind_queries, statements)
+
+        # Relationship rows only merge endpoints, so they leave cached people valid
+        self._forget_people(
+            row.get("name") or row.get("with_person") for _, rows in statements for row in rows
+        )
+
     async def add_coworker(self, person: Person) -> str:
         """Add a coworker to the workplace graph.
 
@@ -81,30 +494,27 @@ class Neo4jManager:
         Returns:
             str: The person's name (used as ID)
         """
-        async with self.session() as session:
-            query = """
-            MERGE (p:Person {name: $name})
-            SET p.email = $email,
-                p.phone = $phone,
-                p.role = $role,
-                p.department = $department,
-                p.manager = $manager,
-                p.expertise_areas = $expertise_areas,
-                p.communication_preference = $communication_preference,
-                p.availability = $availability,
-                p.timezone = $timezone,
-                p.last_interaction = $last_interaction,
-                p.interaction_frequency = $interaction_frequency,
-                p.notes = $notes,
-                p.attributes = $attributes,
-                p.created_at = $created_at,
-                p.updated_at = $updated_at
-            RETURN p.name as name
-            """
-
-            result = await session.run(query, **person.model_dump())
-            record = await result.single()
-            return record["name"] if record else person.name
+        if self._pending is not None:
+            self._pending["people"].append(person)
+            return person.name
+
+        return await self._add_coworker_row(person.to_neo4j())
+
+    async def _add_coworker_row(self, row: Dict[str, Any]) -> str:
+        """Write one already-dumped person row.
+
+        Args:
+            row: Person properties as returned by ``Person.to_neo4j``
+
+        Returns:
+            str: The person's name (used as ID)
+        """
+        # MERGE on name always yields that name, so nothing is streamed back
+        async with self.hot_session() as session:
+            result = await session.run(_ADD_COWORKER_QUERY, **row)
+            await result.consume()
+        self._forget_people([row["name"]])
+        return row["name"]
 
     async def get_person_by_name(self, name: str) -> Optional[Person]:
         """Get a person by name.
@@ -115,19 +525,60 @@ class Neo4jManager:
         Returns:
             Person: Person model instance or None if not found
         """
-        async with self.session() as session:
-            query = """
-            MATCH (p:Person {name: $name})
-            RETURN p
-            """
-
-            result = await session.run(query, name=name)
-            record = await result.single()
-
-            if record:
-                person_data = record["p"]
-                return Person(**person_data)
-            return None
+        cached = self._person_cache.get(name)
+        if cached is not None:
+            expires_at, person = cached
+            if expires_at > time.monotonic():
+                self._person_cache.move_to_end(name)
+                return person.model_copy(deep=True)
+            del self._person_cache[name]
+
+        fetch = self._person_fetches.get(name)
+        if fetch is not None:
+            person = await asyncio.shield(fetch)
+            return person.model_copy(deep=True) if person else None
+
+        fetch = asyncio.ensure_future(self._fetch_person_by_name(name))
+        self._person_fetches[name] = fetch
+        try:
+            person = await asyncio.shield(fetch)
+        finally:
+            # A write that forgot the name mid-fetch also dropped this entry,
+            # so a possibly stale result is returned but not cached
+            current = self._person_fetches.get(name) is fetch
+            if current:
+                del self._person_fetches[name]
+
+        if person and current:
+            self._cache_person(person)
+        return person
+
+    async def _fetch_person_by_name(self, name: str) -> Optional[Person]:
+        """Read one person by name from the database."""
+        record = await self._read_single(_GET_PERSON_BY_NAME_QUERY, name=name)
+
+        if record:
+            person_data = record["p"]
+            return Person.from_neo4j(person_data)
+        return None
+
+    def _cache_person(self, person: Person) -> None:
+        """Remember a found person, evicting the least recently used entry."""
+        size = self.settings.person_cache_size
+        if size <= 0:
+            return
+        expires_at = time.monotonic() + self.settings.person_cache_ttl
+        self._person_cache[person.name] = (expires_at, person.model_copy(deep=True))
+        self._person_cache.move_to_end(person.name)
+        while len(self._person_cache) > size:
+            self._person_cache.popitem(last=False)
+
+    def _forget_people(self, names: Iterable[Optional[str]]) -> None:
+        """Drop cached and in-flight lookups for people that were just written."""
+        for name in names:
+            if name:
+                self._person_cache.pop(name, None)
+                self._person_fetches.pop(name, None)
 
     async def find_person_by_email(self, email: str) -> Optional[Person]:
         """Find a person by email.
@@ -138,19 +589,12 @@ class Neo4jManager:
         Returns:
             Person: Person model instance or None if not found
         """
-        async with self.session() as session:
-            query = """
-            MATCH (p:Person {email: $email})
-            RETURN p
-            """
+        record = await self._read_single(_FIND_PERSON_BY_EMAIL_QUERY, email=email)
 
-            result = await session.run(query, email=email)
-            record = await result.single()
-
-            if record:
-                person_data = record["p"]
-                return Person(**person_data)
-            return None
+        if record:
+            person_data = record["p"]
+            return Person.from_neo4j(person_data)
+        return None
 
     async def count_people(self) -> int:
         """Count total number of people in the database.
@@ -158,11 +602,8 @@ class Neo4jManager:
         Returns:
             int: Total count of people
         """
-        async with self.session() as session:
-            query = "MATCH (p:Person) RETURN count(p) as count"
-            result = await session.run(query)
-            record = await result.single()
-            return record["count"] if record else 0
+        record = await self._read_single(_COUNT_PEOPLE_QUERY)
+        return record["count"] if record else 0
 
     async def count_relationships(self) -> int:
         """Count total number of relationships in the database.
@@ -170,11 +611,8 @@ class Neo4jManager:
         Returns:
             int: Total count of relationships
         """
-        async with self.session() as session:
-            query = "MATCH ()-[r:WORKS_WITH|REPORTS_TO|INTERACTS_WITH]->() RETURN count(r) as count"
-            result = await session.run(query)
-            record = await result.single()
-            return record["count"] if record else 0
+        record = await self._read_single(_COUNT_RELATIONSHIPS_QUERY)
+        return record["count"] if record else 0
 
     async def add_relationship(self, relationship: WorkRelationship) -> bool:
         """Add a workplace relationship between two people.
@@ -185,45 +623,16 @@ class Neo4jManager:
         Returns:
             bool: True if successful
         """
-        async with self.session() as session:
-            # First ensure both people exist
-            await self._ensure_person_exists(session, relationship.from_person)
-            await self._ensure_person_exists(session, relationship.to_person)
-
-            # Create the relationship
-            query = """
-            MATCH (from:Person {name: $from_person})
-            MATCH (to:Person {name: $to_person})
-            MERGE (from)-[r:WORKS_WITH {type: $relationship_type}]->(to)
-            SET r.bidirectional = $bidirectional,
-                r.strength = $strength,
-                r.context = $context,
-                r.created_at = $created_at,
-                r.updated_at = $updated_at,
-                r.notes = $notes
-            RETURN r
-            """
-
-            await session.run(query, **relationship.model_dump())
-
-            # If bidirectional, create reverse relationship
-            if relationship.bidirectional:
-                reverse_query = """
-                MATCH (from:Person {name: $to_person})
-                MATCH (to:Person {name: $from_person})
-                MERGE (from)-[r:WORKS_WITH {type: $relationship_type}]->(to)
-                SET r.bidirectional = $bidirectional,
-                    r.strength = $strength,
-                    r.context = $context,
-                    r.created_at = $created_at,
-                    r.updated_at = $updated_at,
-                    r.notes = $notes
-                RETURN r
-                """
-                await session.run(reverse_query, **relationship.model_dump())
-
+        if self._pending is not None:
+            self._pending["relationships"].append(relationship)
             return True
 
+        # Endpoints, edge and reverse edge in one round trip
+        await self._write_unwind_batches(
+            [(_ADD_RELATIONSHIPS_QUERY, self._relationship_rows([relationship]))]
+        )
+        return True
+
     async def add_interaction(self, interaction: Interaction) -> bool:
         """Add an interaction record.
 
@@ -233,45 +642,16 @@ class Neo4jManager:
         Returns:
             bool: True if successful
         """
-        async with self.session() as session:
-            # Ensure person exists
-            await self._ensure_person_exists(session, interaction.with_person)
-
-            # Add interaction
-            query = """
-            MATCH (p:Person {name: $with_person})
-            CREATE (i:Interaction {
-                with_person: $with_person,
-                interaction_type: $interaction_type,
-                topic: $topic,
-                outcome: $outcome,
-                duration_minutes: $duration_minutes,
-                project: $project,
-                location: $location,
-                participants: $participants,
-                date: $date,
-                notes: $notes,
-                follow_up_required: $follow_up_required,
-                follow_up_date: $follow_up_date
-            })
-            CREATE (p)-[:HAD_INTERACTION]->(i)
-            RETURN i
-            """
-
-            await session.run(query, **interaction.model_dump())
-
-            # Update person's last interaction
-            update_query = """
-            MATCH (p:Person {name: $with_person})
-            SET p.last_interaction = $date,
-                p.updated_at = $date
-            """
-            await session.run(update_query,
-                            with_person=interaction.with_person,
-                            date=interaction.date)
-
+        if self._pending is not None:
+            self._pending["interactions"].append(interaction)
             return True
 
+        # Person, interaction and last-interaction update in one round trip
+        await self._write_unwind_batches(
+            [(_ADD_INTERACTIONS_QUERY, self._interaction_rows([interaction]))]
+        )
+        return True
+
     async def find_experts(self, expertise_area: str, department: str = None) -> List[Person]:
         """Find subject matter experts by expertise area.
 
@@ -282,28 +662,43 @@ class Neo4jManager:
         Returns:
             List[Person]: List of expert persons
         """
-        async with self.session() as session:
-            query = """
-            MATCH (p:Person)
-            WHERE any(skill IN p.expertise_areas WHERE skill CONTAINS $expertise)
-            """
-
+        async with self.session(default_access_mode=READ_ACCESS) as session:
             params = {"expertise": expertise_area}
-
             if department:
-                query += " AND p.department = $department"
                 params["department"] = department
 
-            query += " RETURN p ORDER BY p.name"
+            result = await session.run(_FIND_EXPERTS_QUERIES[bool(department)], **params)
+            records = await result.data()
+            return [Person.from_neo4j(row["p"]) for row in records]
+
+    async def find_experts_multi(
+        self, skills: List[str], department: str = None
+    ) -> Dict[str, List[Person]]:
+        """Find experts for several expertise areas in one query.
+
+        Args:
+            skills: Areas of expertise to search for
+            department: Optional department filter
+
+        Returns:
+            Dict[str, List[Person]]: Experts per skill, in the order given;
+                skills without experts map to an empty list
+        """
+        if not skills:
+            return {}
 
-            result = await session.run(query, **params)
-            experts = []
+        async with self.session(default_access_mode=READ_ACCESS) as session:
+            params = {"skills": list(dict.fromkeys(skills))}
+            if department:
+                params["department"] = department
 
-            async for record in result:
-                person_data = record["p"]
-                experts.append(Person(**person_data))
+            result = await session.run(_FIND_EXPERTS_MULTI_QUERIES[bool(department)], **params)
+            records = await result.data()
 
-            return experts
+        experts = {skill: [] for skill in params["skills"]}
+        for row in records:
+            experts[row["skill"]] = [Person.from_neo4j(node) for node in row["people"]]
+        return experts
 
     async def get_reporting_chain(self, person_name: str) -> List[Person]:
         """Get the reporting chain for a person (all managers up the hierarchy).
@@ -315,19 +710,10 @@ class Neo4jManager:
             List[Person]: List of managers in reporting chain
         """
         async with self.session() as session:
-            query = """
-            MATCH path = (p:Person {name: $name})-[:WORKS_WITH {type: 'manager'}*]->(manager:Person)
-            RETURN nodes(path) as chain
-            """
-
-            result = await session.run(query, name=person_name)
-            record = await result.single()
-
-            if record:
-                chain_nodes = record["chain"]
-                return [Person(**node) for node in chain_nodes[1:]]  # Skip self
-
-            return []
+            chain_nodes = await session.execute_read(
+                _walk_manager_chain, person_name, _REPORTING_CHAIN_MAX_DEPTH
+            )
+        return [Person.from_neo4j(node) for node in chain_nodes]
 
     async def get_direct_reports(self, person_name: str) -> List[Person]:
         """Get direct reports for a person.
@@ -338,21 +724,10 @@ class Neo4jManager:
         Returns:
             List[Person]: List of direct reports
         """
-        async with self.session() as session:
-            query = """
-            MATCH (manager:Person {name: $name})<-[:WORKS_WITH {type: 'manager'}]-(report:Person)
-            RETURN report
-            ORDER BY report.name
-            """
-
-            result = await session.run(query, name=person_name)
-            reports = []
-
-            async for record in result:
-                person_data = record["report"]
-                reports.append(Person(**person_data))
-
-            return reports
+        async with self.session(default_access_mode=READ_ACCESS) as session:
+            result = await session.run(_DIRECT_REPORTS_QUERY, name=person_name)
+            records = await result.data()
+            return [Person.from_neo4j(row["report"]) for row in records]
 
     async def get_collaboration_path(self, from_person: str, to_person: str) -> List[str]:
         """Find the shortest collaboration path between two people.
@@ -364,16 +739,11 @@ class Neo4jManager:
         Returns:
             List[str]: List of person names in the path
         """
-        async with self.session() as session:
-            query = """
-            MATCH path = shortestPath((from:Person {name: $from_person})-[:WORKS_WITH*]-(to:Person {name: $to_person}))
-            RETURN [node in nodes(path) | node.name] as path
-            """
-
-            result = await session.run(query, from_person=from_person, to_person=to_person)
-            record = await result.single()
+        record = await self._read_single(
+            _COLLABORATION_PATH_QUERY, from_person=from_person, to_person=to_person
+        )
 
-            return record["path"] if record else []
+        return record["path"] if record else []
 
     async def get_team_members(self, department: str = None, manager: str = None) -> List[Person]:
         """Get team members by department or manager.
@@ -385,27 +755,17 @@ class Neo4jManager:
         Returns:
             List[Person]: List of team members
         """
-        async with self.session() as session:
-            query = "MATCH (p:Person)"
-            params = {}
-
+        async with self.session(default_access_mode=READ_ACCESS) as session:
             if department:
-                query += " WHERE p.department = $department"
-                params["department"] = department
+                filter_key, params = "department", {"department": department}
             elif manager:
-                query += " WHERE p.manager = $manager"
-                params["manager"] = manager
-
-            query += " RETURN p ORDER BY p.name"
-
-            result = await session.run(query, **params)
-            members = []
-
-            async for record in result:
-                person_data = record["p"]
-                members.append(Person(**person_data))
+                filter_key, params = "manager", {"manager": manager}
+            else:
+                filter_key, params = None, {}
 
-            return members
+            result = await session.run(_TEAM_MEMBERS_QUERIES[filter_key], **params)
+            records = await result.data()
+            return [Person.from_neo4j(row["p"]) for row in records]
 
     async def get_recent_interactions(self, person_name: str = None, days: int = 30) -> List[Interaction]:
         """Get recent interactions, optionally filtered by person.
@@ -417,28 +777,14 @@ class Neo4jManager:
         Returns:
             List[Interaction]: List of recent interactions
         """
-        async with self.session() as session:
-            query = """
-            MATCH (i:Interaction)
-            WHERE i.date >= datetime() - duration({days: $days})
-            """
-
+        async with self.session(default_access_mode=READ_ACCESS) as session:
             params = {"days": days}
-
             if person_name:
-                query += " AND i.with_person = $person_name"
                 params["person_name"] = person_name
 
-            query += " RETURN i ORDER BY i.date DESC"
-
-            result = await session.run(query, **params)
-            interactions = []
-
-            async for record in result:
-                interaction_data = record["i"]
-                interactions.append(Interaction(**interaction_data))
-
-            return interactions
+            result = await session.run(_RECENT_INTERACTIONS_QUERIES[bool(person_name)], **params)
+            records = await result.data()
+            return [Interaction.from_neo4j(row["i"]) for row in records]
 
     async def find_people_by_department(self, department: str) -> List[Person]:
         """Find all people in a specific department.
@@ -449,16 +795,10 @@ class Neo4jManager:
         Returns:
             List[Person]: List of people in the department
         """
-        async with self.session() as session:
-            query = "MATCH (p:Person) WHERE p.department = $department RETURN p ORDER BY p.name"
-            result = await session.run(query, department=department)
-            people = []
-
-            async for record in result:
-                person_data = record["p"]
-                people.append(Person(**person_data))
-
-            return people
+        async with self.session(default_access_mode=READ_ACCESS) as session:
+            result = await session.run(_PEOPLE_BY_DEPARTMENT_QUERY, department=department)
+            records = await result.data()
+            return [Person.from_neo4j(row["p"]) for row in records]
 
     async def get_person_relationships(self, person_email: str) -> List[WorkRelationship]:
         """Get all relationships for a person.
@@ -471,23 +811,21 @@ class Neo4jManager:
         """
         from .models import WorkRelationship
 
-        async with self.session() as session:
-            query = """
-            MATCH (p1:Person {email: $email})-[r:WORKS_WITH]->(p2:Person)
-            RETURN r, p2.email as person2_email
-            """
-            result = await session.run(query, email=person_email)
+        async with self.session(default_access_mode=READ_ACCESS) as session:
+            result = await session.run(_PERSON_RELATIONSHIPS_QUERY, email=person_email)
             relationships = []
 
-            async for record in result:
-                rel_data = record["r"]
-                relationships.append(WorkRelationship(
-                    person1_email=person_email,
-                    person2_email=record["person2_email"],
-                    relationship_type=rel_data.get("relationship_type", "colleague"),
-                    start_date=rel_data.get("start_date"),
-                    notes=rel_data.get("notes")
-                ))
+            while records := await result.fetch(_FETCH_CHUNK_SIZE):
+                relationships.extend(
+                    WorkRelationship(
+                        person1_email=person_email,
+                        person2_email=record["person2_email"],
+                        relationship_type=record["r"].get("relationship_type", "colleague"),
+                        start_date=record["r"].get("start_date"),
+                        notes=record["r"].get("notes")
+                    )
+                    for record in records
+                )
 
             return relationships
 
@@ -500,22 +838,23 @@ class Neo4jManager:
         Returns:
             List[Person]: List of cross-department connectors
         """
+        async with self.session(default_access_mode=READ_ACCESS) as session:
+            result = await session.run(_CROSS_DEPARTMENT_CONNECTORS_QUERY, limit=limit)
+            records = await result.data()
+            return [Person.from_neo4j(row["p1"]) for row in records]
+
+    async def _read_single(self, query: str, **params: Any):
+        """Run a single-record read in a managed read transaction.
+
+        Args:
+            query: Cypher query expected to return at most one record
+            **params: Query parameters
+
+        Returns:
+            The record, or None if the query matched nothing
+        """
         async with self.session() as session:
-            query = """
-            MATCH (p1:Person)-[:WORKS_WITH]-(p2:Person)
-            WHERE p1.department <> p2.department
-            WITH p1, COUNT(DISTINCT p2.department) as dept_connections
-            WHERE dept_connections > 1
-            RETURN p1 ORDER BY dept_connections DESC LIMIT $limit
-            """
-            result = await session.run(query, limit=limit)
-            connectors = []
-
-            async for record in result:
-                person_data = record["p1"]
-                connectors.append(Person(**person_data))
-
-            return connectors
+            return await session.execute_read(_single_record, query, params)
 
     async def _ensure_person_exists(self, session: AsyncSession, person_name: str) -> None:
         """Ensure a person exists in the database, create if not.
@@ -524,12 +863,7 @@ class Neo4jManager:
             session: Neo4j session
             person_name: Name of the person
         """
-        query = """
-        MERGE (p:Person {name: $name})
-        ON CREATE SET p.created_at = datetime(),
-                     p.updated_at = datetime()
-        """
-        await session.run(query, name=person_name)
+        await session.run(_ENSURE_PERSON_QUERY, name=person_name)
 
     async def initialize_schema(self) -> None:
         """Initialize database schema with constraints and indexes."""
@@ -548,35 +882,65 @@ class Neo4jManager:
                 "CREATE INDEX interaction_type IF NOT EXISTS FOR (i:Interaction) ON (i.interaction_type)"
             ]
 
-            for constraint in constraints:
-                try:
-                    await session.run(constraint)
-                    logger.info(f"Created constraint: {constraint}")
-                except Exception as e:
-                    logger.warning(f"Constraint already exists or failed: {e}")
+            # One retried transaction; fall back to one statement at a time
+            # if any of them conflicts with an existing schema object
+            try:
+                await session.execute_write(_run_statements, constraints + indexes)
+                logger.info(f"Created {len(constraints)} constraints and {len(indexes)} indexes")
+                return
+            except Exception as e:
+                logger.warning(f"Schema batch failed, applying statements individually: {e}")
+
+        # The statements are independent, so run them on separate sessions,
+        # capped below the pool size so other callers can still get a connection
+        semaphore = asyncio.Semaphore(min(5, self.settings.neo4j_max_connection_pool_size))
+        await asyncio.gather(
+            *(self._run_ddl(constraint, "Constraint", semaphore) for constraint in constraints),
+            *(self._run_ddl(index, "Index", semaphore) for index in indexes),
+        )
+
+    async def _run_ddl(self, statement: str, kind: str, semaphore: asyncio.Semaphore) -> bool:
+        """Run one schema statement on its own session.
 
-            for index in indexes:
-                try:
-                    await session.run(index)
-                    logger.info(f"Created index: {index}")
-                except Exception as e:
-                    logger.warning(f"Index already exists or failed: {e}")
+        Args:
+            statement: Constraint or index DDL statement
+            kind: Label used in log messages
+            semaphore: Limits how many statements run at once
+
+        Returns:
+            bool: True if the statement succeeded
+        """
+        async with semaphore:
+            try:
+                async with self.session() as session:
+                    await session.run(statement)
+                logger.info(f"Created {kind.lower()}: {statement}")
+                return True
+            except Exception as e:
+                logger.warning(f"{kind} already exists or failed: {e}")
+                return False
 
 
 # Global Neo4j manager instance
 _neo4j_manager: Optional[Neo4jManager] = None
+_neo4j_manager_lock = asyncio.Lock()
 
 
 async def get_neo4j_manager() -> Neo4jManager:
     """Get the global Neo4j manager instance.
 
+    Concurrent first callers share one manager, and so one driver and pool.
+
     Returns:
         Neo4jManager: Global Neo4j manager
     """
     global _neo4j_manager
-    if not _neo4j_manager:
-        _neo4j_manager = Neo4jManager()
-        await _neo4j_manager.connect()
+    if _neo4j_manager is None:
+        async with _neo4j_manager_lock:
+            if _neo4j_manager is None:
+                manager = Neo4jManager()
+                await manager.connect()
+                _neo4j_manager = manager
     return _neo4j_manager
 
 
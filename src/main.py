@@ -6,7 +6,12 @@ import sys
 from pathlib import Path
 
 from .cli.main import cli
-from .config.settings import Settings
+from .config.settings import Settings, get_settings
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None
 
 
 def setup_logging(settings: Settings):
@@ -21,12 +26,27 @@ def setup_logging(settings: Settings):
     )
 
 
+def install_event_loop_policy() -> bool:
+    """Run every ``asyncio.run`` on uvloop when it is installed.
+
+    Returns:
+        bool: True if the uvloop policy was installed
+    """
+    if uvloop is None or sys.platform == "win32":
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 def main():
     """Main entry point."""
     # Setup basic logging
-    settings = Settings()
+    settings = get_settings()
     setup_logging(settings)
 
+    # Each CLI command drives its own asyncio.run, so set the loop policy first
+    install_event_loop_policy()
+
     # Run the CLI
     cli()
 
@@ -1,14 +1,22 @@
 """Test configuration and fixtures."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+import sys
+import time
+from unittest.mock import AsyncMock
 
 import pytest
+from pytest_asyncio import is_async_test
 
 from src.agents import InsightsAgent, SocialGraphAgent
 from src.config.settings import Settings
 from src.database.neo4j_manager import Neo4jManager
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None
+
 
 @pytest.fixture
 def test_settings():
@@ -49,9 +57,29 @@ async def test_insights_agent(test_settings, mock_neo4j_manager):
     return agent
 
 
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Skip real waits in every test while still yielding to the event loop."""
+    real_sleep = asyncio.sleep
+
+    async def _yield_only(delay=0, result=None):
+        return await real_sleep(0, result)
+
+    monkeypatch.setattr(asyncio, "sleep", _yield_only)
+    monkeypatch.setattr(time, "sleep", lambda *args, **kwargs: None)
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the one session-scoped event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy():
+    """Build the session's event loop on uvloop when installed."""
+    if uvloop is not None and sys.platform != "win32":
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
@@ -1,69 +1,73 @@
 """Tests for CLI functionality."""
 
+import asyncio
+import os
+import threading
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from click.testing import CliRunner
 
+from src.cli import main as cli_main
 from src.cli.main import cli
 
 
-def test_cli_help():
-    """Test CLI help command."""
-    runner = CliRunner()
-    result = runner.invoke(cli, ['--help'])
+@pytest.fixture(scope="module")
+def runner():
+    """One CLI runner shared by the module; invoke() keeps no state between calls."""
+    return CliRunner()
 
-    assert result.exit_code == 0
-    assert "Workplace Social Graph AI Agent CLI" in result.output
-    assert "person" in result.output
-    assert "org" in result.output
-    assert "network" in result.output
 
+def _async_cm_agent(**method_returns):
+    """Build an agent mock usable as ``async with`` whose methods return ``method_returns``."""
+    agent = AsyncMock()
+    agent.__aenter__.return_value = agent
+    agent.__aexit__.return_value = None
+    for name, value in method_returns.items():
+        getattr(agent, name).return_value = value
+    return agent
 
-def test_person_group_help():
-    """Test person group help."""
-    runner = CliRunner()
-    result = runner.invoke(cli, ['person', '--help'])
 
-    assert result.exit_code == 0
-    assert "Manage people" in result.output
-    assert "add" in result.output
-    assert "find-experts" in result.output
+# (command path, phrases the help output must contain)
+_GROUP_HELP_CASES = (
+    ([], ("Workplace Social Graph AI Agent CLI", "person", "org", "network")),
+    (['person'], ("Manage people", "add", "find-experts")),
+    (['network'], ("Network analysis", "insights", "daily-report")),
+    (['setup'], ("Setup and initialization", "init-db", "check-config")),
+    (['org'], ("Organizational structure", "chart")),
+    (['data'], ("Data management", "export", "stats")),
+)
 
 
-def test_network_group_help():
-    """Test network group help."""
-    runner = CliRunner()
-    result = runner.invoke(cli, ['network', '--help'])
+@pytest.mark.parametrize(
+    "command,expected",
+    _GROUP_HELP_CASES,
+    ids=[" ".join(case[0]) or "cli" for case in _GROUP_HELP_CASES],
+)
+def test_group_help(command, expected, runner):
+    """Test help output for the top-level CLI and each command group."""
+    result = runner.invoke(cli, [*command, '--help'])
 
     assert result.exit_code == 0
-    assert "Network analysis" in result.output
-    assert "insights" in result.output
-    assert "daily-report" in result.output
+    for phrase in expected:
+        assert phrase in result.output
 
 
-def test_setup_group_help():
-    """Test setup group help."""
-    runner = CliRunner()
-    result = runner.invoke(cli, ['setup', '--help'])
+@patch.object(cli_main, 'get_settings')
+def test_subcommand_help_skips_settings(mock_get_settings, runner):
+    """Test that subcommand help does not load settings."""
+    result = runner.invoke(cli, ['person', 'add', '--help'])
 
     assert result.exit_code == 0
-    assert "Setup and initialization" in result.output
-    assert "init-db" in result.output
-    assert "check-config" in result.output
+    mock_get_settings.assert_not_called()
 
 
-@patch('src.cli.main.SocialGraphAgent')
-def test_add_person_command(mock_agent_class):
+@patch.object(cli_main, 'SocialGraphAgent')
+def test_add_person_command(mock_agent_class, runner):
     """Test add person command."""
     # Mock the agent and its methods
-    mock_agent = AsyncMock()
-    mock_agent.process_command.return_value = "✅ Added John Doe successfully"
-    mock_agent.__aenter__.return_value = mock_agent
-    mock_agent.__aexit__.return_value = None
-    mock_agent_class.return_value = mock_agent
+    mock_agent_class.return_value = _async_cm_agent(process_command="✅ Added John Doe successfully")
 
-    runner = CliRunner()
     result = runner.invoke(cli, [
         'person', 'add',
         '--name', 'John Doe',
@@ -76,16 +80,11 @@ def test_add_person_command(mock_agent_class):
     assert "Added John Doe successfully" in result.output
 
 
-@patch('src.cli.main.SocialGraphAgent')
-def test_find_experts_command(mock_agent_class):
+@patch.object(cli_main, 'SocialGraphAgent')
+def test_find_experts_command(mock_agent_class, runner):
     """Test find experts command."""
-    mock_agent = AsyncMock()
-    mock_agent.process_command.return_value = "🔍 Found 3 Python experts"
-    mock_agent.__aenter__.return_value = mock_agent
-    mock_agent.__aexit__.return_value = None
-    mock_agent_class.return_value = mock_agent
+    mock_agent_class.return_value = _async_cm_agent(process_command="🔍 Found 3 Python experts")
 
-    runner = CliRunner()
     result = runner.invoke(cli, [
         'person', 'find-experts',
         '--skill', 'Python'
@@ -95,23 +94,20 @@ def test_find_experts_command(mock_agent_class):
     assert "Found 3 Python experts" in result.output
 
 
-@patch('src.cli.main.SocialGraphAgent')
-def test_stats_command(mock_agent_class):
+@patch.object(cli_main, 'SocialGraphAgent')
+def test_stats_command(mock_agent_class, runner):
     """Test stats command."""
-    mock_agent = AsyncMock()
-    mock_agent.get_stats.return_value = {
-        'total_people': 10,
-        'total_relationships': 25,
-        'total_departments': 3,
-        'network_density': 0.15,
-        'largest_department': 'Engineering',
-        'departments': {'Engineering': 5, 'Sales': 3, 'HR': 2}
-    }
-    mock_agent.__aenter__.return_value = mock_agent
-    mock_agent.__aexit__.return_value = None
-    mock_agent_class.return_value = mock_agent
+    mock_agent_class.return_value = _async_cm_agent(
+        get_stats={
+            'total_people': 10,
+            'total_relationships': 25,
+            'total_departments': 3,
+            'network_density': 0.15,
+            'largest_department': 'Engineering',
+            'departments': {'Engineering': 5, 'Sales': 3, 'HR': 2}
+        }
+    )
 
-    runner = CliRunner()
     result = runner.invoke(cli, ['data', 'stats'])
 
     assert result.exit_code == 0
@@ -120,12 +116,11 @@ def test_stats_command(mock_agent_class):
     assert "Engineering: 5" in result.output
 
 
-@patch('src.cli.main.initialize_database')
-def test_init_db_command(mock_migration):
+@patch.object(cli_main, 'initialize_database')
+def test_init_db_command(mock_migration, runner):
     """Test database initialization command."""
     mock_migration.return_value = None
 
-    runner = CliRunner()
     result = runner.invoke(cli, ['setup', 'init-db'])
 
     assert result.exit_code == 0
@@ -133,28 +128,22 @@ def test_init_db_command(mock_migration):
     mock_migration.assert_called_once()
 
 
-@patch('src.cli.main.initialize_database')
-def test_init_db_command_error(mock_migration):
+@patch.object(cli_main, 'initialize_database')
+def test_init_db_command_error(mock_migration, runner):
     """Test database initialization command with error."""
     mock_migration.side_effect = Exception("Connection failed")
 
-    runner = CliRunner()
     result = runner.invoke(cli, ['setup', 'init-db'])
 
     assert result.exit_code == 1
     assert "Database initialization failed" in result.output
 
 
-@patch('src.cli.main.SocialGraphAgent')
-def test_who_to_ask_command(mock_agent_class):
+@patch.object(cli_main, 'SocialGraphAgent')
+def test_who_to_ask_command(mock_agent_class, runner):
     """Test who to ask command."""
-    mock_agent = AsyncMock()
-    mock_agent.process_command.return_value = "🤔 Ask Sarah Johnson about Machine Learning"
-    mock_agent.__aenter__.return_value = mock_agent
-    mock_agent.__aexit__.return_value = None
-    mock_agent_class.return_value = mock_agent
+    mock_agent_class.return_value = _async_cm_agent(process_command="🤔 Ask Sarah Johnson about Machine Learning")
 
-    runner = CliRunner()
     result = runner.invoke(cli, [
         'person', 'who-to-ask',
         '--topic', 'Machine Learning'
@@ -164,16 +153,11 @@ def test_who_to_ask_command(mock_agent_class):
     assert "Ask Sarah Johnson about Machine Learning" in result.output
 
 
-@patch('src.cli.main.SocialGraphAgent')
-def test_org_chart_command(mock_agent_class):
+@patch.object(cli_main, 'SocialGraphAgent')
+def test_org_chart_command(mock_agent_class, runner):
     """Test org chart command."""
-    mock_agent = AsyncMock()
-    mock_agent.process_command.return_value = "📊 Engineering Org Chart:\nJohn Smith (Manager)"
-    mock_agent.__aenter__.return_value = mock_agent
-    mock_agent.__aexit__.return_value = None
-    mock_agent_class.return_value = mock_agent
+    mock_agent_class.return_value = _async_cm_agent(process_command="📊 Engineering Org Chart:\nJohn Smith (Manager)")
 
-    runner = CliRunner()
     result = runner.invoke(cli, [
         'org', 'chart',
         '--department', 'Engineering'
@@ -183,16 +167,11 @@ def test_org_chart_command(mock_agent_class):
     assert "Engineering Org Chart" in result.output
 
 
-@patch('src.cli.main.SocialGraphAgent')
-def test_network_insights_command(mock_agent_class):
+@patch.object(cli_main, 'SocialGraphAgent')
+def test_network_insights_command(mock_agent_class, runner):
     """Test network insights command."""
-    mock_agent = AsyncMock()
-    mock_agent.process_command.return_value = "📈 Network insights for john@company.com"
-    mock_agent.__aenter__.return_value = mock_agent
-    mock_agent.__aexit__.return_value = None
-    mock_agent_class.return_value = mock_agent
+    mock_agent_class.return_value = _async_cm_agent(process_command="📈 Network insights for john@company.com")
 
-    runner = CliRunner()
     result = runner.invoke(cli, [
         'network', 'insights',
         '--person', 'john@company.com'
@@ -202,16 +181,36 @@ def test_network_insights_command(mock_agent_class):
     assert "Network insights for john@company.com" in result.output
 
 
-@patch('src.cli.main.InsightsAgent')
-def test_daily_report_command(mock_agent_class):
-    """Test daily report command."""
-    mock_agent = AsyncMock()
-    mock_agent.generate_daily_insights.return_value = "📊 Daily Network Report: 50 people, 200 interactions"
-    mock_agent.__aenter__.return_value = mock_agent
-    mock_agent.__aexit__.return_value = None
+@pytest.mark.parametrize(
+    "args,approximate,cache_enabled",
+    [
+        (['network', 'insights'], False, True),
+        (['network', 'insights', '--approximate'], True, True),
+        (['network', '--no-cache', 'insights'], False, False),
+    ],
+    ids=["defaults", "approximate", "no-cache"],
+)
+@patch.object(cli_main, 'SocialGraphAgent')
+def test_network_insights_flags(mock_agent_class, args, approximate, cache_enabled, runner):
+    """Test that --approximate reaches the agent and --no-cache reaches the settings."""
+    mock_agent = _async_cm_agent(process_command="📈 Network insights")
     mock_agent_class.return_value = mock_agent
 
-    runner = CliRunner()
+    result = runner.invoke(cli, args)
+
+    assert result.exit_code == 0
+    settings = mock_agent_class.call_args[0][0]
+    assert (settings.centrality_cache_dir is not None) is cache_enabled
+    mock_agent.process_command.assert_awaited_once_with(
+        'get_network_insights', person=None, department=None, approximate=approximate
+    )
+
+
+@patch.object(cli_main, 'InsightsAgent')
+def test_daily_report_command(mock_agent_class, runner):
+    """Test daily report command."""
+    mock_agent_class.return_value = _async_cm_agent(generate_daily_insights="📊 Daily Network Report: 50 people, 200 interactions")
+
     result = runner.invoke(cli, [
         'network', 'daily-report'
     ])
@@ -220,16 +219,11 @@ def test_daily_report_command(mock_agent_class):
     assert "Daily Network Report" in result.output
 
 
-@patch('src.cli.main.InsightsAgent')
-def test_collaboration_command(mock_agent_class):
+@patch.object(cli_main, 'InsightsAgent')
+def test_collaboration_command(mock_agent_class, runner):
     """Test collaboration analysis command."""
-    mock_agent = AsyncMock()
-    mock_agent.analyze_collaboration_patterns.return_value = "🤝 Collaboration patterns: High cross-team interaction"
-    mock_agent.__aenter__.return_value = mock_agent
-    mock_agent.__aexit__.return_value = None
-    mock_agent_class.return_value = mock_agent
+    mock_agent_class.return_value = _async_cm_agent(analyze_collaboration_patterns="🤝 Collaboration patterns: High cross-team interaction")
 
-    runner = CliRunner()
     result = runner.invoke(cli, [
         'network', 'collaboration',
         '--days', '14'
@@ -239,16 +233,11 @@ def test_collaboration_command(mock_agent_class):
     assert "Collaboration patterns" in result.output
 
 
-@patch('src.cli.main.SocialGraphAgent')
-def test_export_data_command_csv(mock_agent_class):
+@patch.object(cli_main, 'SocialGraphAgent')
+def test_export_data_command_csv(mock_agent_class, runner):
     """Test export data command with CSV format."""
-    mock_agent = AsyncMock()
-    mock_agent.process_command.return_value = "✅ Data exported to ./export in CSV format"
-    mock_agent.__aenter__.return_value = mock_agent
-    mock_agent.__aexit__.return_value = None
-    mock_agent_class.return_value = mock_agent
+    mock_agent_class.return_value = _async_cm_agent(process_command="✅ Data exported to ./export in CSV format")
 
-    runner = CliRunner()
     result = runner.invoke(cli, [
         'data', 'export',
         '--format', 'csv',
@@ -260,16 +249,11 @@ def test_export_data_command_csv(mock_agent_class):
     assert "exported" in result.output
 
 
-@patch('src.cli.main.SocialGraphAgent')
-def test_export_data_command_json(mock_agent_class):
+@patch.object(cli_main, 'SocialGraphAgent')
+def test_export_data_command_json(mock_agent_class, runner):
     """Test export data command with JSON format."""
-    mock_agent = AsyncMock()
-    mock_agent.process_command.return_value = "✅ Data exported to ./export in JSON format"
-    mock_agent.__aenter__.return_value = mock_agent
-    mock_agent.__aexit__.return_value = None
-    mock_agent_class.return_value = mock_agent
+    mock_agent_class.return_value = _async_cm_agent(process_command="✅ Data exported to ./export in JSON format")
 
-    runner = CliRunner()
     result = runner.invoke(cli, [
         'data', 'export',
         '--format', 'json'
@@ -279,15 +263,32 @@ def test_export_data_command_json(mock_agent_class):
     assert "exported" in result.output
 
 
+@patch.object(cli_main, 'SocialGraphAgent')
+def test_export_data_command_pretty(mock_agent_class, runner):
+    """Test that --pretty reaches the export command."""
+    mock_agent = _async_cm_agent(process_command="✅ Data exported to ./export in JSON format")
+    mock_agent_class.return_value = mock_agent
+
+    result = runner.invoke(cli, ['data', 'export', '--format', 'json', '--pretty'])
+
+    assert result.exit_code == 0
+    mock_agent.process_command.assert_awaited_once_with(
+        'export_data',
+        format='json',
+        output_path='./export',
+        include_sensitive=False,
+        pretty=True
+    )
+
+
 @patch('src.database.neo4j_manager.Neo4jManager')
-def test_test_connection_command_success(mock_manager_class):
+def test_test_connection_command_success(mock_manager_class, runner):
     """Test connection test command success."""
     mock_manager = AsyncMock()
     mock_manager.connect.return_value = None
     mock_manager.close.return_value = None
     mock_manager_class.return_value = mock_manager
 
-    runner = CliRunner()
     result = runner.invoke(cli, ['setup', 'check-config'])
 
     assert result.exit_code == 0
@@ -295,13 +296,12 @@ def test_test_connection_command_success(mock_manager_class):
 
 
 @patch('src.database.neo4j_manager.Neo4jManager')
-def test_test_connection_command_failure(mock_manager_class):
+def test_test_connection_command_failure(mock_manager_class, runner):
     """Test connection test command failure."""
     mock_manager = AsyncMock()
     mock_manager.connect.side_effect = Exception("Connection refused")
     mock_manager_class.return_value = mock_manager
 
-    runner = CliRunner()
     result = runner.invoke(cli, ['setup', 'check-config'])
 
     assert result.exit_code == 0  # Command doesn't fail, just reports error
@@ -309,15 +309,11 @@ def test_test_connection_command_failure(mock_manager_class):
     assert "Connection refused" in result.output
 
 
-@patch('src.cli.main.SocialGraphAgent')
-def test_interactive_chat_quit(mock_agent_class):
+@patch.object(cli_main, 'SocialGraphAgent')
+def test_interactive_chat_quit(mock_agent_class, runner):
     """Test interactive chat command with quit."""
-    mock_agent = AsyncMock()
-    mock_agent.__aenter__.return_value = mock_agent
-    mock_agent.__aexit__.return_value = None
-    mock_agent_class.return_value = mock_agent
+    mock_agent_class.return_value = _async_cm_agent()
 
-    runner = CliRunner()
     result = runner.invoke(cli, ['chat'], input='quit\n')
 
     assert result.exit_code == 0
@@ -325,58 +321,97 @@ def test_interactive_chat_quit(mock_agent_class):
     assert "Goodbye!" in result.output
 
 
-@patch('src.cli.main.SocialGraphAgent')
-def test_interactive_chat_with_response(mock_agent_class):
+@patch.object(cli_main, 'SocialGraphAgent')
+def test_interactive_chat_with_response(mock_agent_class, runner):
     """Test interactive chat command with agent response."""
-    mock_agent = AsyncMock()
-    mock_agent.chat.return_value = "Hello! I can help you with workplace social graph analysis."
-    mock_agent.__aenter__.return_value = mock_agent
-    mock_agent.__aexit__.return_value = None
-    mock_agent_class.return_value = mock_agent
+    mock_agent_class.return_value = _async_cm_agent(chat="Hello! I can help you with workplace social graph analysis.")
 
-    runner = CliRunner()
     result = runner.invoke(cli, ['chat'], input='hello\nquit\n')
 
     assert result.exit_code == 0
     assert "Hello! I can help you" in result.output
 
 
-def test_cli_with_config_file():
-    """Test CLI with config file option."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        # Create a temporary config file
-        with open('test_config.env', 'w') as f:
-            f.write('NEO4J_URI=bolt://test:7687\n')
-
-        result = runner.invoke(cli, ['--config', 'test_config.env', '--help'])
-        assert result.exit_code == 0
+@patch.object(cli_main, '_prompt_in_daemon_thread', side_effect=asyncio.CancelledError)
+@patch.object(cli_main, 'SocialGraphAgent')
+def test_interactive_chat_exits_on_interrupt(mock_agent_class, mock_prompt, runner):
+    """Test that Ctrl+C, delivered by asyncio.run as task cancellation, ends the chat cleanly."""
+    mock_agent_class.return_value = _async_cm_agent()
 
-
-def test_org_group_help():
-    """Test org group help."""
-    runner = CliRunner()
-    result = runner.invoke(cli, ['org', '--help'])
+    result = runner.invoke(cli, ['chat'])
 
     assert result.exit_code == 0
-    assert "Organizational structure" in result.output
-    assert "chart" in result.output
-
+    assert "Goodbye!" in result.output
+    mock_prompt.assert_awaited_once()
+
+
+def test_prompt_in_daemon_thread_can_be_abandoned():
+    """Test that cancelling a pending read returns at once and leaves only a daemon thread."""
+    release = threading.Event()
+
+    def blocking_prompt(*args, **kwargs):
+        release.wait(5)
+        return "late"
+
+    async def read_then_cancel():
+        task = asyncio.create_task(cli_main._prompt_in_daemon_thread("You"))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with patch.object(cli_main.click, 'prompt', side_effect=blocking_prompt):
+        asyncio.run(read_then_cancel())
+        reader = next(thread for thread in threading.enumerate() if thread.name == "chat-input")
+        assert reader.daemon
+        release.set()
+        reader.join(5)
+
+
+def test_read_line_reads_stdin_descriptor():
+    """Test that lines are read straight from the stdin descriptor, skipping blank ones."""
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, "\nhällo\nquit\n".encode("utf-8"))
+    os.close(write_fd)
+    stdin = Mock(encoding="utf-8")
+    stdin.fileno.return_value = read_fd
+
+    try:
+        with patch.object(cli_main.sys, 'stdin', stdin):
+            assert cli_main._read_line("You") == "hällo"
+            assert cli_main._read_line("You") == "quit"
+            with pytest.raises(EOFError):
+                cli_main._read_line("You")
+    finally:
+        os.close(read_fd)
+
+
+@patch.object(cli_main, 'SocialGraphAgent')
+def test_interactive_chat_quit_cancels_prewarm(mock_agent_class, runner):
+    """Test that quitting does not wait for a graph prewarm that is still running."""
+    prewarm_state = {}
+
+    async def endless_prewarm():
+        prewarm_state["started"] = True
+        try:
+            await asyncio.get_running_loop().create_future()
+        except asyncio.CancelledError:
+            prewarm_state["cancelled"] = True
+            raise
+
+    mock_agent = _async_cm_agent()
+    mock_agent.prewarm = endless_prewarm
+    mock_agent_class.return_value = mock_agent
 
-def test_data_group_help():
-    """Test data group help."""
-    runner = CliRunner()
-    result = runner.invoke(cli, ['data', '--help'])
+    result = runner.invoke(cli, ['chat'], input='quit\n')
 
     assert result.exit_code == 0
-    assert "Data management" in result.output
-    assert "export" in result.output
-    assert "stats" in result.output
+    assert "Goodbye!" in result.output
+    assert prewarm_state == {"started": True, "cancelled": True}
 
 
-def test_cli_with_config_file(tmp_path):
+def test_cli_with_config_file(tmp_path, runner):
     """Test CLI with config file parameter."""
-    runner = CliRunner()
     # Create a temporary config file
     config_file = tmp_path / "test_config.env"
     config_file.write_text("NEO4J_URI=bolt://test:7687\nNEO4J_USER=test\nNEO4J_PASSWORD=test")
@@ -387,23 +422,11 @@ def test_cli_with_config_file(tmp_path):
     assert "Path to configuration file" in result.output
 
 
-def test_cli_without_config_file():
-    """Test CLI without config file parameter uses default settings."""
-    runner = CliRunner()
-    result = runner.invoke(cli, ['--help'])
-    assert result.exit_code == 0
-    assert "Workplace Social Graph AI Agent CLI" in result.output
-
-
 @patch('asyncio.run')
-@patch('src.cli.main.InsightsAgent')
-def test_network_silos_command(mock_agent_class, mock_asyncio):
+@patch.object(cli_main, 'InsightsAgent')
+def test_network_silos_command(mock_agent_class, mock_asyncio, runner):
     """Test network silos command."""
-    runner = CliRunner()
-    mock_agent = AsyncMock()
-    mock_agent.identify_silos.return_value = "Silos analysis result"
-    mock_agent_class.return_value.__aenter__.return_value = mock_agent
-    mock_agent_class.return_value.__aexit__.return_value = None
+    mock_agent_class.return_value = _async_cm_agent(identify_silos="Silos analysis result")
 
     result = runner.invoke(cli, ['network', 'silos'])
 
@@ -412,14 +435,10 @@ def test_network_silos_command(mock_agent_class, mock_asyncio):
 
 
 @patch('asyncio.run')
-@patch('src.cli.main.InsightsAgent')
-def test_network_recommend_connections_command(mock_agent_class, mock_asyncio):
+@patch.object(cli_main, 'InsightsAgent')
+def test_network_recommend_connections_command(mock_agent_class, mock_asyncio, runner):
     """Test network recommend connections command."""
-    runner = CliRunner()
-    mock_agent = AsyncMock()
-    mock_agent.recommend_connections.return_value = "Connection recommendations"
-    mock_agent_class.return_value.__aenter__.return_value = mock_agent
-    mock_agent_class.return_value.__aexit__.return_value = None
+    mock_agent_class.return_value = _async_cm_agent(recommend_connections="Connection recommendations")
 
     result = runner.invoke(cli, ['network', 'recommend-connections', '--email', 'test@example.com', '--limit', '3'])
 
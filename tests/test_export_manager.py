@@ -1,12 +1,13 @@
 """Tests for export manager functionality."""
 
+import json
 from unittest.mock import AsyncMock, Mock, mock_open, patch
 
 import pytest
+from neo4j.exceptions import ClientError
 
 from src.analysis.export_manager import ExportManager
 from src.config.settings import Settings
-from src.database.models import Person
 
 
 class TestExportManager:
@@ -28,7 +29,6 @@ class TestExportManager:
         assert export_manager.neo4j_manager is not None
         assert export_manager.network_analyzer is not None
 
-    @pytest.mark.asyncio
     async def test_export_contacts_csv(self, export_manager):
         """Test exporting contacts to CSV."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -39,13 +39,13 @@ class TestExportManager:
 
                 mock_result = AsyncMock()
                 mock_session_instance.run.return_value = mock_result
+                mock_result.fetch.return_value = []
                 mock_result.__aiter__.return_value = []
 
                 result = await export_manager.export_contacts_csv('test.csv')
 
                 assert result is True
 
-    @pytest.mark.asyncio
     async def test_export_org_chart_json(self, export_manager):
         """Test exporting org chart to JSON."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -56,13 +56,13 @@ class TestExportManager:
 
                 mock_result = AsyncMock()
                 mock_session_instance.run.return_value = mock_result
+                mock_result.fetch.return_value = []
                 mock_result.__aiter__.return_value = []
 
                 result = await export_manager.export_org_chart_json('test.json')
 
                 assert result is True
 
-    @pytest.mark.asyncio
     async def test_export_team_structure_json(self, export_manager):
         """Test exporting team structure to JSON."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -73,13 +73,13 @@ class TestExportManager:
 
                 mock_result = AsyncMock()
                 mock_session_instance.run.return_value = mock_result
+                mock_result.fetch.return_value = []
                 mock_result.__aiter__.return_value = []
 
                 result = await export_manager.export_team_structure_json('test.json')
 
                 assert result is True
 
-    @pytest.mark.asyncio
     async def test_export_network_metrics_csv(self, export_manager):
         """Test exporting network metrics to CSV."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -90,7 +90,6 @@ class TestExportManager:
 
                     assert result is True
 
-    @pytest.mark.asyncio
     async def test_export_interactions_csv(self, export_manager):
         """Test exporting interactions to CSV."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -101,13 +100,13 @@ class TestExportManager:
 
                 mock_result = AsyncMock()
                 mock_session_instance.run.return_value = mock_result
+                mock_result.fetch.return_value = []
                 mock_result.__aiter__.return_value = []
 
                 result = await export_manager.export_interactions_csv('test.csv')
 
                 assert result is True
 
-    @pytest.mark.asyncio
     async def test_export_expertise_directory_json(self, export_manager):
         """Test exporting expertise directory to JSON."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -118,6 +117,7 @@ class TestExportManager:
 
                 mock_result = AsyncMock()
                 mock_session_instance.run.return_value = mock_result
+                mock_result.fetch.return_value = []
                 mock_result.__aiter__.return_value = []
 
                 # Mock network analyzer and its methods properly
@@ -131,7 +131,6 @@ class TestExportManager:
 
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_export_contacts_csv_with_department_filter(self, export_manager):
         """Test exporting contacts to CSV with department filter."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -142,13 +141,13 @@ class TestExportManager:
 
                 mock_result = AsyncMock()
                 mock_session_instance.run.return_value = mock_result
+                mock_result.fetch.return_value = []
                 mock_result.__aiter__.return_value = []
 
                 result = await export_manager.export_contacts_csv('test.csv', department='Engineering')
 
                 assert result is True
 
-    @pytest.mark.asyncio
     async def test_export_contacts_csv_with_personal_notes(self, export_manager):
         """Test exporting contacts to CSV with personal notes."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -159,6 +158,7 @@ class TestExportManager:
 
                 mock_result = AsyncMock()
                 mock_session_instance.run.return_value = mock_result
+                mock_result.fetch.return_value = []
                 mock_result.__aiter__.return_value = [
                     {'p': {'name': 'John Doe', 'email': 'john@test.com', 'notes': 'Great collaborator'}}
                 ]
@@ -167,7 +167,6 @@ class TestExportManager:
 
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_export_contacts_csv_failure(self, export_manager):
         """Test export contacts CSV with failure scenario."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -178,7 +177,6 @@ class TestExportManager:
 
                 assert result is False
 
-    @pytest.mark.asyncio
     async def test_export_org_chart_json_with_department_filter(self, export_manager):
         """Test exporting org chart to JSON with department filter."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -189,6 +187,7 @@ class TestExportManager:
 
                 mock_result = AsyncMock()
                 mock_session_instance.run.return_value = mock_result
+                mock_result.fetch.return_value = []
                 mock_result.__aiter__.return_value = []
 
                 # Mock network analyzer and its async methods properly
@@ -214,7 +213,6 @@ class TestExportManager:
                     assert result is True
                     mock_filter.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_export_org_chart_json_failure(self, export_manager):
         """Test export org chart JSON with failure scenario."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -225,7 +223,6 @@ class TestExportManager:
 
                 assert result is False
 
-    @pytest.mark.asyncio
     async def test_export_team_structure_json_with_department_filter(self, export_manager):
         """Test exporting team structure to JSON with department filter."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -236,13 +233,13 @@ class TestExportManager:
 
                 mock_result = AsyncMock()
                 mock_session_instance.run.return_value = mock_result
+                mock_result.fetch.return_value = []
                 mock_result.__aiter__.return_value = []
 
                 result = await export_manager.export_team_structure_json('test.json', department='Engineering')
 
                 assert result is True
 
-    @pytest.mark.asyncio
     async def test_export_team_structure_json_failure(self, export_manager):
         """Test export team structure JSON with failure scenario."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -253,7 +250,6 @@ class TestExportManager:
 
                 assert result is False
 
-    @pytest.mark.asyncio
     async def test_export_network_metrics_csv_failure(self, export_manager):
         """Test export network metrics CSV with failure scenario."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -265,7 +261,6 @@ class TestExportManager:
 
                     assert result is False
 
-    @pytest.mark.asyncio
     async def test_export_interactions_csv_with_person_filter(self, export_manager):
         """Test exporting interactions to CSV with person filter."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -276,13 +271,13 @@ class TestExportManager:
 
                 mock_result = AsyncMock()
                 mock_session_instance.run.return_value = mock_result
+                mock_result.fetch.return_value = []
                 mock_result.__aiter__.return_value = []
 
                 result = await export_manager.export_interactions_csv('test.csv', person_name='John Doe', days=7)
 
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_export_interactions_csv_failure(self, export_manager):
         """Test export interactions CSV with failure scenario."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -293,7 +288,6 @@ class TestExportManager:
 
                 assert result is False
 
-    @pytest.mark.asyncio
     async def test_export_expertise_directory_json_failure(self, export_manager):
         """Test export expertise directory JSON with failure scenario."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -403,7 +397,6 @@ class TestExportManager:
 
         assert result == 1  # Just John
 
-    @pytest.mark.asyncio
     async def test_export_team_structure_json_with_skills_and_relationships(self, export_manager):
         """Test exporting team structure to JSON with skills and relationships."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -414,6 +407,7 @@ class TestExportManager:
 
                 # Mock people data with skills and managers
                 people_result = AsyncMock()
+                people_result.fetch.return_value = []
                 people_result.__aiter__.return_value = [
                     {'p': {
                         'name': 'John Doe',
@@ -435,6 +429,7 @@ class TestExportManager:
 
                 # Mock relationships data
                 relationships_result = AsyncMock()
+                relationships_result.fetch.return_value = []
                 relationships_result.__aiter__.return_value = [
                     {
                         'from_person': 'John Doe',
@@ -451,7 +446,6 @@ class TestExportManager:
 
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_export_network_metrics_csv_with_department_filter(self, export_manager):
         """Test exporting network metrics to CSV with department filter."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -488,7 +482,6 @@ class TestExportManager:
 
                     assert result is True
 
-    @pytest.mark.asyncio
     async def test_export_interactions_csv_with_all_fields(self, export_manager):
         """Test exporting interactions to CSV with all possible fields."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -499,6 +492,7 @@ class TestExportManager:
 
                 mock_result = AsyncMock()
                 mock_session_instance.run.return_value = mock_result
+                mock_result.fetch.return_value = []
                 mock_result.__aiter__.return_value = [
                     {'i': {
                         'date': '2023-01-01',
@@ -520,7 +514,6 @@ class TestExportManager:
 
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_export_expertise_directory_json_with_full_data(self, export_manager):
         """Test exporting expertise directory to JSON with full person data."""
         with patch('builtins.open', mock_open()) as mock_file:
@@ -531,6 +524,7 @@ class TestExportManager:
 
                 mock_result = AsyncMock()
                 mock_session_instance.run.return_value = mock_result
+                mock_result.fetch.return_value = []
                 mock_result.__aiter__.return_value = []
 
                 # Mock network analyzer and its methods with comprehensive data
@@ -681,3 +675,92 @@ class TestExportManager:
         result = export_manager._count_people_in_org_chart(org_chart)
 
         assert result == 9  # CEO, CTO, VP Sales, 2 Sales Managers, Eng Manager, 3 Developers
+
+    def test_rows_to_frame_joins_list_columns(self, export_manager):
+        """Test list columns are rendered as comma-separated text."""
+        rows = [
+            ('John Doe', ['Python', 'AI']),
+            ('Jane Smith', [])
+        ]
+
+        frame = export_manager._rows_to_frame(
+            rows, ('Name', 'Expertise Areas'), list_columns=['Expertise Areas']
+        )
+
+        assert list(frame.columns) == ['Name', 'Expertise Areas']
+        assert frame['Expertise Areas'].tolist() == ['Python, AI', '']
+
+    def test_write_json_creates_parent_directories(self, export_manager, tmp_path):
+        """Test JSON writer creates missing directories before writing."""
+        output_path = tmp_path / 'nested' / 'export.json'
+
+        export_manager._write_json(output_path, {'metadata': {'export_type': 'test'}})
+
+        assert json.loads(output_path.read_text(encoding='utf-8')) == {'metadata': {'export_type': 'test'}}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_write_json_compact_and_pretty(self, export_manager, tmp_path, use_orjson, pretty):
+        """Test JSON writer emits compact or indented UTF-8 with and without orjson."""
+        output_path = tmp_path / 'export.json'
+        export_data = {'metadata': {'export_type': 'test'}, 'people': ['Zoë Müller']}
+
+        if use_orjson:
+            pytest.importorskip('orjson')
+            export_manager._write_json(output_path, export_data, pretty=pretty)
+        else:
+            with patch('src.analysis.export_manager.orjson', None):
+                export_manager._write_json(output_path, export_data, pretty=pretty)
+
+        text = output_path.read_text(encoding='utf-8')
+        assert json.loads(text) == export_data
+        assert 'Zoë Müller' in text
+        assert ('\n' in text) is pretty
+        if pretty:
+            assert '\n  "metadata"' in text
+
+    async def test_export_contacts_csv_apoc(self, export_manager):
+        """Test server-side contacts export through APOC."""
+        with patch.object(export_manager.neo4j_manager, 'session') as mock_session:
+            mock_session_instance = AsyncMock()
+            mock_session.return_value.__aenter__.return_value = mock_session_instance
+            mock_session.return_value.__aexit__.return_value = None
+
+            mock_result = AsyncMock()
+            mock_result.single.return_value = {'rows': 2}
+            mock_session_instance.run.return_value = mock_result
+
+            result = await export_manager.export_contacts_csv_apoc('contacts.csv')
+
+            assert result is True
+            assert mock_session_instance.run.call_args.kwargs['path'] == 'contacts.csv'
+
+    async def test_export_contacts_csv_apoc_falls_back_without_apoc(self, export_manager):
+        """Test APOC export falls back to the local path when APOC is missing."""
+        with patch.object(export_manager.neo4j_manager, 'session') as mock_session:
+            mock_session_instance = AsyncMock()
+            mock_session.return_value.__aenter__.return_value = mock_session_instance
+            mock_session.return_value.__aexit__.return_value = None
+            mock_session_instance.run.side_effect = ClientError("There is no procedure with the name `apoc.export.csv.query`")
+
+            with patch.object(export_manager, 'export_contacts_csv', AsyncMock(return_value=True)) as mock_export:
+                result = await export_manager.export_contacts_csv_apoc(
+                    '/var/lib/neo4j/import/contacts.csv', client_fallback_path='contacts.csv'
+                )
+
+            assert result is True
+            mock_export.assert_called_once_with('contacts.csv')
+
+    async def test_export_contacts_csv_apoc_fails_without_fallback_path(self, export_manager):
+        """Test APOC export reports failure rather than reusing the server path locally."""
+        with patch.object(export_manager.neo4j_manager, 'session') as mock_session:
+            mock_session_instance = AsyncMock()
+            mock_session.return_value.__aenter__.return_value = mock_session_instance
+            mock_session.return_value.__aexit__.return_value = None
+            mock_session_instance.run.side_effect = ClientError("There is no procedure with the name `apoc.export.csv.query`")
+
+            with patch.object(export_manager, 'export_contacts_csv', AsyncMock(return_value=True)) as mock_export:
+                result = await export_manager.export_contacts_csv_apoc('/var/lib/neo4j/import/contacts.csv')
+
+            assert result is False
+            mock_export.assert_not_called()
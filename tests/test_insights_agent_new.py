@@ -7,7 +7,7 @@ import pytest
 
 from src.agents.insights_agent import InsightsAgent, create_insights_agent
 from src.config.settings import Settings
-from src.database.models import Interaction, Person
+from src.database.models import Person
 
 
 class TestInsightsAgent:
@@ -30,7 +30,6 @@ class TestInsightsAgent:
             Mock(person1_email="bob@company.com", person2_email="alice@company.com", strength=0.6, timestamp=datetime.now())
         ]
 
-    @pytest.mark.asyncio
     async def test_init(self):
         """Test InsightsAgent initialization."""
         settings = Settings()
@@ -39,7 +38,6 @@ class TestInsightsAgent:
         assert agent.neo4j_manager is not None
         assert agent.network_analyzer is None  # Initially None until initialize() is called
 
-    @pytest.mark.asyncio
     async def test_init_with_default_settings(self):
         """Test InsightsAgent initialization with default settings."""
         agent = InsightsAgent()
@@ -47,7 +45,6 @@ class TestInsightsAgent:
         assert agent.neo4j_manager is not None
         assert agent.network_analyzer is None  # Initially None until initialize() is called
 
-    @pytest.mark.asyncio
     async def test_context_manager(self):
         """Test InsightsAgent as context manager."""
         settings = Settings()
@@ -69,7 +66,6 @@ class TestInsightsAgent:
 
                 mock_neo4j.close.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_initialize(self, insights_agent):
         """Test agent initialization."""
         with patch.object(insights_agent.neo4j_manager, 'connect') as mock_connect:
@@ -85,14 +81,12 @@ class TestInsightsAgent:
                 mock_connect.assert_called_once()
                 mock_analyzer.build_graph_from_neo4j.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_close(self, insights_agent):
         """Test agent closure."""
         with patch.object(insights_agent.neo4j_manager, 'close') as mock_close:
             await insights_agent.close()
             mock_close.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_generate_daily_insights(self, insights_agent):
         """Test daily insights generation."""
         # Create a mock graph with proper structure
@@ -124,7 +118,6 @@ class TestInsightsAgent:
             mock_health.assert_called_once()
             mock_recs.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_calculate_network_health(self, insights_agent):
         """Test network health calculation."""
         # Mock network data
@@ -153,7 +146,6 @@ class TestInsightsAgent:
         assert isinstance(result, float)
         assert 0.0 <= result <= 1.0
 
-    @pytest.mark.asyncio
     async def test_analyze_collaboration_patterns(self, insights_agent, sample_interactions):
         """Test collaboration pattern analysis."""
         with patch.object(insights_agent, '_ensure_network_loaded') as mock_ensure, \
@@ -168,7 +160,6 @@ class TestInsightsAgent:
             mock_ensure.assert_called_once()
             mock_interactions.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_analyze_collaboration_patterns_no_interactions(self, insights_agent):
         """Test collaboration pattern analysis with no interactions."""
         with patch.object(insights_agent, '_ensure_network_loaded') as mock_ensure, \
@@ -179,7 +170,6 @@ class TestInsightsAgent:
             assert "🤝" in result
             assert "collaboration" in result.lower()
 
-    @pytest.mark.asyncio
     async def test_identify_silos(self, insights_agent):
         """Test silo identification."""
         # Mock network analyzer with proper return values (not async for find_communities)
@@ -201,7 +191,6 @@ class TestInsightsAgent:
             assert "silos" in result.lower() or "communities" in result.lower()
             mock_ensure.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_identify_silos_no_silos(self, insights_agent):
         """Test silo identification when no silos found."""
         mock_analyzer = Mock()
@@ -219,7 +208,6 @@ class TestInsightsAgent:
             assert "🏗️" in result
             mock_ensure.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_recommend_connections_success(self, insights_agent):
         """Test connection recommendations for valid person."""
         mock_person = Mock(name="John Doe", email="john@company.com", department="Engineering")
@@ -227,7 +215,7 @@ class TestInsightsAgent:
         insights_agent.neo4j_manager.find_person_by_email.return_value = mock_person
         insights_agent.neo4j_manager.get_person_relationships.return_value = []
         insights_agent.neo4j_manager.find_people_by_department.return_value = []
-        insights_agent.neo4j_manager.find_experts.return_value = []
+        insights_agent.neo4j_manager.find_experts_multi.return_value = {}
         insights_agent.neo4j_manager.find_cross_department_connectors.return_value = []
 
         with patch.object(insights_agent, '_ensure_network_loaded') as mock_ensure:
@@ -237,7 +225,6 @@ class TestInsightsAgent:
             assert "John Doe" in result
             mock_ensure.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_recommend_connections_person_not_found(self, insights_agent):
         """Test connection recommendations for non-existent person."""
         insights_agent.neo4j_manager.find_person_by_email.return_value = None
@@ -248,7 +235,6 @@ class TestInsightsAgent:
             assert "❌" in result
             assert "not found" in result.lower()
 
-    @pytest.mark.asyncio
     async def test_ensure_network_loaded_already_loaded(self, insights_agent):
         """Test network loading when already loaded."""
         mock_analyzer = AsyncMock()
@@ -259,7 +245,6 @@ class TestInsightsAgent:
         # Should still call build_graph_from_neo4j as per implementation
         mock_analyzer.build_graph_from_neo4j.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_ensure_network_loaded_not_loaded(self, insights_agent):
         """Test network loading when not loaded."""
         insights_agent.network_analyzer.graph = None
@@ -270,7 +255,6 @@ class TestInsightsAgent:
 
         mock_analyzer.build_graph_from_neo4j.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_generate_recommendations(self, insights_agent):
         """Test recommendation generation."""
         # Mock network analyzer with proper sync methods
@@ -287,7 +271,6 @@ class TestInsightsAgent:
         assert isinstance(recommendations, list)
         assert len(recommendations) > 0
 
-    @pytest.mark.asyncio
     async def test_analyze_cross_department_collaboration(self, insights_agent, sample_interactions):
         """Test cross-department collaboration analysis."""
         # Mock person lookups to avoid database connections
@@ -306,14 +289,12 @@ class TestInsightsAgent:
 
             assert isinstance(result, dict)
 
-    @pytest.mark.asyncio
     async def test_analyze_collaboration_trends(self, insights_agent, sample_interactions):
         """Test collaboration trends analysis."""
         result = await insights_agent._analyze_collaboration_trends(sample_interactions)
 
         assert isinstance(result, list)
 
-    @pytest.mark.asyncio
     async def test_generate_silo_reduction_suggestions(self, insights_agent):
         """Test silo reduction suggestions generation."""
         isolated_depts = ["IT", "HR"]
@@ -324,7 +305,6 @@ class TestInsightsAgent:
         assert len(suggestions) > 0
 
 
-@pytest.mark.asyncio
 async def test_create_insights_agent():
     """Test create_insights_agent function."""
     with patch('src.agents.insights_agent.InsightsAgent') as mock_agent_class:
@@ -338,7 +318,6 @@ async def test_create_insights_agent():
         assert result == mock_agent
 
 
-@pytest.mark.asyncio
 async def test_create_insights_agent_with_settings():
     """Test create_insights_agent function with custom settings."""
     custom_settings = Settings()
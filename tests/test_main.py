@@ -1,15 +1,14 @@
 """Tests for the main module."""
 from unittest.mock import MagicMock, patch
 
-import pytest
-
 
 def test_main_entry_point():
     """Test main entry point execution."""
     # Mock the CLI and settings to avoid actual execution
     with patch('src.main.cli') as mock_cli, \
-         patch('src.main.Settings') as mock_settings, \
-         patch('src.main.setup_logging') as mock_setup_logging:
+         patch('src.main.get_settings') as mock_settings, \
+         patch('src.main.setup_logging') as mock_setup_logging, \
+         patch('src.main.install_event_loop_policy') as mock_install_loop:
 
         # Mock settings instance
         mock_settings_instance = MagicMock()
@@ -27,6 +26,7 @@ def test_main_entry_point():
         # Verify calls
         mock_settings.assert_called_once()
         mock_setup_logging.assert_called_once_with(mock_settings_instance)
+        mock_install_loop.assert_called_once()
         mock_cli.assert_called_once()
 
 
@@ -38,9 +38,10 @@ def test_main_module_import():
 
 
 @patch('src.main.cli')
-@patch('src.main.Settings')
+@patch('src.main.get_settings')
 @patch('src.main.setup_logging')
-def test_main_if_name_main(mock_setup_logging, mock_settings, mock_cli):
+@patch('src.main.install_event_loop_policy')
+def test_main_if_name_main(mock_install_loop, mock_setup_logging, mock_settings, mock_cli):
     """Test the if __name__ == '__main__' block."""
     # Mock settings instance
     mock_settings_instance = MagicMock()
@@ -87,3 +88,25 @@ def test_setup_logging():
         assert 'level' in call_args[1]
         assert 'format' in call_args[1]
         assert 'handlers' in call_args[1]
+
+
+def test_install_event_loop_policy_without_uvloop():
+    """Test that the default loop is kept when uvloop is not installed."""
+    from src.main import install_event_loop_policy
+
+    with patch('src.main.uvloop', None), \
+         patch('src.main.asyncio.set_event_loop_policy') as mock_set_policy:
+        assert install_event_loop_policy() is False
+        mock_set_policy.assert_not_called()
+
+
+def test_install_event_loop_policy_with_uvloop():
+    """Test that the uvloop policy is installed when available."""
+    from src.main import install_event_loop_policy
+
+    fake_uvloop = MagicMock()
+    with patch('src.main.uvloop', fake_uvloop), \
+         patch('src.main.sys.platform', 'linux'), \
+         patch('src.main.asyncio.set_event_loop_policy') as mock_set_policy:
+        assert install_event_loop_policy() is True
+        mock_set_policy.assert_called_once_with(fake_uvloop.EventLoopPolicy.return_value)
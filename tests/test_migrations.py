@@ -7,7 +7,11 @@ import pytest
 from src.config.settings import Settings
 from src.database.migrations import (InitialWorkplaceGraphMigration, Migration,
                                      MigrationManager,
+                                     MigrationTrackingMigration,
+                                     RelationshipTypeMigration,
                                      WorkplaceHierarchyMigration,
+                                     _create_index_statements,
+                                     _drop_index_statements,
                                      initialize_database, reset_database)
 from src.database.neo4j_manager import Neo4jManager
 
@@ -36,7 +40,6 @@ class TestMigrations:
         assert migration.name == "test_migration"
         assert migration.version == "1.0.0"
 
-    @pytest.mark.asyncio
     async def test_initial_schema_migration(self, neo4j_manager):
         """Test initial schema migration."""
         migration = InitialWorkplaceGraphMigration()
@@ -53,7 +56,70 @@ class TestMigrations:
             # Should have called session
             mock_session.assert_called()
 
-    @pytest.mark.asyncio
+    def test_index_statements_are_generated_in_pairs(self):
+        """Test that every generated index has a matching drop statement."""
+        creates = _create_index_statements()
+        drops = _drop_index_statements()
+
+        assert len(creates) == len(drops) == 9
+        assert "CREATE INDEX person_expertise_lookup IF NOT EXISTS FOR (n:Person) ON (n.expertise_areas)" in creates
+        assert "CREATE INDEX relationship_type_lookup IF NOT EXISTS FOR ()-[n:WORKS_WITH]-() ON (n.type)" in creates
+        for create, drop in zip(creates, drops):
+            assert create.split()[2] == drop.split()[2]
+
+    async def test_initial_schema_migration_batches_ddl(self, neo4j_manager):
+        """Test that schema statements run in one transaction per category."""
+        migration = InitialWorkplaceGraphMigration()
+
+        with patch.object(neo4j_manager, 'session') as mock_session:
+            mock_session_instance = AsyncMock()
+            mock_session.return_value.__aenter__.return_value = mock_session_instance
+            mock_session.return_value.__aexit__.return_value = None
+
+            mock_tx = AsyncMock()
+
+            async def execute_write(work, *args, **kwargs):
+                return await work(mock_tx, *args, **kwargs)
+
+            mock_session_instance.execute_write.side_effect = execute_write
+
+            await migration.up(neo4j_manager)
+
+            # Constraints and indexes each get one managed transaction
+            assert mock_session_instance.execute_write.await_count == 2
+            assert mock_tx.run.await_count == 11
+
+    @pytest.mark.parametrize("debug, expected_runs", [(False, 0), (True, 2)])
+    async def test_schema_validation_only_in_debug(self, neo4j_manager, debug, expected_runs):
+        """Test that the validation MERGE/DELETE round-trip runs only in debug mode."""
+        migration = InitialWorkplaceGraphMigration()
+        neo4j_manager.settings = neo4j_manager.settings.model_copy(update={"debug": debug})
+
+        with patch.object(neo4j_manager, 'session') as mock_session:
+            mock_session_instance = AsyncMock()
+            mock_session.return_value.__aenter__.return_value = mock_session_instance
+            mock_session.return_value.__aexit__.return_value = None
+
+            await migration.up(neo4j_manager)
+
+            assert mock_session_instance.run.await_count == expected_runs
+
+    async def test_schema_batch_failure_falls_back_to_single_statements(self, neo4j_manager):
+        """Test that a failed DDL batch is retried statement by statement."""
+        migration = InitialWorkplaceGraphMigration()
+
+        with patch.object(neo4j_manager, 'session') as mock_session:
+            mock_session_instance = AsyncMock()
+            mock_session.return_value.__aenter__.return_value = mock_session_instance
+            mock_session.return_value.__aexit__.return_value = None
+
+            mock_session_instance.execute_write.side_effect = Exception("Equivalent index exists")
+
+            await migration.down(neo4j_manager)
+
+            # Nine index drops and two constraint drops, each on its own session
+            assert mock_session_instance.run.await_count == 11
+
     async def test_add_indexes_migration(self, neo4j_manager):
         """Test add indexes migration."""
         migration = WorkplaceHierarchyMigration()
@@ -70,7 +136,49 @@ class TestMigrations:
             # Should have called session
             mock_session.assert_called()
 
-    @pytest.mark.asyncio
+    async def test_relationship_type_migration_creates_type_constraint(self, neo4j_manager):
+        """Test that the WORKS_WITH type constraint ships as its own migration version."""
+        migration = RelationshipTypeMigration()
+
+        with patch.object(neo4j_manager, 'session') as mock_session:
+            mock_session_instance = AsyncMock()
+            mock_session.return_value.__aenter__.return_value = mock_session_instance
+            mock_session.return_value.__aexit__.return_value = None
+
+            await migration.up(neo4j_manager)
+
+            _, statements = mock_session_instance.execute_write.call_args[0]
+            assert statements == [
+                "CREATE CONSTRAINT works_with_type_exists IF NOT EXISTS "
+                "FOR ()-[r:WORKS_WITH]-() REQUIRE r.type IS NOT NULL"
+            ]
+
+    async def test_tracking_migration_creates_unique_constraint(self, neo4j_manager):
+        """Test that the tracking constraint ships as its own migration version."""
+        migration = MigrationTrackingMigration()
+
+        with patch.object(neo4j_manager, 'session') as mock_session:
+            mock_session_instance = AsyncMock()
+            mock_session.return_value.__aenter__.return_value = mock_session_instance
+            mock_session.return_value.__aexit__.return_value = None
+
+            await migration.up(neo4j_manager)
+
+            _, statements = mock_session_instance.execute_write.call_args[0]
+            assert statements == [
+                "CREATE CONSTRAINT applied_migration_unique IF NOT EXISTS "
+                "FOR (m:AppliedMigration) REQUIRE m.version IS UNIQUE"
+            ]
+
+    async def test_migrate_applies_new_constraints_to_existing_databases(self, migration_manager):
+        """Test that databases already at 0.1.0 and 0.2.0 still pick up the later constraints."""
+        with patch.object(migration_manager, 'get_applied_migrations', return_value=["0.1.0", "0.2.0"]):
+            with patch.object(migration_manager, 'apply_migration') as mock_apply:
+                await migration_manager.migrate()
+
+                applied_versions = [call.args[0].version for call in mock_apply.call_args_list]
+                assert applied_versions == ["0.3.0", "0.4.0"]
+
     async def test_migration_manager_get_applied_migrations(self, migration_manager):
         """Test getting applied migrations."""
         with patch.object(migration_manager.manager, 'session') as mock_session:
@@ -87,7 +195,6 @@ class TestMigrations:
             assert isinstance(applied, list)
             assert applied == ["1.0.0", "2.0.0"]
 
-    @pytest.mark.asyncio
     async def test_migration_manager_apply_migration(self, migration_manager):
         """Test applying a migration."""
         migration = InitialWorkplaceGraphMigration()
@@ -104,7 +211,23 @@ class TestMigrations:
             # Should have used session
             mock_session.assert_called()
 
-    @pytest.mark.asyncio
+    async def test_apply_migration_records_version_node(self, migration_manager):
+        """Test that an applied migration is tracked as its own node."""
+        migration = WorkplaceHierarchyMigration()
+        applied = set()
+
+        with patch.object(migration_manager.manager, 'session') as mock_session:
+            mock_session_instance = AsyncMock()
+            mock_session.return_value.__aenter__.return_value = mock_session_instance
+            mock_session.return_value.__aexit__.return_value = None
+
+            await migration_manager.apply_migration(migration, applied)
+
+            _, track_query = mock_session_instance.execute_write.call_args[0]
+            assert "MERGE (m:AppliedMigration {version: $version})" in track_query
+            assert mock_session_instance.execute_write.call_args[1] == {"version": "0.2.0"}
+            assert applied == {"0.2.0"}
+
     async def test_migration_manager_migrate(self, migration_manager):
         """Test running all migrations."""
         with patch.object(migration_manager, 'get_applied_migrations', return_value=[]):
@@ -115,7 +238,18 @@ class TestMigrations:
                 # Should have tried to apply migrations
                 assert mock_apply.call_count >= 0
 
-    @pytest.mark.asyncio
+    async def test_migrate_fetches_applied_migrations_once(self, migration_manager):
+        """Test that migrate reads the tracker once and shares it with each apply."""
+        with patch.object(migration_manager, 'get_applied_migrations', return_value=[]) as mock_get_applied:
+            with patch.object(migration_manager.manager, 'session') as mock_session:
+                mock_session_instance = AsyncMock()
+                mock_session.return_value.__aenter__.return_value = mock_session_instance
+                mock_session.return_value.__aexit__.return_value = None
+
+                await migration_manager.migrate()
+
+                mock_get_applied.assert_called_once()
+
     async def test_migration_manager_rollback(self, migration_manager):
         """Test rolling back migrations."""
         with patch.object(migration_manager, 'get_applied_migrations', return_value=["0.1.0", "0.2.0"]):
@@ -131,10 +265,9 @@ class TestMigrations:
                 # Should have used session for rollback
                 mock_session.assert_called()
 
-    @pytest.mark.asyncio
     async def test_initialize_database(self):
         """Test database initialization."""
-        with patch('src.database.neo4j_manager.get_neo4j_manager') as mock_get_manager:
+        with patch('src.database.migrations.get_neo4j_manager') as mock_get_manager:
             mock_manager = AsyncMock()
             mock_get_manager.return_value = mock_manager
 
@@ -147,10 +280,9 @@ class TestMigrations:
                 mock_get_manager.assert_called_once()
                 mock_migration_manager.migrate.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_reset_database(self):
         """Test database reset."""
-        with patch('src.database.neo4j_manager.get_neo4j_manager') as mock_get_manager:
+        with patch('src.database.migrations.get_neo4j_manager') as mock_get_manager:
             mock_manager = Mock()  # Use Mock, not AsyncMock for the manager itself
             mock_get_manager.return_value = mock_manager
 
@@ -170,14 +302,19 @@ class TestMigrations:
                 mock_manager.session.assert_called_once()
                 mock_init_db.assert_called_once()
 
-    @pytest.mark.asyncio
+                # Deletes in batches of export_batch_size rows
+                query = mock_session_instance.run.call_args[0][0]
+                assert "IN TRANSACTIONS OF $batch ROWS" in query
+                assert mock_session_instance.run.call_args[1] == {
+                    "batch": mock_manager.settings.export_batch_size
+                }
+
     async def test_migration_error_handling(self, migration_manager):
         """Test error handling in migrations."""
         with patch.object(migration_manager.manager, 'session', side_effect=Exception("Database error")):
             with pytest.raises(Exception, match="Database error"):
                 await migration_manager.migrate()
 
-    @pytest.mark.asyncio
     async def test_migration_down_operation(self, neo4j_manager):
         """Test migration down operation."""
         migration = InitialWorkplaceGraphMigration()
@@ -194,7 +331,6 @@ class TestMigrations:
             # Should have called session
             mock_session.assert_called()
 
-    @pytest.mark.asyncio
     async def test_indexes_migration_down(self, neo4j_manager):
         """Test indexes migration down operation."""
         migration = WorkplaceHierarchyMigration()
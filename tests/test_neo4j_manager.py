@@ -1,13 +1,32 @@
 """Tests for Neo4j database manager."""
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from neo4j import READ_ACCESS
 
 from src.config.settings import Settings
 from src.database.models import Interaction, Person, WorkRelationship
-from src.database.neo4j_manager import Neo4jManager, get_neo4j_manager
+from src.database.neo4j_manager import (_FIND_EXPERTS_QUERIES, Neo4jManager,
+                                        _run_unwind_queries,
+                                        _walk_manager_chain, get_neo4j_manager)
+
+
+class _ManagerGraphTx:
+    """Read transaction stand-in answering manager lookups from an edge map."""
+
+    def __init__(self, managers):
+        self.managers = managers
+        self.lookups = []
+
+    async def run(self, query, name):
+        self.lookups.append(name)
+        result = AsyncMock()
+        candidates = sorted(self.managers.get(name, []))
+        result.single.return_value = {"m": {"name": candidates[0]}} if candidates else None
+        return result
 
 
 class TestNeo4jManager:
@@ -73,7 +92,6 @@ class TestNeo4jManager:
         assert manager.user == "custom_user"
         assert manager.password == "custom_pass"
 
-    @pytest.mark.asyncio
     async def test_connect_success(self, neo4j_manager):
         """Test successful connection."""
         with patch('src.database.neo4j_manager.AsyncGraphDatabase') as mock_gdb:
@@ -85,12 +103,15 @@ class TestNeo4jManager:
 
             mock_gdb.driver.assert_called_once_with(
                 neo4j_manager.uri,
-                auth=(neo4j_manager.user, neo4j_manager.password)
+                auth=(neo4j_manager.user, neo4j_manager.password),
+                max_connection_pool_size=neo4j_manager.settings.neo4j_max_connection_pool_size,
+                connection_acquisition_timeout=neo4j_manager.settings.neo4j_connection_acquisition_timeout,
+                max_connection_lifetime=neo4j_manager.settings.neo4j_max_connection_lifetime,
+                keep_alive=True
             )
             mock_driver.verify_connectivity.assert_called_once()
             assert neo4j_manager._driver == mock_driver
 
-    @pytest.mark.asyncio
     async def test_connect_timeout_error(self, neo4j_manager):
         """Test connection timeout error."""
         with patch('src.database.neo4j_manager.AsyncGraphDatabase') as mock_gdb, \
@@ -102,7 +123,6 @@ class TestNeo4jManager:
             with pytest.raises(Exception, match="Timeout"):
                 await neo4j_manager.connect()
 
-    @pytest.mark.asyncio
     async def test_connect_auth_error(self, neo4j_manager):
         """Test connection authentication error."""
         with patch('src.database.neo4j_manager.AsyncGraphDatabase') as mock_gdb:
@@ -114,7 +134,6 @@ class TestNeo4jManager:
             with pytest.raises(AuthError, match="Auth failed"):
                 await neo4j_manager.connect()
 
-    @pytest.mark.asyncio
     async def test_close(self, neo4j_manager):
         """Test closing connections."""
         # Mock driver
@@ -125,13 +144,46 @@ class TestNeo4jManager:
 
         mock_driver.close.assert_called_once()
 
-    @pytest.mark.asyncio
+    async def test_hot_session_is_reused_and_closed(self, neo4j_manager):
+        """Test that the hot session is opened once and closed with the manager."""
+        mock_driver = Mock()
+        mock_driver.close = AsyncMock()
+        mock_session = AsyncMock()
+        mock_driver.session.return_value = mock_session
+        neo4j_manager._driver = mock_driver
+
+        async with neo4j_manager.hot_session() as first:
+            pass
+        async with neo4j_manager.hot_session() as second:
+            pass
+
+        assert first is second is mock_session
+        mock_driver.session.assert_called_once_with(database=neo4j_manager.database)
+
+        await neo4j_manager.close()
+
+        mock_session.close.assert_awaited_once()
+        assert neo4j_manager._hot_session is None
+
+    async def test_hot_session_dropped_after_error(self, neo4j_manager):
+        """Test that a failing hot session is closed and replaced."""
+        mock_driver = Mock()
+        mock_driver.session.side_effect = [AsyncMock(), AsyncMock()]
+        neo4j_manager._driver = mock_driver
+
+        with pytest.raises(RuntimeError):
+            async with neo4j_manager.hot_session() as failed:
+                raise RuntimeError("connection reset")
+
+        failed.close.assert_awaited_once()
+        async with neo4j_manager.hot_session() as replacement:
+            assert replacement is not failed
+
     async def test_close_no_driver(self, neo4j_manager):
         """Test closing when no driver exists."""
         neo4j_manager._driver = None
         await neo4j_manager.close()  # Should not raise exception
 
-    @pytest.mark.asyncio
     async def test_session_context_manager(self, neo4j_manager):
         """Test session context manager."""
         # Mock the driver
@@ -152,28 +204,68 @@ class TestNeo4jManager:
 
         mock_driver.session.assert_called_once_with(database=neo4j_manager.database)
 
-    @pytest.mark.asyncio
+    async def test_session_context_manager_with_fetch_size(self, neo4j_manager):
+        """Test session context manager forwards fetch size to the driver."""
+        mock_driver = Mock()
+        mock_session = Mock()
+
+        async def close_session():
+            pass
+        mock_session.close = close_session
+
+        mock_driver.session = Mock(return_value=mock_session)
+        neo4j_manager._driver = mock_driver
+
+        async with neo4j_manager.session(fetch_size=10000) as session:
+            assert session is mock_session
+
+        mock_driver.session.assert_called_once_with(
+            database=neo4j_manager.database,
+            fetch_size=10000
+        )
+
+    async def test_session_context_manager_with_access_mode(self, neo4j_manager):
+        """Test session context manager forwards the access mode to the driver."""
+        mock_driver = Mock()
+        mock_session = Mock()
+
+        async def close_session():
+            pass
+        mock_session.close = close_session
+
+        mock_driver.session = Mock(return_value=mock_session)
+        neo4j_manager._driver = mock_driver
+
+        async with neo4j_manager.session(default_access_mode="READ") as session:
+            assert session is mock_session
+
+        mock_driver.session.assert_called_once_with(
+            database=neo4j_manager.database,
+            default_access_mode="READ"
+        )
+
     async def test_add_coworker(self, neo4j_manager, sample_person):
         """Test adding a coworker."""
         mock_session = AsyncMock()
         mock_result = AsyncMock()
-        mock_result.single.return_value = {"name": "John Doe"}
         mock_session.run.return_value = mock_result
 
-        with patch.object(neo4j_manager, 'session') as mock_session_cm:
+        with patch.object(neo4j_manager, 'hot_session') as mock_session_cm:
             mock_session_cm.return_value.__aenter__.return_value = mock_session
             mock_session_cm.return_value.__aexit__.return_value = None
             result = await neo4j_manager.add_coworker(sample_person)
 
         assert result == "John Doe"
         mock_session.run.assert_called_once()
+        # The write streams no records back
+        assert "RETURN" not in mock_session.run.call_args[0][0]
+        mock_result.consume.assert_awaited_once()
+        mock_result.single.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_get_person_by_name_found(self, neo4j_manager):
         """Test finding person by name when found."""
         mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.single.return_value = {
+        mock_session.execute_read.return_value = {
             "p": {
                 "name": "John Doe",
                 "email": "john@test.com",
@@ -181,7 +273,6 @@ class TestNeo4jManager:
                 "role": "Developer"
             }
         }
-        mock_session.run.return_value = mock_result
 
         with patch.object(neo4j_manager, 'session') as mock_session_cm:
             mock_session_cm.return_value.__aenter__.return_value = mock_session
@@ -192,14 +283,14 @@ class TestNeo4jManager:
             assert result is not None
             assert result.name == "John Doe"
             assert result.email == "john@test.com"
+            # Single-record reads run in one managed read transaction
+            mock_session.execute_read.assert_awaited_once()
+            mock_session.run.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_get_person_by_name_not_found(self, neo4j_manager):
         """Test finding person by name when not found."""
         mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.single.return_value = None
-        mock_session.run.return_value = mock_result
+        mock_session.execute_read.return_value = None
 
         with patch.object(neo4j_manager, 'session') as mock_session_cm:
             mock_session_cm.return_value.__aenter__.return_value = mock_session
@@ -209,12 +300,84 @@ class TestNeo4jManager:
 
             assert result is None
 
-    @pytest.mark.asyncio
+    async def test_get_person_by_name_served_from_cache(self, neo4j_manager):
+        """Test that a repeated lookup is answered from the cache."""
+        with patch.object(neo4j_manager, '_read_single',
+                          return_value={"p": {"name": "John Doe", "role": "Developer"}}) as mock_read:
+            first = await neo4j_manager.get_person_by_name("John Doe")
+            second = await neo4j_manager.get_person_by_name("John Doe")
+
+        assert first.role == second.role == "Developer"
+        assert first is not second
+        mock_read.assert_awaited_once()
+
+    async def test_person_cache_isolated_from_caller_mutation(self, neo4j_manager):
+        """Test that mutating a returned person leaves the cached entry intact."""
+        row = {"p": {"name": "John Doe", "expertise_areas": ["Python"], "attributes": '{"team": "Core"}'}}
+        with patch.object(neo4j_manager, '_read_single', return_value=row) as mock_read:
+            first = await neo4j_manager.get_person_by_name("John Doe")
+            first.expertise_areas.append("Go")
+            first.attributes["team"] = "Platform"
+
+            second = await neo4j_manager.get_person_by_name("John Doe")
+            second.expertise_areas.append("Rust")
+            third = await neo4j_manager.get_person_by_name("John Doe")
+
+        assert second.expertise_areas == ["Python", "Rust"]
+        assert third.expertise_areas == ["Python"]
+        assert third.attributes == {"team": "Core"}
+        mock_read.assert_awaited_once()
+
+    async def test_person_cache_invalidated_by_write(self, neo4j_manager, sample_person):
+        """Test that writing a person drops its cached lookup."""
+        mock_session = AsyncMock()
+
+        with patch.object(neo4j_manager, '_read_single',
+                          return_value={"p": {"name": "John Doe"}}) as mock_read, \
+             patch.object(neo4j_manager, 'hot_session') as mock_session_cm:
+            mock_session_cm.return_value.__aenter__.return_value = mock_session
+            mock_session_cm.return_value.__aexit__.return_value = None
+
+            await neo4j_manager.get_person_by_name("John Doe")
+            await neo4j_manager.add_coworker(sample_person)
+            await neo4j_manager.get_person_by_name("John Doe")
+
+        assert mock_read.await_count == 2
+
+    async def test_person_cache_shares_concurrent_misses(self, neo4j_manager):
+        """Test that concurrent lookups of one name run a single query."""
+        release = asyncio.Event()
+
+        async def slow_read(query, **params):
+            await release.wait()
+            return {"p": {"name": params["name"]}}
+
+        with patch.object(neo4j_manager, '_read_single', side_effect=slow_read) as mock_read:
+            lookups = asyncio.gather(*(neo4j_manager.get_person_by_name("John Doe") for _ in range(3)))
+            await asyncio.sleep(0)
+            release.set()
+            people = await lookups
+
+        assert [person.name for person in people] == ["John Doe"] * 3
+        mock_read.assert_awaited_once()
+
+    async def test_person_cache_evicts_least_recently_used(self, neo4j_manager):
+        """Test that the cache stays within its configured size."""
+        neo4j_manager.settings.person_cache_size = 2
+
+        async def read(query, **params):
+            return {"p": {"name": params["name"]}}
+
+        with patch.object(neo4j_manager, '_read_single', side_effect=read):
+            for name in ("Ann", "Bob", "Ann", "Cid"):
+                await neo4j_manager.get_person_by_name(name)
+
+        assert list(neo4j_manager._person_cache) == ["Ann", "Cid"]
+
     async def test_find_person_by_email_found(self, neo4j_manager):
         """Test finding person by email when found."""
         mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.single.return_value = {
+        mock_session.execute_read.return_value = {
             "p": {
                 "name": "John Doe",
                 "email": "john@test.com",
@@ -222,7 +385,6 @@ class TestNeo4jManager:
                 "role": "Developer"
             }
         }
-        mock_session.run.return_value = mock_result
 
         with patch.object(neo4j_manager, 'session') as mock_session_cm:
             mock_session_cm.return_value.__aenter__.return_value = mock_session
@@ -234,13 +396,10 @@ class TestNeo4jManager:
             assert result.name == "John Doe"
             assert result.email == "john@test.com"
 
-    @pytest.mark.asyncio
     async def test_find_person_by_email_not_found(self, neo4j_manager):
         """Test finding person by email when not found."""
         mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.single.return_value = None
-        mock_session.run.return_value = mock_result
+        mock_session.execute_read.return_value = None
 
         with patch.object(neo4j_manager, 'session') as mock_session_cm:
             mock_session_cm.return_value.__aenter__.return_value = mock_session
@@ -250,13 +409,10 @@ class TestNeo4jManager:
 
             assert result is None
 
-    @pytest.mark.asyncio
     async def test_count_people(self, neo4j_manager):
         """Test counting people."""
         mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.single.return_value = {"count": 10}
-        mock_session.run.return_value = mock_result
+        mock_session.execute_read.return_value = {"count": 10}
 
         with patch.object(neo4j_manager, 'session') as mock_session_cm:
             mock_session_cm.return_value.__aenter__.return_value = mock_session
@@ -266,13 +422,10 @@ class TestNeo4jManager:
 
             assert result == 10
 
-    @pytest.mark.asyncio
     async def test_count_relationships(self, neo4j_manager):
         """Test counting relationships."""
         mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.single.return_value = {"count": 25}
-        mock_session.run.return_value = mock_result
+        mock_session.execute_read.return_value = {"count": 25}
 
         with patch.object(neo4j_manager, 'session') as mock_session_cm:
             mock_session_cm.return_value.__aenter__.return_value = mock_session
@@ -282,14 +435,13 @@ class TestNeo4jManager:
 
             assert result == 25
 
-    @pytest.mark.asyncio
     async def test_add_relationship_bidirectional(self, neo4j_manager, sample_relationship):
         """Test adding a bidirectional relationship."""
         mock_session = AsyncMock()
         mock_result = AsyncMock()
         mock_session.run.return_value = mock_result
 
-        with patch.object(neo4j_manager, 'session') as mock_session_cm, \
+        with patch.object(neo4j_manager, 'hot_session') as mock_session_cm, \
              patch.object(neo4j_manager, '_ensure_person_exists') as mock_ensure:
             mock_session_cm.return_value.__aenter__.return_value = mock_session
             mock_session_cm.return_value.__aexit__.return_value = None
@@ -297,12 +449,16 @@ class TestNeo4jManager:
             result = await neo4j_manager.add_relationship(sample_relationship)
 
             assert result is True
-            # Should call ensure_person_exists for both people
-            assert mock_ensure.call_count == 2
-            # Should call run twice (forward and reverse relationship)
-            assert mock_session.run.call_count == 2
+            # Endpoints are merged by the same query
+            mock_ensure.assert_not_called()
+            # One query in one managed transaction writes both directions
+            mock_session.execute_write.assert_awaited_once()
+            ((query, rows),) = mock_session.execute_write.call_args[0][1]
+            assert rows[0]["properties"]["bidirectional"] is True
+            # The reverse edge is merged inside the same statement, not a second run
+            assert "FOREACH" in query and "MERGE (to)-[reverse:WORKS_WITH" in query
+            mock_session.run.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_add_relationship_unidirectional(self, neo4j_manager):
         """Test adding a unidirectional relationship."""
         relationship = WorkRelationship(
@@ -318,7 +474,7 @@ class TestNeo4jManager:
         mock_result = AsyncMock()
         mock_session.run.return_value = mock_result
 
-        with patch.object(neo4j_manager, 'session') as mock_session_cm, \
+        with patch.object(neo4j_manager, 'hot_session') as mock_session_cm, \
              patch.object(neo4j_manager, '_ensure_person_exists') as mock_ensure:
             mock_session_cm.return_value.__aenter__.return_value = mock_session
             mock_session_cm.return_value.__aexit__.return_value = None
@@ -326,19 +482,18 @@ class TestNeo4jManager:
             result = await neo4j_manager.add_relationship(relationship)
 
             assert result is True
-            # Should call ensure_person_exists for both people
-            assert mock_ensure.call_count == 2
-            # Should call run only once (no reverse relationship)
-            assert mock_session.run.call_count == 1
+            mock_ensure.assert_not_called()
+            mock_session.execute_write.assert_awaited_once()
+            ((_, rows),) = mock_session.execute_write.call_args[0][1]
+            assert rows[0]["properties"]["bidirectional"] is False
 
-    @pytest.mark.asyncio
     async def test_add_interaction(self, neo4j_manager, sample_interaction):
         """Test adding an interaction."""
         mock_session = AsyncMock()
         mock_result = AsyncMock()
         mock_session.run.return_value = mock_result
 
-        with patch.object(neo4j_manager, 'session') as mock_session_cm, \
+        with patch.object(neo4j_manager, 'hot_session') as mock_session_cm, \
              patch.object(neo4j_manager, '_ensure_person_exists') as mock_ensure:
             mock_session_cm.return_value.__aenter__.return_value = mock_session
             mock_session_cm.return_value.__aexit__.return_value = None
@@ -346,22 +501,67 @@ class TestNeo4jManager:
             result = await neo4j_manager.add_interaction(sample_interaction)
 
             assert result is True
-            # Should call ensure_person_exists once for with_person
-            assert mock_ensure.call_count == 1
-            # Should call run twice (create interaction + update person)
-            assert mock_session.run.call_count == 2
+            # Person merge, interaction and last-interaction update in one query
+            mock_ensure.assert_not_called()
+            mock_session.execute_write.assert_awaited_once()
+            ((query, rows),) = mock_session.execute_write.call_args[0][1]
+            assert rows[0]["with_person"] == "Jane Smith"
+            assert "MERGE (p:Person {name: row.with_person})" in query
+            assert "SET p.last_interaction = row.date" in query
+            mock_session.run.assert_not_called()
+
+    async def test_add_relationships_batches_both_directions(self, neo4j_manager, sample_relationship):
+        """Test that bulk relationships are written by one statement."""
+        one_way = WorkRelationship(
+            from_person="Ann",
+            to_person="Bob",
+            relationship_type="mentor",
+            bidirectional=False
+        )
+        mock_session = AsyncMock()
+
+        with patch.object(neo4j_manager, 'hot_session') as mock_session_cm:
+            mock_session_cm.return_value.__aenter__.return_value = mock_session
+            mock_session_cm.return_value.__aexit__.return_value = None
+
+            result = await neo4j_manager.add_relationships([sample_relationship, one_way])
+
+        assert result is True
+        mock_session.execute_write.assert_awaited_once()
+        _, statements = mock_session.execute_write.call_args[0]
+        ((_, rows),) = statements
+        assert [(r["from_person"], r["to_person"], r["properties"]["bidirectional"]) for r in rows] == [
+            ("John Doe", "Jane Smith", True), ("Ann", "Bob", False)
+        ]
+
+    async def test_batch_queues_writes_until_end(self, neo4j_manager, sample_person,
+                                                 sample_relationship, sample_interaction):
+        """Test that writes between begin_batch and end_batch share one transaction."""
+        mock_session = AsyncMock()
+
+        with patch.object(neo4j_manager, 'hot_session') as mock_session_cm:
+            mock_session_cm.return_value.__aenter__.return_value = mock_session
+            mock_session_cm.return_value.__aexit__.return_value = None
+
+            neo4j_manager.begin_batch()
+            assert await neo4j_manager.add_coworker(sample_person) == "John Doe"
+            assert await neo4j_manager.add_relationship(sample_relationship) is True
+            assert await neo4j_manager.add_interaction(sample_interaction) is True
+            mock_session.run.assert_not_called()
+
+            await neo4j_manager.end_batch()
+
+        mock_session.execute_write.assert_awaited_once()
+        _, statements = mock_session.execute_write.call_args[0]
+        assert [len(rows) for _, rows in statements] == [1, 1, 1]
+        assert neo4j_manager._pending is None
 
-    @pytest.mark.asyncio
     async def test_find_experts_with_department(self, neo4j_manager):
         """Test finding experts with department filter."""
         mock_session = AsyncMock()
         mock_result = AsyncMock()
 
-        # Mock the async iteration
-        async def mock_async_iter(self):
-            yield {"p": {"name": "Jane Doe", "email": "jane@test.com", "department": "Engineering", "expertise_areas": ["Python"]}}
-
-        mock_result.__aiter__ = mock_async_iter
+        mock_result.data.return_value = [{"p": {"name": "Jane Doe", "email": "jane@test.com", "department": "Engineering", "expertise_areas": ["Python"]}}]
         mock_session.run.return_value = mock_result
 
         with patch.object(neo4j_manager, 'session') as mock_session_cm:
@@ -372,18 +572,17 @@ class TestNeo4jManager:
 
             assert len(result) == 1
             assert result[0].name == "Jane Doe"
+            query = mock_session.run.call_args[0][0]
+            assert query is _FIND_EXPERTS_QUERIES[True]
+            assert "$department" in query
+            assert "USING INDEX" not in query
 
-    @pytest.mark.asyncio
     async def test_find_experts_no_department(self, neo4j_manager):
         """Test finding experts without department filter."""
         mock_session = AsyncMock()
         mock_result = AsyncMock()
 
-        # Mock the async iteration
-        async def mock_async_iter(self):
-            yield {"p": {"name": "Jane Doe", "email": "jane@test.com", "department": "Engineering", "expertise_areas": ["Python"]}}
-
-        mock_result.__aiter__ = mock_async_iter
+        mock_result.data.return_value = [{"p": {"name": "Jane Doe", "email": "jane@test.com", "department": "Engineering", "expertise_areas": ["Python"]}}]
         mock_session.run.return_value = mock_result
 
         with patch.object(neo4j_manager, 'session') as mock_session_cm:
@@ -394,39 +593,94 @@ class TestNeo4jManager:
 
             assert len(result) == 1
             assert result[0].name == "Jane Doe"
+            query = mock_session.run.call_args[0][0]
+            assert query is _FIND_EXPERTS_QUERIES[False]
+            assert "$department" not in query
 
-    @pytest.mark.asyncio
-    async def test_get_reporting_chain(self, neo4j_manager):
-        """Test getting reporting chain."""
+    async def test_find_experts_multi_groups_by_skill(self, neo4j_manager):
+        """Test finding experts for several skills in one query."""
         mock_session = AsyncMock()
         mock_result = AsyncMock()
-        mock_result.single.return_value = {
-            "chain": [
-                {"name": "John Doe", "email": "john@test.com", "department": "Engineering", "role": "Developer"},
-                {"name": "Boss", "email": "boss@test.com", "department": "Management", "role": "Manager"}
-            ]
-        }
+        mock_result.data.return_value = [
+            {"skill": "Python", "people": [{"name": "Jane Doe", "expertise_areas": ["Python"]}]},
+            {"skill": "Rust", "people": []},
+        ]
         mock_session.run.return_value = mock_result
 
+        with patch.object(neo4j_manager, 'session') as mock_session_cm:
+            mock_session_cm.return_value.__aenter__.return_value = mock_session
+            mock_session_cm.return_value.__aexit__.return_value = None
+
+            result = await neo4j_manager.find_experts_multi(["Python", "Rust", "Python"])
+
+            assert list(result) == ["Python", "Rust"]
+            assert [person.name for person in result["Python"]] == ["Jane Doe"]
+            assert result["Rust"] == []
+            mock_session.run.assert_awaited_once()
+            assert mock_session.run.call_args[1] == {"skills": ["Python", "Rust"]}
+
+    async def test_find_experts_multi_empty(self, neo4j_manager):
+        """Test that no skills means no query."""
+        with patch.object(neo4j_manager, 'session') as mock_session_cm:
+            assert await neo4j_manager.find_experts_multi([]) == {}
+            mock_session_cm.assert_not_called()
+
+    async def test_get_reporting_chain(self, neo4j_manager):
+        """Test getting reporting chain."""
+        tx = _ManagerGraphTx({"John Doe": ["Lead"], "Lead": ["Boss"]})
+        mock_session = AsyncMock()
+
+        async def run_in_tx(work, *args):
+            return await work(tx, *args)
+
+        mock_session.execute_read.side_effect = run_in_tx
+
         with patch.object(neo4j_manager, 'session') as mock_session_cm:
             mock_session_cm.return_value.__aenter__.return_value = mock_session
             mock_session_cm.return_value.__aexit__.return_value = None
 
             result = await neo4j_manager.get_reporting_chain("John Doe")
 
-            assert len(result) == 1  # Skip self, so only Boss
-            assert result[0].name == "Boss"
+        assert [person.name for person in result] == ["Lead", "Boss"]
+        assert tx.lookups == ["John Doe", "Lead", "Boss"]
+
+    async def test_reporting_chain_stops_at_cycle(self):
+        """Test that a manager cycle yields the partial chain instead of nothing."""
+        tx = _ManagerGraphTx({"Ann": ["Bob"], "Bob": ["Cat"], "Cat": ["Bob"]})
+
+        chain = await _walk_manager_chain(tx, "Ann", 20)
+
+        assert [node["name"] for node in chain] == ["Bob", "Cat"]
+
+    async def test_reporting_chain_follows_one_branch_of_diamond(self):
+        """Test that a diamond costs one lookup per level, not one per route."""
+        tx = _ManagerGraphTx({
+            "Ann": ["Bob", "Cat"],
+            "Bob": ["Dan"],
+            "Cat": ["Dan"],
+            "Dan": [],
+        })
+
+        chain = await _walk_manager_chain(tx, "Ann", 20)
+
+        assert [node["name"] for node in chain] == ["Bob", "Dan"]
+        assert tx.lookups == ["Ann", "Bob", "Dan"]
+
+    async def test_reporting_chain_depth_capped(self):
+        """Test that very deep hierarchies return the chain up to the cap."""
+        tx = _ManagerGraphTx({f"p{i}": [f"p{i + 1}"] for i in range(50)})
+
+        chain = await _walk_manager_chain(tx, "p0", 20)
+
+        assert len(chain) == 20
+        assert chain[-1]["name"] == "p20"
 
-    @pytest.mark.asyncio
     async def test_get_direct_reports(self, neo4j_manager):
         """Test getting direct reports."""
         mock_session = AsyncMock()
         mock_result = AsyncMock()
 
-        async def mock_async_iter(self):
-            yield {"report": {"name": "Junior", "email": "junior@test.com", "department": "Engineering", "role": "Developer"}}
-
-        mock_result.__aiter__ = mock_async_iter
+        mock_result.data.return_value = [{"report": {"name": "Junior", "email": "junior@test.com", "department": "Engineering", "role": "Developer"}}]
         mock_session.run.return_value = mock_result
 
         with patch.object(neo4j_manager, 'session') as mock_session_cm:
@@ -437,14 +691,13 @@ class TestNeo4jManager:
 
             assert len(result) == 1
             assert result[0].name == "Junior"
+            # List reads are routed with read access
+            mock_session_cm.assert_called_once_with(default_access_mode=READ_ACCESS)
 
-    @pytest.mark.asyncio
     async def test_get_collaboration_path(self, neo4j_manager):
         """Test getting collaboration path."""
         mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.single.return_value = {"path": ["John Doe", "Intermediary", "Jane Smith"]}
-        mock_session.run.return_value = mock_result
+        mock_session.execute_read.return_value = {"path": ["John Doe", "Intermediary", "Jane Smith"]}
 
         with patch.object(neo4j_manager, 'session') as mock_session_cm:
             mock_session_cm.return_value.__aenter__.return_value = mock_session
@@ -455,16 +708,12 @@ class TestNeo4jManager:
             assert len(result) == 3
             assert result == ["John Doe", "Intermediary", "Jane Smith"]
 
-    @pytest.mark.asyncio
     async def test_get_team_members_by_department(self, neo4j_manager):
         """Test getting team members by department."""
         mock_session = AsyncMock()
         mock_result = AsyncMock()
 
-        async def mock_async_iter(self):
-            yield {"p": {"name": "Team Member", "email": "member@test.com", "department": "Engineering", "role": "Developer"}}
-
-        mock_result.__aiter__ = mock_async_iter
+        mock_result.data.return_value = [{"p": {"name": "Team Member", "email": "member@test.com", "department": "Engineering", "role": "Developer"}}]
         mock_session.run.return_value = mock_result
 
         with patch.object(neo4j_manager, 'session') as mock_session_cm:
@@ -476,16 +725,12 @@ class TestNeo4jManager:
             assert len(result) == 1
             assert result[0].name == "Team Member"
 
-    @pytest.mark.asyncio
     async def test_get_team_members_by_manager(self, neo4j_manager):
         """Test getting team members by manager."""
         mock_session = AsyncMock()
         mock_result = AsyncMock()
 
-        async def mock_async_iter(self):
-            yield {"p": {"name": "Team Member", "email": "member@test.com", "department": "Engineering", "role": "Developer"}}
-
-        mock_result.__aiter__ = mock_async_iter
+        mock_result.data.return_value = [{"p": {"name": "Team Member", "email": "member@test.com", "department": "Engineering", "role": "Developer"}}]
         mock_session.run.return_value = mock_result
 
         with patch.object(neo4j_manager, 'session') as mock_session_cm:
@@ -497,14 +742,13 @@ class TestNeo4jManager:
             assert len(result) == 1
             assert result[0].name == "Team Member"
 
-    @pytest.mark.asyncio
     async def test_get_recent_interactions_with_person(self, neo4j_manager):
         """Test getting recent interactions for specific person."""
         mock_session = AsyncMock()
         mock_result = AsyncMock()
 
-        async def mock_async_iter(self):
-            yield {
+        mock_result.data.return_value = [
+            {
                 "i": {
                     "with_person": "Jane Smith",
                     "interaction_type": "meeting",
@@ -512,8 +756,7 @@ class TestNeo4jManager:
                     "date": datetime.now().isoformat()
                 }
             }
-
-        mock_result.__aiter__ = mock_async_iter
+        ]
         mock_session.run.return_value = mock_result
 
         with patch.object(neo4j_manager, 'session') as mock_session_cm:
@@ -526,14 +769,13 @@ class TestNeo4jManager:
             assert result[0].with_person == "Jane Smith"
             assert result[0].interaction_type == "meeting"
 
-    @pytest.mark.asyncio
     async def test_get_recent_interactions_all(self, neo4j_manager):
         """Test getting all recent interactions."""
         mock_session = AsyncMock()
         mock_result = AsyncMock()
 
-        async def mock_async_iter(self):
-            yield {
+        mock_result.data.return_value = [
+            {
                 "i": {
                     "with_person": "Jane Smith",
                     "interaction_type": "meeting",
@@ -541,8 +783,7 @@ class TestNeo4jManager:
                     "date": datetime.now().isoformat()
                 }
             }
-
-        mock_result.__aiter__ = mock_async_iter
+        ]
         mock_session.run.return_value = mock_result
 
         with patch.object(neo4j_manager, 'session') as mock_session_cm:
@@ -554,7 +795,6 @@ class TestNeo4jManager:
             assert len(result) == 1
             assert result[0].with_person == "Jane Smith"
 
-    @pytest.mark.asyncio
     async def test_ensure_person_exists(self, neo4j_manager):
         """Test ensuring person exists."""
         mock_session = AsyncMock()
@@ -566,7 +806,6 @@ class TestNeo4jManager:
 
         mock_session.run.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_initialize_schema(self, neo4j_manager):
         """Test schema initialization."""
         mock_session = AsyncMock()
@@ -579,11 +818,60 @@ class TestNeo4jManager:
 
             await neo4j_manager.initialize_schema()
 
-            # Should run multiple schema creation queries
-            assert mock_session.run.call_count >= 3
+            # All schema statements go through one managed transaction
+            mock_session.execute_write.assert_awaited_once()
+            _, statements = mock_session.execute_write.call_args[0]
+            assert len(statements) == 6
+            mock_session.run.assert_not_called()
+
+    async def test_initialize_schema_falls_back_to_single_statements(self, neo4j_manager):
+        """Test that a failed schema transaction is retried statement by statement."""
+        mock_session = AsyncMock()
+        mock_session.execute_write.side_effect = Exception("Equivalent index exists")
+
+        with patch.object(neo4j_manager, 'session') as mock_session_cm:
+            mock_session_cm.return_value.__aenter__.return_value = mock_session
+            mock_session_cm.return_value.__aexit__.return_value = None
+
+            await neo4j_manager.initialize_schema()
+
+            assert mock_session.run.call_count == 6
+            # One session for the batch, then one per statement
+            assert mock_session_cm.call_count == 7
+
+    async def test_initialize_schema_fallback_continues_past_failures(self, neo4j_manager):
+        """Test that one failing schema statement does not stop the others."""
+        mock_session = AsyncMock()
+        mock_session.execute_write.side_effect = Exception("Equivalent index exists")
+        mock_session.run.side_effect = [Exception("Constraint exists")] + [None] * 5
+
+        with patch.object(neo4j_manager, 'session') as mock_session_cm:
+            mock_session_cm.return_value.__aenter__.return_value = mock_session
+            mock_session_cm.return_value.__aexit__.return_value = None
+
+            await neo4j_manager.initialize_schema()
+
+            assert mock_session.run.call_count == 6
+
+
+async def test_run_unwind_queries_submits_all_before_consuming():
+    """Test that UNWIND statements are pipelined and empty ones skipped."""
+    events = []
+    mock_tx = AsyncMock()
+
+    async def run(query, rows):
+        events.append(("run", query))
+        result = AsyncMock()
+        result.consume.side_effect = lambda: events.append(("consume", query))
+        return result
+
+    mock_tx.run.side_effect = run
+
+    await _run_unwind_queries(mock_tx, [("Q1", [{"a": 1}]), ("Q2", []), ("Q3", [{"b": 2}])])
+
+    assert events == [("run", "Q1"), ("run", "Q3"), ("consume", "Q1"), ("consume", "Q3")]
 
 
-@pytest.mark.asyncio
 async def test_get_neo4j_manager():
     """Test get_neo4j_manager function."""
     with patch('src.database.neo4j_manager.Neo4jManager') as mock_manager_class:
@@ -601,7 +889,6 @@ async def test_get_neo4j_manager():
         assert manager == mock_manager
 
 
-@pytest.mark.asyncio
 async def test_get_neo4j_manager_singleton():
     """Test get_neo4j_manager returns same instance on subsequent calls."""
     with patch('src.database.neo4j_manager.Neo4jManager') as mock_manager_class:
@@ -621,7 +908,27 @@ async def test_get_neo4j_manager_singleton():
         assert manager1 == manager2
 
 
-@pytest.mark.asyncio
+async def test_get_neo4j_manager_concurrent_first_calls():
+    """Test that concurrent first callers share a single manager."""
+    with patch('src.database.neo4j_manager.Neo4jManager') as mock_manager_class:
+        mock_manager = AsyncMock()
+
+        async def slow_connect():
+            # Yield so the second caller arrives while the first is connecting
+            await asyncio.sleep(0)
+
+        mock_manager.connect.side_effect = slow_connect
+        mock_manager_class.return_value = mock_manager
+
+        import src.database.neo4j_manager
+        src.database.neo4j_manager._neo4j_manager = None
+
+        managers = await asyncio.gather(get_neo4j_manager(), get_neo4j_manager())
+
+        mock_manager_class.assert_called_once()
+        assert managers[0] is managers[1] is mock_manager
+
+
 async def test_get_neo4j_session():
     """Test get_neo4j_session function."""
     # This function is hard to test due to complex async context manager mocking
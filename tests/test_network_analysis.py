@@ -1,13 +1,13 @@
 """Tests for network analysis functionality."""
 
+import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import networkx as nx
 import pytest
 
-from src.analysis.network_analysis import NetworkAnalyzer
+from src.analysis.network_analysis import NetworkAnalyzer, _fast_betweenness
 from src.config.settings import Settings
-from src.database.models import Person
 
 
 class TestNetworkAnalyzer:
@@ -29,7 +29,6 @@ class TestNetworkAnalyzer:
         assert network_analyzer.neo4j_manager is not None
         assert hasattr(network_analyzer, 'graph')
 
-    @pytest.mark.asyncio
     async def test_build_graph_from_neo4j(self, network_analyzer):
         """Test building graph from Neo4j data."""
         with patch.object(network_analyzer.neo4j_manager, 'session') as mock_session:
@@ -42,14 +41,45 @@ class TestNetworkAnalyzer:
 
             # Mock the result
             mock_result = AsyncMock()
-            mock_result.data.return_value = []
+            mock_result.single.return_value = {
+                "people": [],
+                "relationships": [],
+                "interaction_counts": []
+            }
             mock_session_instance.run.return_value = mock_result
 
             graph = await network_analyzer.build_graph_from_neo4j()
 
             assert isinstance(graph, nx.Graph)
+            mock_session_instance.run.assert_called_once()
+
+    async def test_build_graph_from_neo4j_single_round_trip(self, network_analyzer):
+        """Test people, relationships and interaction weights come from one query."""
+        with patch.object(network_analyzer.neo4j_manager, 'session') as mock_session:
+            mock_session_context = AsyncMock()
+            mock_session_instance = AsyncMock()
+            mock_session_context.__aenter__.return_value = mock_session_instance
+            mock_session_context.__aexit__.return_value = None
+            mock_session.return_value = mock_session_context
+
+            mock_result = AsyncMock()
+            mock_result.single.return_value = {
+                "people": [
+                    ["john", "Engineer", "Engineering", ["Python"], "jane"],
+                    ["jane", "Manager", "Engineering", None, None]
+                ],
+                "relationships": [["john", "jane", "manager", None, "work"]],
+                "interaction_counts": [["john", 4]]
+            }
+            mock_session_instance.run.return_value = mock_result
+
+            graph = await network_analyzer.build_graph_from_neo4j()
+
+            mock_session_instance.run.assert_called_once()
+            assert graph.nodes["jane"]["expertise_areas"] == []
+            assert graph["john"]["jane"]["strength"] == 1.0
+            assert graph["john"]["jane"]["interaction_weight"] == 2.0
 
-    @pytest.mark.asyncio
     async def test_build_directed_graph_from_neo4j(self, network_analyzer):
         """Test building directed graph from Neo4j data."""
         with patch.object(network_analyzer.neo4j_manager, 'session') as mock_session:
@@ -62,7 +92,7 @@ class TestNetworkAnalyzer:
 
             # Mock the result
             mock_result = AsyncMock()
-            mock_result.data.return_value = []
+            mock_result.fetch.return_value = []
             mock_session_instance.run.return_value = mock_result
 
             graph = await network_analyzer.build_directed_graph_from_neo4j()
@@ -140,7 +170,6 @@ class TestNetworkAnalyzer:
 
         assert isinstance(brokers, list)
 
-    @pytest.mark.asyncio
     async def test_get_org_chart_data(self, network_analyzer):
         """Test getting org chart data."""
         with patch.object(network_analyzer.neo4j_manager, 'session') as mock_session:
@@ -153,7 +182,7 @@ class TestNetworkAnalyzer:
 
             # Mock the result
             mock_result = AsyncMock()
-            mock_result.data.return_value = []
+            mock_result.fetch.return_value = []
             mock_session_instance.run.return_value = mock_result
 
             org_chart = await network_analyzer.get_org_chart_data()
@@ -176,7 +205,6 @@ class TestNetworkAnalyzer:
         centrality = network_analyzer.calculate_centrality_metrics()
         assert isinstance(centrality, dict)
 
-    @pytest.mark.asyncio
     async def test_error_handling_in_build_graph(self, network_analyzer):
         """Test error handling during graph building."""
         with patch.object(network_analyzer.neo4j_manager, 'session', side_effect=Exception("Database error")):
@@ -274,3 +302,290 @@ class TestNetworkAnalyzer:
 
         result = network_analyzer.analyze_department_connectivity()
         assert len(result) >= 0  # May find cross-department connections
+
+    def test_find_all_knowledge_brokers_matches_single_skill(self, network_analyzer):
+        """Test batched broker search agrees with per-skill search."""
+        network_analyzer.graph = nx.Graph()
+        network_analyzer.graph.add_node("alice", expertise_areas=["Python"])
+        network_analyzer.graph.add_node("bob", expertise_areas=["Advanced Python"])
+        network_analyzer.graph.add_node("broker", expertise_areas=["Management"])
+        network_analyzer.graph.add_node("carol", expertise_areas=["Design"])
+        network_analyzer.graph.add_node("dave", expertise_areas=[])
+        network_analyzer.graph.add_edge("alice", "broker")
+        network_analyzer.graph.add_edge("bob", "broker")
+        network_analyzer.graph.add_edge("broker", "carol")
+        network_analyzer.graph.add_edge("carol", "dave")
+
+        all_brokers = network_analyzer.find_all_knowledge_brokers(["Python", "Design"])
+
+        assert all_brokers["Python"] == network_analyzer.find_knowledge_brokers("Python")
+        assert all_brokers["Python"] == ["broker"]
+        assert all_brokers["Design"] == network_analyzer.find_knowledge_brokers("Design")
+
+    def test_compute_betweenness_without_networkit(self, network_analyzer):
+        """Test betweenness falls back to the pure-Python pass without NetworKit."""
+        network_analyzer.graph = nx.Graph()
+        network_analyzer.graph.add_edge("john", "jane")
+        network_analyzer.graph.add_edge("jane", "bob")
+
+        with patch('src.analysis.network_analysis.nk', None):
+            result = network_analyzer._compute_betweenness()
+
+        assert result == pytest.approx(nx.betweenness_centrality(network_analyzer.graph))
+        assert result["jane"] == 1.0
+
+    def test_centralities_shared_between_analyses(self, network_analyzer):
+        """Test influence ranking reuses centralities from metric calculation."""
+        network_analyzer.graph = nx.Graph()
+        network_analyzer.graph.add_edge("center", "person1")
+        network_analyzer.graph.add_edge("center", "person2")
+
+        network_analyzer.calculate_centrality_metrics()
+
+        with patch.object(network_analyzer, '_compute_betweenness') as mock_betweenness:
+            influencers = network_analyzer.find_influential_people(top_n=1)
+
+        mock_betweenness.assert_not_called()
+        assert influencers[0][0] == "center"
+
+    def test_centrality_cache_persists_across_analyzers(self, tmp_path):
+        """Test centralities computed once are reused by a fresh analyzer."""
+        graph = nx.Graph()
+        graph.add_edge("john", "jane")
+        graph.add_edge("jane", "bob")
+
+        first = NetworkAnalyzer(Mock(), cache_dir=tmp_path)
+        first.graph = graph.copy()
+        expected = first.calculate_centrality_metrics()
+
+        second = NetworkAnalyzer(Mock(), cache_dir=tmp_path)
+        second.graph = graph.copy()
+        with patch.object(second, '_compute_betweenness') as mock_betweenness:
+            result = second.calculate_centrality_metrics()
+
+        mock_betweenness.assert_not_called()
+        assert result["jane"].betweenness_centrality == expected["jane"].betweenness_centrality
+        cache_files = list(tmp_path.glob("centrality-*.json"))
+        assert len(cache_files) == 1
+        cached = json.loads(cache_files[0].read_text(encoding="utf-8"))
+        assert cached["centrality"]["betweenness"]["jane"] == pytest.approx(
+            expected["jane"].betweenness_centrality
+        )
+
+    def test_centrality_cache_keeps_only_latest_graph(self, tmp_path):
+        """Test a new graph's cache replaces files left by earlier graphs."""
+        analyzer = NetworkAnalyzer(Mock(), cache_dir=tmp_path)
+        analyzer.graph = nx.path_graph(["john", "jane", "bob"])
+        analyzer.calculate_centrality_metrics()
+
+        analyzer.graph = nx.path_graph(["john", "jane", "bob", "alice"])
+        analyzer._analysis_cache.clear()
+        analyzer.calculate_centrality_metrics()
+
+        assert [path.name for path in tmp_path.iterdir()] == [analyzer._centrality_cache_path().name]
+
+    def test_centrality_cache_ignores_unreadable_file(self, tmp_path):
+        """Test a corrupt cache file is skipped and the measure recomputed."""
+        graph = nx.Graph()
+        graph.add_edge("john", "jane")
+
+        analyzer = NetworkAnalyzer(Mock(), cache_dir=tmp_path)
+        analyzer.graph = graph
+        analyzer._centrality_cache_path().write_bytes(b"\x80\x04not json")
+
+        result = analyzer.calculate_centrality_metrics()
+
+        assert set(result) == {"john", "jane"}
+
+    def test_fast_betweenness_matches_networkx(self):
+        """Test array-based Brandes agrees with NetworkX."""
+        graph = nx.barabasi_albert_graph(40, 2, seed=0)
+        graph.add_node("isolated")
+
+        assert _fast_betweenness(graph) == pytest.approx(nx.betweenness_centrality(graph))
+
+    def test_fast_betweenness_sampling_matches_networkx(self):
+        """Test sampled betweenness agrees with NetworkX for the same seed."""
+        graph = nx.barabasi_albert_graph(40, 2, seed=0)
+
+        assert _fast_betweenness(graph, k=10) == pytest.approx(
+            nx.betweenness_centrality(graph, k=10, seed=0)
+        )
+
+    async def test_build_directed_graph_from_streamed_rows(self, network_analyzer):
+        """Test directed graph is built from streamed result rows."""
+        with patch.object(network_analyzer.neo4j_manager, 'session') as mock_session:
+            mock_session_context = AsyncMock()
+            mock_session_instance = AsyncMock()
+            mock_session_context.__aenter__.return_value = mock_session_instance
+            mock_session_context.__aexit__.return_value = None
+            mock_session.return_value = mock_session_context
+
+            people_result = AsyncMock()
+            # Rows arrive in fetch() chunks; an empty chunk ends the stream
+            people_result.fetch.side_effect = [
+                [{"name": "john", "role": "Engineer", "department": "Engineering",
+                  "expertise_areas": None, "manager": "jane"}],
+                [{"name": "jane", "role": "Manager", "department": "Engineering",
+                  "expertise_areas": ["Leadership"], "manager": None}],
+                [],
+            ]
+            hierarchy_result = AsyncMock()
+            hierarchy_result.fetch.side_effect = [
+                [{"report": "john", "manager": "jane", "strength": None}],
+                [],
+            ]
+            mock_session_instance.run.side_effect = lambda query, **params: (
+                hierarchy_result if "WORKS_WITH" in query else people_result
+            )
+
+            graph = await network_analyzer.build_directed_graph_from_neo4j()
+
+            assert graph.nodes["john"]["expertise_areas"] == []
+            assert graph.nodes["jane"]["expertise_areas"] == ["Leadership"]
+            assert graph["john"]["jane"] == {"relationship_type": "reports_to", "strength": 1.0}
+
+    async def test_get_org_chart_data_builds_nested_hierarchy(self, network_analyzer):
+        """Test org chart nests reports under their managers."""
+        network_analyzer.directed_graph = nx.DiGraph()
+        network_analyzer.directed_graph.add_node("ceo", role="CEO", department="Exec")
+        network_analyzer.directed_graph.add_node("cto", role="CTO", department="Engineering")
+        network_analyzer.directed_graph.add_node("dev", role="Engineer", department="Engineering")
+        network_analyzer.directed_graph.add_edge("cto", "ceo")
+        network_analyzer.directed_graph.add_edge("dev", "cto")
+
+        org_chart = await network_analyzer.get_org_chart_data()
+
+        assert org_chart['top_level_managers'] == ["ceo"]
+        cto = org_chart['hierarchy']["ceo"]['direct_reports'][0]
+        assert cto['name'] == "cto"
+        assert cto['direct_reports'][0]['name'] == "dev"
+        assert cto['direct_reports'][0]['direct_reports'] == []
+
+    def test_analyze_department_connectivity_counts(self, network_analyzer):
+        """Test internal and external edge counts per department."""
+        network_analyzer.graph = nx.Graph()
+        network_analyzer.graph.add_node("a1", department="Engineering")
+        network_analyzer.graph.add_node("a2", department="Engineering")
+        network_analyzer.graph.add_node("a3", department="Engineering")
+        network_analyzer.graph.add_node("b1", department="Marketing")
+        network_analyzer.graph.add_node("b2", department="Marketing")
+        network_analyzer.graph.add_node("c1")
+        network_analyzer.graph.add_edges_from([
+            ("a1", "a2"), ("a2", "a3"), ("a1", "b1"), ("a3", "b1"), ("b1", "b2"), ("b2", "c1")
+        ])
+
+        result = network_analyzer.analyze_department_connectivity()
+
+        assert result["Engineering"]["internal_connections"] == 2
+        assert result["Engineering"]["external_connections"] == 2
+        assert result["Engineering"]["internal_density"] == pytest.approx(2 / 3)
+        assert result["Marketing"]["internal_connections"] == 1
+        assert result["Marketing"]["external_connections"] == 3
+        assert "Unknown" not in result
+
+    def test_numba_betweenness_matches_networkx(self, network_analyzer):
+        """Test the CSR Brandes kernel agrees with NetworkX."""
+        network_analyzer.graph = nx.barabasi_albert_graph(40, 2, seed=0)
+
+        result = network_analyzer._numba_betweenness()
+
+        assert result == pytest.approx(nx.betweenness_centrality(network_analyzer.graph))
+
+    def test_eigenvector_computed_once_per_graph(self, network_analyzer):
+        """Test eigenvector centrality is memoized until the graph is replaced."""
+        network_analyzer.graph = nx.Graph()
+        network_analyzer.graph.add_edge("center", "person1")
+        network_analyzer.graph.add_edge("center", "person2")
+
+        with patch.object(
+            network_analyzer, '_compute_eigenvector',
+            wraps=network_analyzer._compute_eigenvector
+        ) as mock_eigenvector:
+            network_analyzer.calculate_centrality_metrics()
+            network_analyzer.find_influential_people()
+            assert mock_eigenvector.call_count == 1
+
+            network_analyzer.graph = network_analyzer.graph.copy()
+            network_analyzer.find_influential_people()
+            assert mock_eigenvector.call_count == 2
+
+    def test_find_collaboration_paths_shortest_first(self, network_analyzer):
+        """Test at most three paths are returned, shortest first, within four hops."""
+        network_analyzer.graph = nx.complete_graph(["john", "a", "b", "c", "bob"])
+        network_analyzer.graph.add_edge("bob", "far")
+
+        paths = network_analyzer.find_collaboration_paths("john", "bob")
+
+        assert len(paths) == 3
+        assert paths[0] == ["john", "bob"]
+        assert [len(path) for path in paths] == sorted(len(path) for path in paths)
+        assert network_analyzer.find_collaboration_paths("john", "missing") == []
+
+    def test_find_expertise_clusters_uses_skill_index(self, network_analyzer):
+        """Test substring expertise lookups keep graph order and reuse the index."""
+        network_analyzer.graph = nx.Graph()
+        network_analyzer.graph.add_node("john", expertise_areas=["Advanced Python", "Django"])
+        network_analyzer.graph.add_node("jane", expertise_areas=["python"])
+        network_analyzer.graph.add_node("bob", expertise_areas=["Java"])
+
+        assert network_analyzer.find_expertise_clusters("Python") == {"Python": ["john", "jane"]}
+        assert network_analyzer.find_expertise_clusters("Rust") == {}
+        assert network_analyzer._get_expertise_index() is network_analyzer._get_expertise_index()
+
+    def test_requires_graph_guard(self, network_analyzer):
+        """Test analyses reject a missing graph but accept an empty one."""
+        network_analyzer.graph = None
+        with pytest.raises(ValueError, match="Graph not built"):
+            network_analyzer.find_expertise_clusters()
+        with pytest.raises(ValueError, match="Graph not built"):
+            network_analyzer.find_knowledge_brokers("Python")
+
+        network_analyzer.graph = nx.Graph()
+        assert network_analyzer.find_influential_people() == []
+        assert network_analyzer.find_collaboration_paths("john", "jane") == []
+        assert network_analyzer.analyze_department_connectivity() == {}
+
+    async def test_build_graph_persists_weights_in_batches(self, network_analyzer):
+        """Test interaction weights are written back with one UNWIND per batch."""
+        with patch.object(network_analyzer.neo4j_manager, 'session') as mock_session, \
+                patch('src.analysis.network_analysis.GRAPH_BUILD_BATCH_SIZE', 2):
+            mock_session_context = AsyncMock()
+            mock_session_instance = AsyncMock()
+            mock_session_context.__aenter__.return_value = mock_session_instance
+            mock_session_context.__aexit__.return_value = None
+            mock_session.return_value = mock_session_context
+
+            mock_result = AsyncMock()
+            mock_result.single.return_value = {
+                "people": [],
+                "relationships": [
+                    ["a", "b", "peer", 1.0, None],
+                    ["b", "c", "peer", 1.0, None],
+                    ["c", "d", "peer", 1.0, None]
+                ],
+                "interaction_counts": [["b", 2]]
+            }
+            mock_session_instance.run.return_value = mock_result
+
+            await network_analyzer.build_graph_from_neo4j(persist_weights=True)
+
+            write_calls = [
+                call for call in mock_session_instance.run.call_args_list
+                if "UNWIND" in call.args[0]
+            ]
+            assert [len(call.kwargs["rows"]) for call in write_calls] == [2, 1]
+            assert write_calls[0].kwargs["rows"][0] == {"a": "a", "b": "b", "w": 1.0}
+
+    def test_find_knowledge_brokers_skips_betweenness_without_candidates(self, network_analyzer):
+        """Test betweenness is not computed when nobody bridges specialists."""
+        network_analyzer.graph = nx.Graph()
+        network_analyzer.graph.add_node("john", expertise_areas=["Python"])
+        network_analyzer.graph.add_node("jane", expertise_areas=["React"])
+        network_analyzer.graph.add_edge("john", "jane")
+
+        with patch.object(network_analyzer, '_compute_betweenness') as mock_betweenness:
+            assert network_analyzer.find_knowledge_brokers("Python") == []
+            assert network_analyzer.find_all_knowledge_brokers() == {"Python": [], "React": []}
+
+        mock_betweenness.assert_not_called()
@@ -9,7 +9,7 @@ from src.agents.tools import (WorkplaceTools, add_coworker_tool,
                               find_experts_tool, get_network_insights_tool,
                               get_org_chart_tool, log_interaction_tool,
                               who_should_i_ask_tool)
-from src.database.models import Interaction, Person, WorkRelationship
+from src.database.models import Person
 
 
 class TestWorkplaceTools:
@@ -27,13 +27,11 @@ class TestWorkplaceTools:
         assert workplace_tools.network_analyzer is None
         assert workplace_tools.export_manager is None
 
-    @pytest.mark.asyncio
     async def test_get_neo4j_manager(self, workplace_tools):
         """Test getting Neo4j manager."""
         manager = await workplace_tools._get_neo4j_manager()
         assert manager is not None
 
-    @pytest.mark.asyncio
     async def test_get_network_analyzer(self, workplace_tools):
         """Test getting network analyzer."""
         with patch('src.agents.tools.NetworkAnalyzer') as mock_analyzer:
@@ -43,7 +41,6 @@ class TestWorkplaceTools:
             analyzer = await workplace_tools._get_network_analyzer()
             assert analyzer == mock_instance
 
-    @pytest.mark.asyncio
     async def test_get_export_manager(self, workplace_tools):
         """Test getting export manager."""
         with patch('src.agents.tools.ExportManager') as mock_manager:
@@ -65,7 +62,6 @@ class TestToolFunctions:
         mock_tools._get_neo4j_manager.return_value = mock_manager
         return mock_tools
 
-    @pytest.mark.asyncio
     async def test_add_coworker_tool_success(self, workplace_tools):
         """Test successful coworker addition."""
         workplace_tools._get_neo4j_manager.return_value.add_coworker.return_value = "Person John Doe created successfully"
@@ -81,7 +77,6 @@ class TestToolFunctions:
         assert "✅" in result
         assert "John Doe" in result
 
-    @pytest.mark.asyncio
     async def test_add_coworker_tool_failure(self, workplace_tools):
         """Test coworker addition failure."""
         workplace_tools._get_neo4j_manager.return_value.add_coworker.side_effect = Exception("Database error")
@@ -95,7 +90,6 @@ class TestToolFunctions:
         assert "❌" in result
         assert "Database error" in result
 
-    @pytest.mark.asyncio
     async def test_find_experts_tool_success(self, workplace_tools):
         """Test successful expert finding."""
         mock_experts = [
@@ -112,7 +106,6 @@ class TestToolFunctions:
         assert "🎯" in result
         assert "Jane Doe" in result
 
-    @pytest.mark.asyncio
     async def test_find_experts_tool_no_results(self, workplace_tools):
         """Test expert finding with no results."""
         workplace_tools._get_neo4j_manager.return_value.find_experts.return_value = []
@@ -124,7 +117,6 @@ class TestToolFunctions:
 
         assert "No experts found" in result
 
-    @pytest.mark.asyncio
     async def test_who_should_i_ask_tool(self, workplace_tools):
         """Test who should I ask tool."""
         mock_experts = [
@@ -140,7 +132,24 @@ class TestToolFunctions:
         assert len(result) > 0
         # Result format may vary, just check it's not empty
 
-    @pytest.mark.asyncio
+    async def test_who_should_i_ask_tool_falls_back_to_topic_words(self, workplace_tools):
+        """Test that topic words are searched together when the full topic has no experts."""
+        manager = workplace_tools._get_neo4j_manager.return_value
+        manager.find_experts.return_value = []
+        manager.find_experts_multi.return_value = {
+            "Python": [],
+            "debugging": [Person(name="Debug Expert", email="debug@test.com", department="Engineering")],
+        }
+        workplace_tools._get_built_network_analyzer.return_value = Mock(graph=None)
+
+        result = await who_should_i_ask_tool(
+            workplace_tools,
+            question_topic="Python debugging"
+        )
+
+        manager.find_experts_multi.assert_awaited_once_with(["Python", "debugging"], None)
+        assert "Debug Expert" in result
+
     async def test_get_org_chart_tool(self, workplace_tools):
         """Test org chart tool."""
         mock_people = [
@@ -153,7 +162,6 @@ class TestToolFunctions:
 
         assert len(result) > 0
 
-    @pytest.mark.asyncio
     async def test_export_data_tool(self, workplace_tools):
         """Test export data tool."""
         mock_export_manager = AsyncMock()
@@ -168,19 +176,27 @@ class TestToolFunctions:
 
         assert "💾" in result or "export" in result.lower()
 
-    @pytest.mark.asyncio
+    async def test_export_data_tool_json_pretty(self, workplace_tools, tmp_path):
+        """Test export data tool forwards pretty to the JSON exporter."""
+        mock_export_manager = AsyncMock()
+        workplace_tools._get_export_manager.return_value = mock_export_manager
+
+        result = await export_data_tool(workplace_tools, format="json", output_path=str(tmp_path), pretty=True)
+
+        assert "Data Export Successful" in result
+        assert mock_export_manager.export_team_structure_json.call_args.kwargs == {"pretty": True}
+
     async def test_get_network_insights_tool(self, workplace_tools):
         """Test network insights tool."""
         mock_analyzer = AsyncMock()
         mock_analyzer.analyze_person_centrality.return_value = {"centrality": 0.5}
         mock_analyzer.analyze_department_connectivity.return_value = {"dept": {"connections": 10}}
-        workplace_tools._get_network_analyzer.return_value = mock_analyzer
+        workplace_tools._get_built_network_analyzer.return_value = mock_analyzer
 
         result = await get_network_insights_tool(workplace_tools)
 
         assert len(result) > 0
 
-    @pytest.mark.asyncio
     async def test_add_relationship_tool_success(self, workplace_tools):
         """Test successful relationship addition."""
         workplace_tools._get_neo4j_manager.return_value.add_relationship.return_value = True
@@ -197,7 +213,6 @@ class TestToolFunctions:
         assert "✅" in result
         assert "John Doe" in result and "Jane Smith" in result
 
-    @pytest.mark.asyncio
     async def test_add_relationship_tool_invalid_type(self, workplace_tools):
         """Test relationship addition with invalid type."""
         result = await add_relationship_tool(
@@ -210,7 +225,6 @@ class TestToolFunctions:
         assert "❌" in result
         assert "Invalid relationship type" in result
 
-    @pytest.mark.asyncio
     async def test_add_relationship_tool_failure(self, workplace_tools):
         """Test relationship addition failure."""
         workplace_tools._get_neo4j_manager.return_value.add_relationship.side_effect = Exception("Database error")
@@ -225,7 +239,6 @@ class TestToolFunctions:
         assert "❌" in result
         assert "Database error" in result
 
-    @pytest.mark.asyncio
     async def test_log_interaction_tool_success(self, workplace_tools):
         """Test successful interaction logging."""
         workplace_tools._get_neo4j_manager.return_value.add_interaction.return_value = True
@@ -242,7 +255,6 @@ class TestToolFunctions:
         assert "✅" in result
         assert "logged" in result.lower()
 
-    @pytest.mark.asyncio
     async def test_log_interaction_tool_invalid_type(self, workplace_tools):
         """Test interaction logging with invalid type."""
         result = await log_interaction_tool(
@@ -254,7 +266,6 @@ class TestToolFunctions:
         assert "❌" in result
         assert "Invalid interaction type" in result
 
-    @pytest.mark.asyncio
     async def test_log_interaction_tool_failure(self, workplace_tools):
         """Test interaction logging failure."""
         workplace_tools._get_neo4j_manager.return_value.add_interaction.side_effect = Exception("Database error")
@@ -278,7 +289,6 @@ class TestWorkplaceToolsMethods:
         mock_manager = AsyncMock()
         return WorkplaceTools(mock_manager)
 
-    @pytest.mark.asyncio
     async def test_add_coworker_method_success(self, workplace_tools):
         """Test WorkplaceTools.add_coworker method success."""
         workplace_tools.neo4j_manager.add_coworker.return_value = "person_123"
@@ -293,7 +303,6 @@ class TestWorkplaceToolsMethods:
         assert "✅" in result
         assert "John Doe" in result
 
-    @pytest.mark.asyncio
     async def test_add_coworker_method_failure(self, workplace_tools):
         """Test WorkplaceTools.add_coworker method failure."""
         workplace_tools.neo4j_manager.add_coworker.side_effect = Exception("Database error")
@@ -306,7 +315,6 @@ class TestWorkplaceToolsMethods:
         assert "❌" in result
         assert "Database error" in result
 
-    @pytest.mark.asyncio
     async def test_find_experts_method_success(self, workplace_tools):
         """Test WorkplaceTools.find_experts method success."""
         mock_experts = [
@@ -323,7 +331,6 @@ class TestWorkplaceToolsMethods:
         assert "Jane Doe" in result
         assert "Python" in result
 
-    @pytest.mark.asyncio
     async def test_find_experts_method_no_results(self, workplace_tools):
         """Test WorkplaceTools.find_experts method with no results."""
         workplace_tools.neo4j_manager.find_experts.return_value = []
@@ -333,7 +340,6 @@ class TestWorkplaceToolsMethods:
         assert "🎯" in result
         assert "Found 0 expert(s)" in result
 
-    @pytest.mark.asyncio
     async def test_find_experts_method_failure(self, workplace_tools):
         """Test WorkplaceTools.find_experts method failure."""
         workplace_tools.neo4j_manager.find_experts.side_effect = Exception("Database error")
@@ -343,7 +349,6 @@ class TestWorkplaceToolsMethods:
         assert "❌" in result
         assert "Database error" in result
 
-    @pytest.mark.asyncio
     async def test_who_should_i_ask_method_success(self, workplace_tools):
         """Test WorkplaceTools.who_should_i_ask method success."""
         mock_experts = [
@@ -355,7 +360,6 @@ class TestWorkplaceToolsMethods:
 
         assert "🤔" in result or "expert" in result.lower()
 
-    @pytest.mark.asyncio
     async def test_who_should_i_ask_method_failure(self, workplace_tools):
         """Test WorkplaceTools.who_should_i_ask method failure."""
         workplace_tools.neo4j_manager.find_experts.side_effect = Exception("Database error")
@@ -365,7 +369,6 @@ class TestWorkplaceToolsMethods:
         assert "❌" in result
         assert "Database error" in result
 
-    @pytest.mark.asyncio
     async def test_get_org_chart_method_success(self, workplace_tools):
         """Test WorkplaceTools.get_org_chart method success."""
         # Mock network analyzer
@@ -379,7 +382,6 @@ class TestWorkplaceToolsMethods:
         assert "Engineering" in result
         mock_analyzer.get_org_chart_data.assert_called_once_with("Engineering")
 
-    @pytest.mark.asyncio
     async def test_get_org_chart_method_no_data(self, workplace_tools):
         """Test WorkplaceTools.get_org_chart method with no data."""
         # Mock network analyzer
@@ -392,7 +394,6 @@ class TestWorkplaceToolsMethods:
         assert "📊" in result
         assert "No organizational structure found" in result
 
-    @pytest.mark.asyncio
     async def test_get_org_chart_method_failure(self, workplace_tools):
         """Test WorkplaceTools.get_org_chart method failure."""
         with patch.object(workplace_tools, '_get_network_analyzer', side_effect=Exception("Network error")):
@@ -401,7 +402,6 @@ class TestWorkplaceToolsMethods:
             assert "❌" in result
             assert "Network error" in result
 
-    @pytest.mark.asyncio
     async def test_export_data_method_csv_success(self, workplace_tools):
         """Test WorkplaceTools.export_data method CSV success."""
         # Mock export manager
@@ -415,7 +415,20 @@ class TestWorkplaceToolsMethods:
         assert "test_export/contacts.csv" in result
         mock_exporter.export_contacts_csv.assert_called_once_with("./test_export/contacts.csv")
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("pretty", [False, True])
+    async def test_export_data_method_json_passes_pretty(self, workplace_tools, pretty):
+        """Test WorkplaceTools.export_data method forwards the JSON indentation choice."""
+        mock_exporter = AsyncMock()
+        mock_exporter.export_team_structure_json.return_value = True
+        workplace_tools.export_manager = mock_exporter
+
+        result = await workplace_tools.export_data(format="json", output_path="./test_export", pretty=pretty)
+
+        assert "test_export/team_structure.json" in result
+        mock_exporter.export_team_structure_json.assert_called_once_with(
+            "./test_export/team_structure.json", pretty=pretty
+        )
+
     async def test_export_data_method_csv_failure(self, workplace_tools):
         """Test WorkplaceTools.export_data method CSV failure."""
         # Mock export manager
@@ -428,7 +441,6 @@ class TestWorkplaceToolsMethods:
         assert "❌" in result
         assert "Failed to export data" in result
 
-    @pytest.mark.asyncio
     async def test_export_data_method_unsupported_format(self, workplace_tools):
         """Test WorkplaceTools.export_data method with unsupported format."""
         result = await workplace_tools.export_data(format="xml")
@@ -436,7 +448,6 @@ class TestWorkplaceToolsMethods:
         assert "❌" in result
         assert "Unsupported format: xml" in result
 
-    @pytest.mark.asyncio
     async def test_export_data_method_exception(self, workplace_tools):
         """Test WorkplaceTools.export_data method exception."""
         with patch.object(workplace_tools, '_get_export_manager', side_effect=Exception("Export error")):
@@ -445,7 +456,6 @@ class TestWorkplaceToolsMethods:
             assert "❌" in result
             assert "Export error" in result
 
-    @pytest.mark.asyncio
     async def test_get_network_insights_method_person_specific(self, workplace_tools):
         """Test WorkplaceTools.get_network_insights method for specific person."""
         # Mock network analyzer
@@ -462,9 +472,8 @@ class TestWorkplaceToolsMethods:
         assert "john@test.com" in result
         assert "0.500" in result
         mock_analyzer.build_graph_from_neo4j.assert_called_once()
-        mock_analyzer.calculate_centrality_metrics.assert_called_once_with("john@test.com")
+        mock_analyzer.calculate_centrality_metrics.assert_called_once_with("john@test.com", k_samples=None)
 
-    @pytest.mark.asyncio
     async def test_get_network_insights_method_general(self, workplace_tools):
         """Test WorkplaceTools.get_network_insights method for general insights."""
         # Mock network analyzer
@@ -482,7 +491,6 @@ class TestWorkplaceToolsMethods:
         assert "25 connections" in result
         mock_analyzer.build_graph_from_neo4j.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_network_insights_method_person_not_found(self, workplace_tools):
         """Test WorkplaceTools.get_network_insights method when person not found."""
         # Mock network analyzer
@@ -500,7 +508,6 @@ class TestWorkplaceToolsMethods:
         assert "5 people" in result
         assert "10 connections" in result
 
-    @pytest.mark.asyncio
     async def test_get_network_insights_method_failure(self, workplace_tools):
         """Test WorkplaceTools.get_network_insights method failure."""
         with patch.object(workplace_tools, '_get_network_analyzer', side_effect=Exception("Analyzer error")):
@@ -508,3 +515,30 @@ class TestWorkplaceToolsMethods:
 
             assert "❌" in result
             assert "Analyzer error" in result
+
+    @pytest.mark.parametrize(
+        "write",
+        [
+            lambda tools: tools.add_coworker(name="Jane Smith", email="jane@test.com"),
+            lambda tools: add_coworker_tool(tools, name="Jane Smith", manager="John Doe"),
+            lambda tools: add_relationship_tool(tools, "Jane Smith", "John Doe", "colleague"),
+            lambda tools: log_interaction_tool(tools, "John Doe", "meeting", topic="Planning"),
+        ],
+        ids=["add_coworker", "add_coworker_tool", "add_relationship_tool", "log_interaction_tool"],
+    )
+    async def test_graph_reused_until_write(self, workplace_tools, write):
+        """Test the analysis graph is rebuilt only after a write."""
+        mock_analyzer = Mock()
+        mock_analyzer.build_graph_from_neo4j = AsyncMock()
+        mock_analyzer.graph = Mock()
+        mock_analyzer.graph.number_of_nodes.return_value = 3
+        mock_analyzer.graph.number_of_edges.return_value = 2
+        workplace_tools.network_analyzer = mock_analyzer
+
+        await workplace_tools.get_network_insights()
+        await workplace_tools.get_network_insights()
+        assert mock_analyzer.build_graph_from_neo4j.call_count == 1
+
+        await write(workplace_tools)
+        await workplace_tools.get_network_insights()
+        assert mock_analyzer.build_graph_from_neo4j.call_count == 2